@@ -13,35 +13,88 @@
 
 import { Aws, Construct, Duration, CustomResource } from '@aws-cdk/core';
 import { Runtime, Code, CfnFunction } from '@aws-cdk/aws-lambda';
-import { PolicyStatement, Effect, Role, ServicePrincipal } from '@aws-cdk/aws-iam';
+import { Policy, PolicyStatement, Effect, Role, ServicePrincipal } from '@aws-cdk/aws-iam';
 import { buildLambdaFunction } from '@aws-solutions-constructs/core';
 import { CfnNagHelper } from './cfn-nag-helper';
 
+/** A bot of a fleet, settings it leaves out are those of the LexBotProps */
+export interface LexBotSpec {
+    readonly botName: string;
+    readonly botLanguage?: string;
+    readonly additionalBotLanguages?: string;
+    readonly childDirected?: string;
+    readonly botRole?: string;
+}
+
 export interface LexBotProps {
     readonly botName: string;
     readonly botLanguage: string;
+    /** Comma separated languages the bot understands in addition to botLanguage */
+    readonly additionalBotLanguages?: string;
     readonly childDirected: string;
     readonly lexLambdaARN: string;
+    /** 'import' creates the bot from a single Lex import, 'api' (default) creates each of its resources with its own call */
+    readonly provisioningMode?: string;
+    /** Number of released bot versions kept, in addition to those an alias still points at (default 3) */
+    readonly botVersionRetention?: number;
+    /** Bots provisioned at the same time by this resource instead of the single botName bot */
+    readonly botSpecs?: LexBotSpec[];
 }
 
 export class LexCustomResource extends Construct {
   private CustomResource: CustomResource;
+  private botSpecs?: LexBotSpec[];
 
+  /** The single bot, a fleet only returns the ids of its bots through botId(name) and botAliasId(name) */
   public get BotId(): string {
-    return this.CustomResource.getAttString('BotId');
+    return this.singleBotAttribute('BotId');
   }
 
+  /** The live alias, serving the latest released bot version */
   public get BotAliasId(): string {
-    return this.CustomResource.getAttString('BotAliasId');
+    return this.singleBotAttribute('BotAliasId');
+  }
+
+  /** The test alias, serving the DRAFT version */
+  public get TestBotAliasId(): string {
+    return this.singleBotAttribute('TestBotAliasId');
+  }
+
+  /** The bot of the fleet named name */
+  public botId(name: string): string {
+    return this.fleetBotAttribute(name, 'BotId');
+  }
+
+  /** The live alias of the bot of the fleet named name */
+  public botAliasId(name: string): string {
+    return this.fleetBotAttribute(name, 'BotAliasId');
+  }
+
+  private singleBotAttribute(attribute: string): string {
+    if (this.botSpecs) {
+      throw new Error(`${attribute} is not returned for a fleet of bots, use the accessors taking the bot name`);
+    }
+    return this.CustomResource.getAttString(attribute);
+  }
+
+  private fleetBotAttribute(name: string, attribute: string): string {
+    if (!this.botSpecs?.some((spec) => spec.botName === name)) {
+      throw new Error(`Bot ${name} is not a bot of the fleet`);
+    }
+    return this.CustomResource.getAttString(`${name}.${attribute}`);
   }
 
   constructor(scope: Construct, id: string, props: LexBotProps) {
     super(scope, id);
+    this.botSpecs = props.botSpecs?.length ? props.botSpecs : undefined;
 
     const LexV2Role = new Role(this, 'LexV2Role', {
       assumedBy: new ServicePrincipal('lexv2.amazonaws.com'),
     });
 
+    /** Progress of requests that continue in a new invocation is checkpointed below this SSM path */
+    const checkpointParameterPrefix = `/${Aws.STACK_NAME}/lex-bot/checkpoints`;
+
     const helperFunction = buildLambdaFunction(this, {
       lambdaFunctionProps: {
         runtime: Runtime.PYTHON_3_8,
@@ -49,17 +102,24 @@ export class LexCustomResource extends Construct {
         description:
           'This function creates a Lex bot using AWS SDK (boto3).',
         code: Code.fromAsset('../services/lex-bot'),
-        timeout: Duration.seconds(60),
+        timeout: Duration.minutes(15),
         environment: {
           botName: props.botName,
           botLanguage: props.botLanguage,
+          additionalBotLanguages: props.additionalBotLanguages ?? '',
           childDirected: props.childDirected,
           botRole: LexV2Role.roleArn,
           lexLambdaARN: props.lexLambdaARN,
+          checkpointParameterPrefix: checkpointParameterPrefix,
+          provisioningMode: props.provisioningMode ?? 'api',
+          botVersionRetention: String(props.botVersionRetention ?? 3),
         }
       },
     });
 
+    /** A continuation must not be retried, only the invocation it was handed over to may resume the request */
+    helperFunction.configureAsyncInvoke({ retryAttempts: 0 });
+
     /** Grant permission to the lambda function to create Lex Bot */
     helperFunction.addToRolePolicy(
       new PolicyStatement({
@@ -74,10 +134,12 @@ export class LexCustomResource extends Construct {
           'lex:CreateSlot', 'lex:CreateIntent',
           'lex:DeleteBot', 'lex:DeleteBotLocale', 'lex:DeleteIntent', 'lex:DeleteSlot',
           'lex:DeleteBotVersion', 'lex:DeleteBotChannel', 'lex:DeleteSlotType',
-          'lex:DescribeBot', 'lex:DescribeBotLocale',
-          'lex:UpdateIntent', 'lex:UpdateBotAlias',
-          'lex:ListBotAliases',
-          'lex:TagResource',
+          'lex:CreateBotAlias',
+          'lex:DescribeBot', 'lex:DescribeBotLocale', 'lex:DescribeBotAlias', 'lex:DescribeBotVersion',
+          'lex:DescribeIntent', 'lex:DescribeSlot', 'lex:DescribeSlotType',
+          'lex:UpdateBot', 'lex:UpdateIntent', 'lex:UpdateSlot', 'lex:UpdateSlotType', 'lex:UpdateBotAlias',
+          'lex:ListBotAliases', 'lex:ListBotVersions', 'lex:ListBotLocales', 'lex:ListIntents', 'lex:ListSlots', 'lex:ListSlotTypes',
+          'lex:TagResource', 'lex:ListTagsForResource',
           'lex:BuildBotLocale',
           'iam:PassRole'
         ],
@@ -87,17 +149,42 @@ export class LexCustomResource extends Construct {
       new PolicyStatement({
         effect: Effect.ALLOW,
         resources: [
-          /** ListBots requires service level permission for lex hence the
+          /** ListBots and the import actions require service level permission for lex hence the
            * lex:region:accoun:* specified for resource. It is separated from
            * the rest of Lex actions to prevent service level permission for
            * other Lex actions.
            */
           `arn:${Aws.PARTITION}:lex:${Aws.REGION}:${Aws.ACCOUNT_ID}:*`,
         ],
-        actions:['lex:ListBots']
+        actions:['lex:ListBots', 'lex:CreateUploadUrl', 'lex:StartImport', 'lex:DescribeImport']
       })
     );
 
+    /** Grant permission to the lambda function to checkpoint its progress */
+    helperFunction.addToRolePolicy(
+      new PolicyStatement({
+        effect: Effect.ALLOW,
+        resources: [
+          `arn:${Aws.PARTITION}:ssm:${Aws.REGION}:${Aws.ACCOUNT_ID}:parameter${checkpointParameterPrefix}/*`,
+        ],
+        actions: ['ssm:GetParameter', 'ssm:PutParameter', 'ssm:DeleteParameter'],
+      })
+    );
+
+    /** Grant permission to the lambda function to continue a request in a new invocation of itself. The statement is
+     * attached as a separate policy, the default policy of the role cannot reference the function it is created before.
+     */
+    const continuationPolicy = new Policy(this, 'ContinuationPolicy', {
+      statements: [
+        new PolicyStatement({
+          effect: Effect.ALLOW,
+          resources: [helperFunction.functionArn],
+          actions: ['lambda:InvokeFunction'],
+        }),
+      ],
+    });
+    helperFunction.role?.attachInlinePolicy(continuationPolicy); //NOSONAR it is a valid expression
+
     /** Grant permission to the lex bot to invoke feedback lambda function */
     LexV2Role.addToPolicy(
       new PolicyStatement({
@@ -112,11 +199,15 @@ export class LexCustomResource extends Construct {
         resourceType: 'Custom::LexBotCustomResource',
         properties: {
           botLanguage: props.botLanguage,
+          additionalBotLanguages: props.additionalBotLanguages ?? '',
           botName: props.botName,
           childDirected: props.childDirected,
+          botSpecs: props.botSpecs,
         }
     });
 
+    this.CustomResource.node.addDependency(continuationPolicy);
+
     /** Suppression for cfn nag W92 */
     const cfnFunction = helperFunction.node.defaultChild as CfnFunction;
     CfnNagHelper.addSuppressions(cfnFunction, {
@@ -75,6 +75,14 @@ export class ServerlessBotFrameworkStack extends Stack {
       ],
     });
 
+    const additionalBotLanguages = new CfnParameter(this, 'AdditionalBotLanguages', {
+      type: 'String',
+      description:
+        'Optional comma separated list of other languages the bot understands, for example Spanish,French.',
+      default: '',
+      allowedPattern: '^((English|Spanish|French|Italian|German|Japanese)(,(English|Spanish|French|Italian|German|Japanese))*)?$',
+    });
+
     const botGender = new CfnParameter(this, 'BotGender', {
       type: 'String',
       description: 'Choose the bot voice gender.',
@@ -206,6 +214,7 @@ export class ServerlessBotFrameworkStack extends Stack {
     const lexCustomResource = new LexCustomResource(this, 'LexCustomResrouce', {
       botName: botName.valueAsString,
       botLanguage: botLanguage.valueAsString,
+      additionalBotLanguages: additionalBotLanguages.valueAsString,
       childDirected: childDirected.valueAsString,
       lexLambdaARN: lexLambdaDynamoDBTables.lexLambda.functionArn,
     });
@@ -306,6 +315,7 @@ export class ServerlessBotFrameworkStack extends Stack {
             Parameters: [
               botName.logicalId,
               botLanguage.logicalId,
+              additionalBotLanguages.logicalId,
               botGender.logicalId,
             ],
           },
@@ -325,6 +335,7 @@ export class ServerlessBotFrameworkStack extends Stack {
         ParameterLabels: {
           [botName.logicalId]: { default: 'Name' },
           [botLanguage.logicalId]: { default: 'Language' },
+          [additionalBotLanguages.logicalId]: { default: 'Additional languages' },
           [botGender.logicalId]: { default: 'Gender' },
           [weatherAPIProvider.logicalId]: { default: 'Weather API provider' },
           [weatherAPIKey.logicalId]: {
@@ -11,7 +11,7 @@
  *  and limitations under the License.                                                                                *
  *********************************************************************************************************************/
 
-import { Aws, Construct, CustomResource, Duration } from '@aws-cdk/core';
+import { Aws, Construct, CustomResource, Duration, SymlinkFollowMode } from '@aws-cdk/core';
 import { PolicyStatement, Effect, Policy } from '@aws-cdk/aws-iam';
 import { Code, Runtime, CfnFunction } from '@aws-cdk/aws-lambda';
 import { buildLambdaFunction } from '@aws-solutions-constructs/core';
@@ -69,11 +69,24 @@ export class WebClientCustomResource extends Construct {
         runtime: Runtime.PYTHON_3_8,
         handler: 'lambda_function.handler',
         timeout: Duration.minutes(3),
-        code: Code.fromAsset('../services/webclient-setup'),
+        // resumable.py links to the module of the lex-bot function
+        code: Code.fromAsset('../services/webclient-setup', { followSymlinks: SymlinkFollowMode.ALWAYS }),
         memorySize: 128,
       },
     });
 
+    /** A continuation must not be retried, only the invocation it was handed over to may resume the upload */
+    customResourceLambda.configureAsyncInvoke({ retryAttempts: 0 });
+
+    /** Grant permission to the lambda function to continue an upload in a new invocation */
+    botCustomResourcePolicy.addStatements(
+      new PolicyStatement({
+        effect: Effect.ALLOW,
+        actions: ['lambda:InvokeFunction'],
+        resources: [customResourceLambda.functionArn],
+      })
+    );
+
     /** Attache CustomResource Policy to Lambda's role */
     customResourceLambda.role?.attachInlinePolicy(botCustomResourcePolicy); //NOSONAR it is a valid expression
 
@@ -0,0 +1,80 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the 'License'). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Write the latest order item of every customer of the orders table from the orders placed before place_order kept it.
+The table is scanned once. A latest order item is only written if the customer has none yet or has one of an older
+order, so the tool can run while orders are being placed, and again.
+
+Usage: python backfill_latest_orders.py [orders table, defaults to PIZZA_ORDERS_TABLE]
+"""
+import os
+import sys
+import logging
+
+os.environ.setdefault("AWS_SDK_USER_AGENT", '{ "user_agent_extra": "AwsSolution/SO0027/backfill" }')
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+def latest_orders(dynamodb, table_name):
+    """
+    :return: Dict of customerId to their order with the latest orderTimestamp
+    """
+    from pizza_order.pizza_helpers import LAST_ORDER_ATTRIBUTES
+    latest = {}
+    pages = dynamodb.get_paginator("scan").paginate(
+        TableName=table_name,
+        # latest order items have no customerId
+        FilterExpression="attribute_exists(customerId)",
+        ProjectionExpression=", ".join(("orderId", "orderTimestamp", "customerId") + LAST_ORDER_ATTRIBUTES),
+    )
+    for page in pages:
+        for order in page["Items"]:
+            customer_id = order["customerId"]["S"]
+            timestamp = float(order["orderTimestamp"]["N"])
+            if customer_id not in latest or timestamp > float(latest[customer_id]["orderTimestamp"]["N"]):
+                latest[customer_id] = order
+    return latest
+
+
+def backfill(table_name):
+    """
+    :return: Tuple of (number of latest order items written, number of customers whose item was already up to date)
+    """
+    from pizza_order.pizza_helpers import latest_order_item, LATEST_ORDER_CONDITION
+    from shared.client import get_client
+    dynamodb = get_client("dynamodb")
+    written, skipped = 0, 0
+    for order in latest_orders(dynamodb, table_name).values():
+        try:
+            dynamodb.put_item(
+                TableName=table_name,
+                Item=latest_order_item(order),
+                ConditionExpression=LATEST_ORDER_CONDITION,
+                ExpressionAttributeValues={":timestamp": order["orderTimestamp"]},
+            )
+            written += 1
+        except dynamodb.exceptions.ConditionalCheckFailedException:
+            skipped += 1
+    return written, skipped
+
+
+def main(argv):
+    table_name = argv[0] if argv else os.environ["PIZZA_ORDERS_TABLE"]
+    written, skipped = backfill(table_name)
+    print(f"{table_name}: {written} latest orders written, {skipped} already up to date")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the 'License'). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Compare the time of rendering the pizza menu message on every turn with the time of getting its memoized copy,
+for menus of growing size. Rendering grows with the number of menu items, the memoized message does not.
+
+Usage: python benchmark_responses.py [turns per measurement]
+"""
+import os
+import sys
+import timeit
+from unittest.mock import patch
+
+os.environ.setdefault("AWS_SDK_USER_AGENT", '{ "user_agent_extra": "AwsSolution/SO0027/benchmark" }')
+
+DEFAULT_TURNS = 10000
+MENU_SIZES = (3, 30, 300)
+LOCALE_ID = "en_US"
+
+
+def synthetic_menu(size):
+    from pizza_order.pizza_menu import get_menu, index_menu
+    items = get_menu()[LOCALE_ID]["items"]
+    return index_menu({
+        LOCALE_ID: {"menuItems": [dict(items[i % len(items)], T=f"{items[i % len(items)]['T']} {i}") for i in range(size)]}
+    })
+
+
+def run_benchmark(size, turns=DEFAULT_TURNS):
+    """
+    :return: Tuple of (microseconds per rendered message, microseconds per memoized message)
+    """
+    from pizza_order import pizza_responses
+    menu = synthetic_menu(size)
+    items = menu[LOCALE_ID]["items"]
+    with patch("pizza_order.pizza_responses.get_menu", new=lambda: menu):
+        rendered = timeit.timeit(lambda: pizza_responses.render_menu_message(LOCALE_ID, items, True), number=turns)
+        pizza_responses.get_menu_message(LOCALE_ID)
+        memoized = timeit.timeit(lambda: pizza_responses.get_menu_message(LOCALE_ID), number=turns)
+    return rendered / turns * 1e6, memoized / turns * 1e6
+
+
+def main(argv):
+    turns = int(argv[0]) if argv else DEFAULT_TURNS
+    print(f"Menu message of {LOCALE_ID}, {turns} turns per measurement")
+    for size in MENU_SIZES:
+        rendered, memoized = run_benchmark(size, turns)
+        print(f"{size:4d} items: rendered {rendered:8.2f} us, memoized {memoized:6.2f} us per turn")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
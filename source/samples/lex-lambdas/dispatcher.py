@@ -10,14 +10,62 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
+import json
 import logging
-from leave_feedback.leave_feedback_handler import save_feedback
-from pizza_order.pizza_order_handler import handle_pizza_order
-from weather_forecast.weather_forecast_handler import handle_weather
+from importlib import import_module
+from time import perf_counter
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# intent name to the module and function handling it. Modules are only imported on the first turn of their
+# intent, so that a turn does not pay for the clients and parameters the handlers of other intents set up.
+INTENT_HANDLERS = {}
+_handlers = {}
+
+
+def register_intent(intent_name, module_name, function_name):
+    """
+    Route the turns of an intent to a handler function, called with the Lex event
+    """
+    INTENT_HANDLERS[intent_name] = (module_name, function_name)
+    _handlers.pop(intent_name, None)
+
+
+register_intent("LeaveFeedback", "leave_feedback.leave_feedback_handler", "save_feedback")
+register_intent("PizzaOrder", "pizza_order.pizza_order_handler", "handle_pizza_order")
+register_intent("WeatherForecast", "weather_forecast.weather_forecast_handler", "handle_weather")
+
+
+def get_handler(intent_name):
+    """
+    :return: The handler function of the intent, importing its module on first use and logging how long it took
+    :raises Exception: if no handler is registered for the intent
+    """
+    handler = _handlers.get(intent_name)
+    if handler is None:
+        if intent_name not in INTENT_HANDLERS:
+            raise Exception(f"Intent with name {intent_name} not supported")
+        module_name, function_name = INTENT_HANDLERS[intent_name]
+        start = perf_counter()
+        handler = getattr(import_module(module_name), function_name)
+        logger.info(json.dumps({
+            "intentColdStart": {
+                "intent": intent_name,
+                "module": module_name,
+                "importMs": round((perf_counter() - start) * 1000, 1),
+            }
+        }))
+        _handlers[intent_name] = handler
+    return handler
+
+
+def reset_handlers():
+    """
+    Forget the loaded handler functions, they are resolved again on the next turn of their intent
+    """
+    _handlers.clear()
+
 
 def lambda_handler(event, context):
     '''
@@ -29,11 +77,4 @@ def lambda_handler(event, context):
     '''
     intent_name = event["sessionState"]["intent"]["name"]
     logger.info(f"Lex event with Intent Name: {intent_name}")
-    if intent_name == "LeaveFeedback":
-        return save_feedback(event)
-    elif intent_name == "PizzaOrder":
-        return handle_pizza_order(event)
-    elif intent_name == "WeatherForecast":
-        return handle_weather(event)
-
-    raise Exception(f"Intent with name {intent_name} not supported")
+    return get_handler(intent_name)(event)
@@ -20,11 +20,21 @@ import logging
 import datetime
 from shared.client import get_client
 from pizza_order.pizza_responses import get_fulfilled_message
+from pizza_order.pizza_menu import get_price
 
 dynamodb = get_client("dynamodb")
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# attributes of the last order used to offer repeating it, see update_slot_values
+LAST_ORDER_ATTRIBUTES = ("pizzaType", "pizzaSize", "pizzaCrust", "pizzaCount")
+# session attribute keeping the last order, as JSON, for the rest of the conversation
+LAST_ORDER_SESSION_ATTRIBUTE = "lastOrder"
+# orderId prefix of the item holding the latest order of a customer, next to the orders in the orders table
+LATEST_ORDER_PREFIX = "latestOrder#"
+# the latest order item is only replaced by a more recent order
+LATEST_ORDER_CONDITION = "attribute_not_exists(orderId) OR latestOrderTimestamp < :timestamp"
+
 
 def empty_slots(intent_request):
     '''
@@ -133,17 +143,11 @@ def calculate_bill(locale_id, slots):
     pizza_type = slots["type"]["value"]["resolvedValues"][0]
     pizza_size = slots["size"]["value"]["resolvedValues"][0]
     pizza_count = slots["count"]["value"]["resolvedValues"][0]
-    menu_file = open("pizza_order/pizza_menu.json")
-    menu_data = json.load(menu_file)
-    menu_file.close()
     try:
-        for item in menu_data[locale_id]["menuItems"]:
-            if item["T"] == pizza_type:
-                total_price = item["P"][pizza_size] * float(pizza_count) * tax_rate
-                return str(round(total_price, 2))
-        # If we can not find item["T"] or item["P"] from menu, menu file is misconfigured
-        raise Exception("Could not find menu properties from pizza menu file.")
+        total_price = get_price(locale_id, pizza_type, pizza_size) * float(pizza_count) * tax_rate
+        return str(round(total_price, 2))
     except Exception as e:
+        # If we can not find the type or size in the menu, menu file is misconfigured
         logger.error(e)
         raise Exception("Error calculating order's total bill.")
 
@@ -199,39 +203,68 @@ def respond(
     }
     if active_context == None:
         del response["sessionState"]["activeContexts"]
+    # Lex only keeps the session attributes that are returned
+    if "sessionAttributes" in intent_request["sessionState"]:
+        response["sessionState"]["sessionAttributes"] = intent_request["sessionState"]["sessionAttributes"]
     return response
 
 
 # Dynamo DB functions
+def latest_order_key(user_email):
+    '''
+    :param user_email: The email of the user, which is the customerId of their orders
+    :returns: Key of the item holding the latest order of the user.
+    '''
+    return {"orderId": {"S": f"{LATEST_ORDER_PREFIX}{user_email}"}}
+
+
+def latest_order_item(order):
+    '''
+    Constructs the item holding the latest order of a customer from that order.
+    It has no customerId, so that it stays out of the customerId index.
+
+    :param order: Order item as written to DynamoDB
+    :returns: Item with the key of the customer's latest order, the id and timestamp of the order and the attributes in LAST_ORDER_ATTRIBUTES.
+    '''
+    item = latest_order_key(order["customerId"]["S"])
+    item["latestOrderId"] = order["orderId"]
+    item["latestOrderTimestamp"] = order["orderTimestamp"]
+    item.update({name: order[name] for name in LAST_ORDER_ATTRIBUTES})
+    return item
+
+
 def check_last_order(intent_request):
     '''
     Checks if user has previously placed a pizza order.
+    The latest order is read with a single get of the item place_order keeps for the user, and it is kept in the session attributes so that later turns of the conversation do not read it again.
 
     :param intent_request: Event object that was sent by Amazon Lex
     :returns: (True, ordered item object) if user has previously placed a pizza order, (False, None) if not.
     '''
+    session_attributes = intent_request.setdefault('sessionState', {}).setdefault('sessionAttributes', {})
+    if LAST_ORDER_SESSION_ATTRIBUTE in session_attributes:
+        last_order = json.loads(session_attributes[LAST_ORDER_SESSION_ATTRIBUTE])
+        return last_order is not None, last_order
+
     user_email = intent_request['requestAttributes']['email']
     table_name = os.environ.get('PIZZA_ORDERS_TABLE')
-    index_name = os.environ.get('PIZZA_ORDERS_INDEX')
-    response = dynamodb.query(
+    response = dynamodb.get_item(
         TableName=table_name,
-        IndexName=index_name,
-        KeyConditionExpression='customerId = :email',
-        ExpressionAttributeValues={':email':{'S':user_email}},
-        ScanIndexForward = False
+        Key=latest_order_key(user_email),
+        ProjectionExpression=", ".join(LAST_ORDER_ATTRIBUTES),
+        ConsistentRead=True,
     )
-    items = response["Items"]
-    if len(items) > 0:
-        del response["Items"][0]["customerId"]
-        logger.info(response)
-        return True, items[0]
-    logger.info(response)
-    return False, None
+    last_order = response.get("Item")
+    logger.info(f"Last order found: {last_order is not None}")
+    session_attributes[LAST_ORDER_SESSION_ATTRIBUTE] = json.dumps(last_order)
+    return last_order is not None, last_order
 
 
 def place_order(intent_request, order_id, logger):
     '''
     Writes the user's pizza order details in the database.
+    The item holding the latest order of the user is written along with the order,
+    unless it already holds a more recent order of the user.
 
     :param intent_request: Event object that was sent by Amazon Lex
     :param order_id: Generated order id to use as partition key for writing in database
@@ -243,20 +276,42 @@ def place_order(intent_request, order_id, logger):
     slots = intent_request['sessionState']['intent']['slots']
     locale_id = intent_request['bot']['localeId']
     total_bill = calculate_bill(locale_id, slots)
-    response = dynamodb.put_item(
-        TableName=table_name,
-        Item={
-            "orderId": {"S": order_id},
-            "orderTimestamp": {"N": str(time.time())},
-            "customerId": {"S": user_email},
-            "pizzaType": {"S": slots["type"]["value"]["resolvedValues"][0]},
-            "pizzaSize": {"S": slots["size"]["value"]["resolvedValues"][0]},
-            "pizzaCrust": {"S": slots["crust"]["value"]["resolvedValues"][0]},
-            "pizzaCount": {"N": slots["count"]["value"]["resolvedValues"][0]},
-            "botLanguage": {"S": intent_request["bot"]["localeId"]},
-            "orderTotalBill": {"N": total_bill},
-        },
-    )
+    order = {
+        "orderId": {"S": order_id},
+        "orderTimestamp": {"N": str(time.time())},
+        "customerId": {"S": user_email},
+        "pizzaType": {"S": slots["type"]["value"]["resolvedValues"][0]},
+        "pizzaSize": {"S": slots["size"]["value"]["resolvedValues"][0]},
+        "pizzaCrust": {"S": slots["crust"]["value"]["resolvedValues"][0]},
+        "pizzaCount": {"N": slots["count"]["value"]["resolvedValues"][0]},
+        "botLanguage": {"S": intent_request["bot"]["localeId"]},
+        "orderTotalBill": {"N": total_bill},
+    }
+    order_put = {"TableName": table_name, "Item": order, "ConditionExpression": "attribute_not_exists(orderId)"}
+    # the order and the latest order of the user are written together, or not at all
+    try:
+        response = dynamodb.transact_write_items(
+            TransactItems=[
+                {"Put": order_put},
+                {
+                    "Put": {
+                        "TableName": table_name,
+                        "Item": latest_order_item(order),
+                        "ConditionExpression": LATEST_ORDER_CONDITION,
+                        "ExpressionAttributeValues": {":timestamp": order["orderTimestamp"]},
+                    }
+                },
+            ]
+        )
+    except dynamodb.exceptions.TransactionCanceledException as error:
+        reasons = [reason.get("Code") for reason in error.response.get("CancellationReasons", [])]
+        if reasons != ["None", "ConditionalCheckFailed"]:
+            raise
+        # a more recent order of the user, placed in another session, stays the latest one
+        response = dynamodb.put_item(**order_put)
+    # this order is now the last one of the user for the rest of the session
+    session_attributes = intent_request['sessionState'].setdefault('sessionAttributes', {})
+    session_attributes[LAST_ORDER_SESSION_ATTRIBUTE] = json.dumps({name: order[name] for name in LAST_ORDER_ATTRIBUTES})
     # Logging response only when childDirected is selected as No
     if os.environ.get("childDirected") == "No":
         logger.info(response)
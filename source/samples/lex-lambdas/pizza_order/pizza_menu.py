@@ -0,0 +1,106 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the 'License'). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+
+# @author Solution Builders
+import os
+import json
+import logging
+import threading
+from time import monotonic
+
+logger = logging.getLogger()
+
+MENU_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pizza_menu.json")
+# the modification time of the menu file is checked at most this often, a changed menu is then parsed again
+MENU_CHECK_SECONDS = 60
+
+_lock = threading.Lock()
+_menu = None
+_menu_mtime = None
+_checked_at = None
+
+
+def index_menu(menu_data):
+    '''
+    Indexes the pizza menu for lookups by locale and pizza type.
+
+    :param menu_data: Parsed pizza_menu.json, with the menu items of each locale
+    :returns: Dict of locale id to its "items" in menu order, the "prices" of each type by size and the "descriptions" of each type.
+    '''
+    menu = {}
+    for locale_id, locale_menu in menu_data.items():
+        items = locale_menu["menuItems"]
+        menu[locale_id] = {
+            "items": items,
+            "prices": {item["T"]: item["P"] for item in items},
+            "descriptions": {item["T"]: item["D"] for item in items},
+        }
+    return menu
+
+
+def get_menu(path=MENU_PATH):
+    '''
+    Returns the indexed pizza menu, parsing the menu file on first use and again once it has changed.
+
+    :param path: (optional) Path of the menu file
+    :returns: The indexed menu, see index_menu. It is shared by all callers and must not be modified.
+    '''
+    global _menu, _menu_mtime, _checked_at
+    now = monotonic()
+    if _menu is not None and now - _checked_at < MENU_CHECK_SECONDS:
+        return _menu
+    with _lock:
+        if _menu is None or now - _checked_at >= MENU_CHECK_SECONDS:
+            mtime = os.stat(path).st_mtime_ns
+            if mtime != _menu_mtime:
+                with open(path, encoding="utf-8") as menu_file:
+                    _menu = index_menu(json.load(menu_file))
+                _menu_mtime = mtime
+                logger.info(f"Loaded pizza menu {path}")
+            _checked_at = now
+    return _menu
+
+
+def reset_menu():
+    '''
+    Forgets the parsed menu, the menu file is parsed again on next use.
+    '''
+    global _menu, _menu_mtime, _checked_at
+    with _lock:
+        _menu, _menu_mtime, _checked_at = None, None, None
+
+
+def get_menu_items(locale_id):
+    '''
+    :param locale_id: language locale id received from Amazon Lex with format example: en_US
+    :returns: The menu items of the locale in menu order, each with its type "T", description "D" and prices by size "P".
+    '''
+    return get_menu()[locale_id]["items"]
+
+
+def get_price(locale_id, pizza_type, pizza_size):
+    '''
+    :param locale_id: language locale id received from Amazon Lex with format example: en_US
+    :returns: The price of one pizza of the type and size.
+    :raises KeyError: if the locale, type or size is not on the menu
+    '''
+    return get_menu()[locale_id]["prices"][pizza_type][pizza_size]
+
+
+def get_description(locale_id, pizza_type):
+    '''
+    :param locale_id: language locale id received from Amazon Lex with format example: en_US
+    :returns: The description of the pizza type, listing its toppings.
+    :raises KeyError: if the locale or type is not on the menu
+    '''
+    return get_menu()[locale_id]["descriptions"][pizza_type]
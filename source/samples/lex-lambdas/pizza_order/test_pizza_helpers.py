@@ -11,6 +11,7 @@
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
 import os
+import json
 import logging
 import time
 import random
@@ -189,36 +190,53 @@ class PizzahelpersTests(TestCase):
         stubber = Stubber(dynamo_client)
         dynamo_expected_params = {
             "TableName": "test_table",
-            "IndexName": "test_index",
-            "KeyConditionExpression": "customerId = :email",
-            "ExpressionAttributeValues": {":email": {"S": "test@example.com"}},
-            "ScanIndexForward": False,
+            "Key": {"orderId": {"S": "latestOrder#test@example.com"}},
+            "ProjectionExpression": "pizzaType, pizzaSize, pizzaCrust, pizzaCount",
+            "ConsistentRead": True,
+        }
+        last_order = {
+            "pizzaType": {"S": "Greek"},
+            "pizzaSize": {"S": "small"},
+            "pizzaCrust": {"S": "thin"},
+            "pizzaCount": {"N": "2"},
         }
 
         # last order exists
-        dynamo_response = {
-            "Items": [
-                {
-                    "customerId": {"S": "testValue"},
-                    "testKey": {"S": "testValue"}
-                }
-            ]
-        }
-        stubber.add_response("query", dynamo_response, dynamo_expected_params)
+        dynamo_response = {"Item": last_order}
+        stubber.add_response("get_item", dynamo_response, dynamo_expected_params)
         with stubber:
             has_order, response = check_last_order(intent_request)
             self.assertTrue(has_order)
-            self.assertEqual(response, {"testKey": {"S": "testValue"}})
+            self.assertEqual(response, last_order)
             stubber.assert_no_pending_responses()
 
+        # the following turns of the conversation get it from the session attributes
+        with stubber:
+            has_order, response = check_last_order(intent_request)
+            self.assertTrue(has_order)
+            self.assertEqual(response, last_order)
+
         # last order doesn't exist
-        dynamo_response = {"Items": []}
-        stubber.add_response("query", dynamo_response, dynamo_expected_params)
+        intent_request = {"requestAttributes": {"email": "test@example.com"}}
+        dynamo_response = {}
+        stubber.add_response("get_item", dynamo_response, dynamo_expected_params)
         with stubber:
             has_order, response = check_last_order(intent_request)
             self.assertFalse(has_order)
             self.assertEqual(response, None)
             stubber.assert_no_pending_responses()
+        self.assertEqual(intent_request["sessionState"]["sessionAttributes"], {"lastOrder": "null"})
+        with stubber:
+            self.assertEqual(check_last_order(intent_request), (False, None))
+
+    def test_respond_keeps_session_attributes(self):
+        from pizza_order.pizza_helpers import respond
+        intent_request = {
+            "sessionState": {"intent": {"state": {}}, "sessionAttributes": {"lastOrder": "null"}},
+            "sessionId": "test id",
+        }
+        response = respond(intent_request, "test message", "InProgress", "Delegate")
+        self.assertEqual(response["sessionState"]["sessionAttributes"], {"lastOrder": "null"})
 
     @patch.dict("os.environ", mock_env_variables)
     @patch("pizza_order.pizza_helpers.time.time", return_value=1234)
@@ -254,34 +272,46 @@ class PizzahelpersTests(TestCase):
         stubber = Stubber(dynamo_client)
         mock_logger = Mock()
 
-        dynamo_expected_params = {
-            "TableName": "test_table",
-            "Item": {
-                "orderId": {"S": "1234"},
-                "orderTimestamp": {"N": "1234"},
-                "customerId": {"S": "test@example.com"},
-                "pizzaType": {"S": "testType"},
-                "pizzaSize": {"S": "testSize"},
-                "pizzaCrust": {"S": "testCrust"},
-                "pizzaCount": {"N": "1234"},
-                "botLanguage": {"S": "en_US"},
-                "orderTotalBill": {"N": "1234"},
-            },
+        order = {
+            "orderId": {"S": "1234"},
+            "orderTimestamp": {"N": "1234"},
+            "customerId": {"S": "test@example.com"},
+            "pizzaType": {"S": "testType"},
+            "pizzaSize": {"S": "testSize"},
+            "pizzaCrust": {"S": "testCrust"},
+            "pizzaCount": {"N": "1234"},
+            "botLanguage": {"S": "en_US"},
+            "orderTotalBill": {"N": "1234"},
         }
-        dynamo_response = {
-            "Attributes": {
-                "orderId": {"S": "1234"},
-                "orderTimestamp": {"N": "1234"},
-                "customerId": {"S": "test@example.com"},
-                "pizzaType": {"S": "testType"},
-                "pizzaSize": {"S": "testSize"},
-                "pizzaCrust": {"S": "testCrust"},
-                "pizzaCount": {"N": "1234"},
-                "botLanguage": {"S": "en_US"},
-                "orderTotalBill": {"N": "1234.56"},
-            },
+        dynamo_expected_params = {
+            "TransactItems": [
+                {
+                    "Put": {
+                        "TableName": "test_table",
+                        "Item": order,
+                        "ConditionExpression": "attribute_not_exists(orderId)",
+                    }
+                },
+                {
+                    "Put": {
+                        "TableName": "test_table",
+                        "Item": {
+                            "orderId": {"S": "latestOrder#test@example.com"},
+                            "latestOrderId": {"S": "1234"},
+                            "latestOrderTimestamp": {"N": "1234"},
+                            "pizzaType": {"S": "testType"},
+                            "pizzaSize": {"S": "testSize"},
+                            "pizzaCrust": {"S": "testCrust"},
+                            "pizzaCount": {"N": "1234"},
+                        },
+                        "ConditionExpression": "attribute_not_exists(orderId) OR latestOrderTimestamp < :timestamp",
+                        "ExpressionAttributeValues": {":timestamp": {"N": "1234"}},
+                    }
+                },
+            ]
         }
-        stubber.add_response("put_item", dynamo_response, dynamo_expected_params)
+        dynamo_response = {}
+        stubber.add_response("transact_write_items", dynamo_response, dynamo_expected_params)
         with stubber:
             place_order(intent_request, "1234", mock_logger)
             mock_respond.assert_called_with(
@@ -292,3 +322,74 @@ class PizzahelpersTests(TestCase):
             )
             mock_logger.info.assert_called_with('Placed order with order ID: 1234')
             stubber.assert_no_pending_responses()
+        self.assertEqual(
+            json.loads(intent_request["sessionState"]["sessionAttributes"]["lastOrder"]),
+            {
+                "pizzaType": {"S": "testType"},
+                "pizzaSize": {"S": "testSize"},
+                "pizzaCrust": {"S": "testCrust"},
+                "pizzaCount": {"N": "1234"},
+            },
+        )
+
+    @patch.dict("os.environ", mock_env_variables)
+    @patch("pizza_order.pizza_helpers.time.time", return_value=1234)
+    @patch(
+        "pizza_order.pizza_helpers.get_fulfilled_message", return_value="test message"
+    )
+    @patch("pizza_order.pizza_helpers.respond")
+    @patch("pizza_order.pizza_helpers.calculate_bill", return_value="1234")
+    def test_place_order_after_a_more_recent_order(
+        self,
+        mock_calculate_bill,
+        mock_respond,
+        mock_get_fulfilled_message,
+        mock_time,
+    ):
+        from botocore.exceptions import ClientError
+        from pizza_order.pizza_helpers import place_order
+        from shared.client import get_client
+        intent_request = {
+            "requestAttributes": {"email": "test@example.com"},
+            "sessionState": {
+                "intent": {
+                    "slots": {
+                        "type": {"value": {"resolvedValues": ["testType"]}},
+                        "size": {"value": {"resolvedValues": ["testSize"]}},
+                        "crust": {"value": {"resolvedValues": ["testCrust"]}},
+                        "count": {"value": {"resolvedValues": ["1234"]}},
+                    }
+                }
+            },
+            "bot": {"localeId": "en_US"},
+        }
+        stubber = Stubber(get_client("dynamodb"))
+        pointer_failed = {"CancellationReasons": [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}]}
+        stubber.add_client_error("transact_write_items", "TransactionCanceledException", modeled_fields=pointer_failed)
+        stubber.add_response(
+            "put_item",
+            {},
+            {
+                "TableName": "test_table",
+                "Item": {
+                    "orderId": {"S": "1234"},
+                    "customerId": {"S": "test@example.com"},
+                    "pizzaType": {"S": "testType"},
+                    "pizzaSize": {"S": "testSize"},
+                    "pizzaCrust": {"S": "testCrust"},
+                    "pizzaCount": {"N": "1234"},
+                    "botLanguage": {"S": "en_US"},
+                    "orderTotalBill": {"N": "1234"},
+                    "orderTimestamp": {"N": "1234"},
+                },
+                "ConditionExpression": "attribute_not_exists(orderId)",
+            },
+        )
+        order_failed = {"CancellationReasons": [{"Code": "ConditionalCheckFailed"}, {"Code": "None"}]}
+        stubber.add_client_error("transact_write_items", "TransactionCanceledException", modeled_fields=order_failed)
+        with stubber:
+            place_order(intent_request, "1234", Mock())
+            mock_respond.assert_called_once()
+            with self.assertRaises(ClientError):
+                place_order(intent_request, "1234", Mock())
+            stubber.assert_no_pending_responses()
@@ -0,0 +1,57 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the 'License'). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import json
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from pizza_order import pizza_menu
+
+
+def write_menu(path, price, mtime):
+    with open(path, "w", encoding="utf-8") as menu_file:
+        json.dump({"en_US": {"menuItems": [{"T": "Greek", "D": "Toppings: feta", "P": {"small": price}}]}}, menu_file)
+    os.utime(path, (mtime, mtime))
+
+
+class PizzaMenuTests(TestCase):
+    def setUp(self):
+        pizza_menu.reset_menu()
+
+    def tearDown(self):
+        pizza_menu.reset_menu()
+
+    def test_lookups(self):
+        self.assertEqual(pizza_menu.get_price("en_US", "Greek", "large"), 16)
+        self.assertEqual(pizza_menu.get_price("fr_FR", "New York", "très-grand"), 20)
+        self.assertEqual(pizza_menu.get_description("en_US", "Vegetarian"), "Toppings: black olives, bell pepper, tomatoes, and mushrooms")
+        self.assertEqual([item["T"] for item in pizza_menu.get_menu_items("en_US")], ["Greek", "New York", "Vegetarian"])
+        self.assertRaises(KeyError, pizza_menu.get_price, "en_US", "Hawaiian", "large")
+
+    def test_menu_parsed_once(self):
+        with patch("pizza_order.pizza_menu.open", wraps=open) as mock_open:
+            pizza_menu.get_price("en_US", "Greek", "small")
+            pizza_menu.get_menu_items("es_US")
+            pizza_menu.get_description("ja_JP", "ギリシャ")
+        mock_open.assert_called_once()
+
+    def test_changed_menu_reloaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pizza_menu.json")
+            write_menu(path, 10, 1000)
+            self.assertEqual(pizza_menu.get_menu(path)["en_US"]["prices"]["Greek"]["small"], 10)
+            write_menu(path, 12, 2000)
+            # the file is not checked again until MENU_CHECK_SECONDS have passed
+            self.assertEqual(pizza_menu.get_menu(path)["en_US"]["prices"]["Greek"]["small"], 10)
+            with patch("pizza_order.pizza_menu.monotonic", return_value=pizza_menu._checked_at + pizza_menu.MENU_CHECK_SECONDS):
+                self.assertEqual(pizza_menu.get_menu(path)["en_US"]["prices"]["Greek"]["small"], 12)
@@ -200,3 +200,33 @@ class PizzaResponsesTests(TestCase):
         expected_response = "Ihre Bestellung wurde storniert. Dankeschön!"
         response = get_cancel_message("de_DE")
         self.assertEqual(expected_response, response)
+
+    def test_menu_message_memoized(self):
+        from pizza_order import pizza_responses
+        from pizza_order.pizza_menu import index_menu
+        menu = index_menu({"en_US": {"menuItems": [{"T": "Greek", "D": "Toppings: feta", "P": {"small": 10, "medium": 13, "large": 16, "extra-large": 19}}]}})
+        with patch("pizza_order.pizza_responses.get_menu", new=lambda: menu), \
+                patch("pizza_order.pizza_responses.render_menu_message", wraps=pizza_responses.render_menu_message) as mock_render:
+            message = get_menu_message("en_US", False)
+            self.assertEqual(get_menu_message("en_US", False), message)
+            self.assertEqual(get_menu_message("en_US", True), "Welcome to our Pizza Ordering Service. " + message)
+            self.assertEqual(mock_render.call_count, 2)
+            menu = index_menu({"en_US": {"menuItems": [{"T": "Greek", "D": "Toppings: feta", "P": {"small": 11, "medium": 13, "large": 16, "extra-large": 19}}]}})
+            self.assertIn("Small: 11", get_menu_message("en_US", False))
+            self.assertEqual(mock_render.call_count, 4)
+
+    def test_benchmark_responses(self):
+        from benchmark_responses import run_benchmark
+        from pizza_order import pizza_responses
+        turns = 100
+        for size in (3, 300):
+            with patch("pizza_order.pizza_responses.render_menu_message", wraps=pizza_responses.render_menu_message) as mock_render:
+                run_benchmark(size, turns=turns)
+            # the benchmark renders the message on every turn, the memoized path renders both messages of the
+            # locale once for the menu it loads and none on the turns that follow
+            self.assertEqual(mock_render.call_count, turns + 2)
+            rendered_items = {len(call.args[1]) for call in mock_render.call_args_list}
+            self.assertEqual(rendered_items, {size})
+        # the memoized message is a lookup, it does not grow with the menu the rendered message is made of
+        rendered, memoized = run_benchmark(300, turns=turns)
+        self.assertLess(memoized * 10, rendered)
@@ -0,0 +1,84 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the 'License'). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+from unittest import TestCase
+from unittest.mock import patch
+from botocore.stub import Stubber
+
+
+mock_env_variables = {
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+
+
+def order(order_id, customer_id, timestamp):
+    return {
+        "orderId": {"S": order_id},
+        "orderTimestamp": {"N": timestamp},
+        "customerId": {"S": customer_id},
+        "pizzaType": {"S": "Greek"},
+        "pizzaSize": {"S": "small"},
+        "pizzaCrust": {"S": "thin"},
+        "pizzaCount": {"N": "1"},
+    }
+
+
+@patch.dict(os.environ, mock_env_variables)
+class BackfillLatestOrdersTests(TestCase):
+    def test_backfill(self):
+        from backfill_latest_orders import backfill
+        from shared.client import get_client
+        stubber = Stubber(get_client("dynamodb"))
+        stubber.add_response(
+            "scan",
+            {"Items": [order("1", "a@example.com", "100.5"), order("2", "b@example.com", "90")], "LastEvaluatedKey": {"orderId": {"S": "2"}}},
+            {
+                "TableName": "test_table",
+                "FilterExpression": "attribute_exists(customerId)",
+                "ProjectionExpression": "orderId, orderTimestamp, customerId, pizzaType, pizzaSize, pizzaCrust, pizzaCount",
+            },
+        )
+        stubber.add_response(
+            "scan",
+            {"Items": [order("3", "a@example.com", "200"), order("4", "b@example.com", "80")]},
+            {
+                "TableName": "test_table",
+                "FilterExpression": "attribute_exists(customerId)",
+                "ProjectionExpression": "orderId, orderTimestamp, customerId, pizzaType, pizzaSize, pizzaCrust, pizzaCount",
+                "ExclusiveStartKey": {"orderId": {"S": "2"}},
+            },
+        )
+        condition = "attribute_not_exists(orderId) OR latestOrderTimestamp < :timestamp"
+        stubber.add_response(
+            "put_item",
+            {},
+            {
+                "TableName": "test_table",
+                "Item": {
+                    "orderId": {"S": "latestOrder#a@example.com"},
+                    "latestOrderId": {"S": "3"},
+                    "latestOrderTimestamp": {"N": "200"},
+                    "pizzaType": {"S": "Greek"},
+                    "pizzaSize": {"S": "small"},
+                    "pizzaCrust": {"S": "thin"},
+                    "pizzaCount": {"N": "1"},
+                },
+                "ConditionExpression": condition,
+                "ExpressionAttributeValues": {":timestamp": {"N": "200"}},
+            },
+        )
+        # b@example.com placed an order since the scan
+        stubber.add_client_error("put_item", "ConditionalCheckFailedException")
+        with stubber:
+            self.assertEqual(backfill("test_table"), (1, 1))
+            stubber.assert_no_pending_responses()
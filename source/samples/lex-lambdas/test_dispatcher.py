@@ -11,6 +11,7 @@
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
 import os
+import json
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -21,9 +22,14 @@ mock_env_variables = {
 
 @patch.dict(os.environ, mock_env_variables)
 class DispatcherTests(TestCase):
-    @patch("dispatcher.save_feedback")
-    @patch("dispatcher.handle_weather")
-    @patch("dispatcher.handle_pizza_order")
+    def setUp(self):
+        with patch.dict(os.environ, mock_env_variables):
+            from dispatcher import reset_handlers
+            reset_handlers()
+
+    @patch("leave_feedback.leave_feedback_handler.save_feedback")
+    @patch("weather_forecast.weather_forecast_handler.handle_weather")
+    @patch("pizza_order.pizza_order_handler.handle_pizza_order")
     def test_empty_slots(
         self, mock_handle_pizza_order, mock_handle_weather, mock_save_feedback
     ):
@@ -43,3 +49,21 @@ class DispatcherTests(TestCase):
 
         event["sessionState"]["intent"]["name"] = "InvalidIntentName"
         self.assertRaises(Exception, lambda_handler, event, context)
+
+    def test_handler_module_imported_on_first_use(self):
+        import dispatcher
+        event = {"sessionState": {"intent": {"name": "Greeting"}}}
+        greet = Mock(return_value={"messages": []})
+        with patch("dispatcher.import_module", return_value=Mock(greet=greet)) as mock_import:
+            dispatcher.register_intent("Greeting", "greeting.greeting_handler", "greet")
+            try:
+                mock_import.assert_not_called()
+                with self.assertLogs(level="INFO") as logs:
+                    dispatcher.lambda_handler(event, {})
+                dispatcher.lambda_handler(event, {})
+            finally:
+                dispatcher.INTENT_HANDLERS.pop("Greeting")
+        mock_import.assert_called_once_with("greeting.greeting_handler")
+        self.assertEqual(greet.call_count, 2)
+        cold_start = [json.loads(line.split(":", 2)[2]) for line in logs.output if "intentColdStart" in line]
+        self.assertEqual(cold_start[0]["intentColdStart"]["intent"], "Greeting")
@@ -17,6 +17,8 @@
 from crhelper import CfnResource
 import boto3
 
+# each request is a single SSM call that completes well within the timeout, unlike lex-bot and webclient-setup it
+# never has work left to continue in a new invocation
 helper = CfnResource()
 
 ssm = boto3.client("ssm")
@@ -0,0 +1,77 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Compare the API calls and wall time of creating a bot one call per resource with creating it from a single import.
+The real client is used, and Lex is replaced by the in-memory shared.lex_stand_in.LexStandIn answering every call,
+and the upload of the import archive, after a fixed latency. Resources are ready at once, so the time Lex itself
+spends creating resources, importing or building is not part of the measurement.
+
+Usage: python benchmark_bot_import.py [latency in seconds] [bot languages...]
+"""
+import os
+import sys
+from collections import Counter
+from time import perf_counter
+from types import SimpleNamespace
+from mock import patch
+
+os.environ.setdefault("AWS_SDK_USER_AGENT", '{ "user_agent_extra": "AwsSolution/SO0027/benchmark" }')
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+DEFAULT_LATENCY_SECONDS = 0.05
+FUNCTION_ARN = "arn:aws:lambda:us-east-1:123456789012:function:benchmark"
+ROLE_ARN = "arn:aws:iam::123456789012:role/lex"
+
+
+def run_benchmark(mode, bot_languages=("English",), latency=DEFAULT_LATENCY_SECONDS):
+    """
+    Provision a new bot against a fresh Lex stand-in
+    :param mode: The provisioning mode, "import" or "api"
+    :return: Tuple of (Counter of calls per operation, wall time in seconds)
+    """
+    import lambda_function
+    from shared.checkpoint import LocalCheckpointStore, run_phases
+    from shared.client import use_stand_in
+    from shared.lex_stand_in import LexStandIn
+    from shared.resource_index import reset_index
+    from shared.waiter import start_invocation
+
+    lex = LexStandIn(latencies={"*": latency})
+    use_stand_in("lexv2-models", lex)
+    try:
+        with patch("shared.bot_import.upload_archive", new=lex.upload), \
+                patch.dict(os.environ, {"botName": "BenchmarkBot", "lexLambdaARN": FUNCTION_ARN}):
+            start_invocation(None)
+            reset_index()
+            start = perf_counter()
+            phases = lambda_function.provisioning_phases(
+                "BenchmarkBot", ROLE_ARN, "No", list(bot_languages), SimpleNamespace(invoked_function_arn=FUNCTION_ARN),
+                mode,
+            )
+            run_phases(phases, {}, LocalCheckpointStore(), "benchmark")
+            return Counter(operation for operation, _ in lex.calls), perf_counter() - start
+    finally:
+        use_stand_in("lexv2-models", None)
+
+
+def main(argv):
+    latency = float(argv[0]) if argv else DEFAULT_LATENCY_SECONDS
+    bot_languages = argv[1:] or ["English"]
+    print(f"Provisioning a bot in {bot_languages} with {latency * 1000:.0f} ms per call")
+    for mode in ("api", "import"):
+        calls, seconds = run_benchmark(mode, bot_languages, latency)
+        print(f"{mode:>6}: {sum(calls.values()):4d} calls in {seconds:6.2f} s  {dict(sorted(calls.items()))}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,91 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Compare the wall time of provisioning a bot with its tasks run one at a time and run concurrently.
+The real client is used, with its rate limiter, retries and waiters, and Lex is replaced by the in-memory
+shared.lex_stand_in.LexStandIn, which simulates call latency and the time bots, locales and builds take.
+
+Usage: python benchmark_provisioning.py [latency in seconds] [build seconds] [bot languages...]
+"""
+import os
+import sys
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from types import SimpleNamespace
+from mock import patch
+
+os.environ.setdefault("AWS_SDK_USER_AGENT", '{ "user_agent_extra": "AwsSolution/SO0027/benchmark" }')
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+DEFAULT_LATENCY_SECONDS = 0.05
+DEFAULT_BUILD_SECONDS = 2.0
+FUNCTION_ARN = "arn:aws:lambda:us-east-1:123456789012:function:benchmark"
+ROLE_ARN = "arn:aws:iam::123456789012:role/lex"
+
+
+def serial_executor(max_workers):
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def run_benchmark(serial, bot_languages=("English",), latency=DEFAULT_LATENCY_SECONDS,
+                  build_seconds=DEFAULT_BUILD_SECONDS):
+    """
+    Provision a new bot against a fresh Lex stand-in
+    :param serial: Run the provisioning tasks one at a time instead of concurrently
+    :return: Tuple of (Counter of calls per operation, wall time in seconds)
+    """
+    import lambda_function
+    from shared.checkpoint import LocalCheckpointStore, run_phases
+    from shared.client import use_stand_in
+    from shared.lex_stand_in import LexStandIn
+    from shared.resource_index import reset_index
+    from shared.waiter import start_invocation
+
+    lex = LexStandIn(
+        latencies={"*": latency},
+        transitions={"bot": latency * 4, "locale": latency * 4, "build": build_seconds, "version": latency * 4},
+    )
+    executor = serial_executor if serial else ThreadPoolExecutor
+    use_stand_in("lexv2-models", lex)
+    try:
+        with patch("shared.executor.ThreadPoolExecutor", new=executor), \
+                patch.dict(os.environ, {"botName": "BenchmarkBot", "lexLambdaARN": FUNCTION_ARN}):
+            random.seed(0)
+            start_invocation(None)
+            reset_index()
+            start = perf_counter()
+            phases = lambda_function.provisioning_phases(
+                "BenchmarkBot", ROLE_ARN, "No", list(bot_languages),
+                SimpleNamespace(invoked_function_arn=FUNCTION_ARN),
+            )
+            run_phases(phases, {}, LocalCheckpointStore(), "benchmark")
+            return Counter(operation for operation, _ in lex.calls), perf_counter() - start
+    finally:
+        use_stand_in("lexv2-models", None)
+
+
+def main(argv):
+    latency = float(argv[0]) if argv else DEFAULT_LATENCY_SECONDS
+    build_seconds = float(argv[1]) if len(argv) > 1 else DEFAULT_BUILD_SECONDS
+    bot_languages = argv[2:] or ["English"]
+    print(f"Provisioning a bot in {bot_languages} with {latency * 1000:.0f} ms per call "
+          f"and {build_seconds:.1f} s per build")
+    for serial in (True, False):
+        calls, seconds = run_benchmark(serial, bot_languages, latency, build_seconds)
+        print(f"{'serial' if serial else 'parallel':>8}: {sum(calls.values()):4d} calls in {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -10,9 +10,6 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
-import os
-from shared.client import get_client
-from shared.logger import get_logger
 from book_appointment.appointment_helpers import (
     clarification_prompt,
     slot_types,
@@ -23,40 +20,28 @@ from book_appointment.appointment_helpers import (
     slot_message,
 )
 
-client = get_client("lexv2-models")
-logger = get_logger(__name__)
-
-def create_intent(bot_id, locale_id):
-    intent_response = client.create_intent(
-        intentName="MakeAppointment",
-        botId=bot_id,
-        botVersion="DRAFT",
-        localeId=locale_id,
-    )
-    return intent_response
+# slot name, slot type name and prompt id, in priority order
+SLOTS = [
+    ("AppointmentType", "AppointmentTypeValue", "appointmentType"),
+    ("Date", "AMAZON.Date", "date"),
+    ("Time", "AMAZON.Time", "time"),
+]
 
 
-def create_appointment_slot_type(bot_language, bot_id, locale_id):
-    slot_type_response = client.create_slot_type(
-        slotTypeName="AppointmentTypeValue",
-        description="Types of appointment",
-        slotTypeValues=slot_types(bot_language),
-        valueSelectionSetting={"resolutionStrategy": "OriginalValue"},
-        botId=bot_id,
-        botVersion="DRAFT",
-        localeId=locale_id,
-    )
-    return slot_type_response
+def slot_type_definition(bot_language):
+    return {
+        "slotTypeName": "AppointmentTypeValue",
+        "description": "Types of appointment",
+        "slotTypeValues": slot_types(bot_language),
+        "valueSelectionSetting": {"resolutionStrategy": "OriginalValue"},
+    }
 
 
-def create_appointment_slot(
-    slot_name, slot_type_id, message_id, bot_language, bot_id, locale_id, intent_id
-):
-    slot_response = client.create_slot(
-        slotName=slot_name,
-        description=f"{slot_name} information.",
-        slotTypeId=slot_type_id,
-        valueElicitationSetting={
+def slot_definition(slot_name, message_id, bot_language):
+    return {
+        "slotName": slot_name,
+        "description": f"{slot_name} information.",
+        "valueElicitationSetting": {
             "slotConstraint": "Required",
             "promptSpecification": {
                 "messageGroups": [
@@ -70,32 +55,18 @@ def create_appointment_slot(
                 "allowInterrupt": True,
             },
         },
-        obfuscationSetting={"obfuscationSettingType": "None"},
-        botId=bot_id,
-        botVersion="DRAFT",
-        localeId=locale_id,
-        intentId=intent_id,
-    )
-    return slot_response
+        "obfuscationSetting": {"obfuscationSettingType": "None"},
+    }
 
 
-def update_appointment_intent(
-    bot_language,
-    intent_id,
-    appointment_slot_id,
-    date_slot_id,
-    time_slot_id,
-    bot_id,
-    locale_id,
-):
-    response = client.update_intent(
-        intentId=intent_id,
-        intentName="MakeAppointment",
-        description="MakeAppointment intent created by serverless bot.",
-        sampleUtterances=utterances(bot_language),
-        dialogCodeHook={"enabled": False},
-        fulfillmentCodeHook={"enabled": False},
-        intentConfirmationSetting={
+def intent_settings(bot_language):
+    return {
+        "intentName": "MakeAppointment",
+        "description": "MakeAppointment intent created by serverless bot.",
+        "sampleUtterances": utterances(bot_language),
+        "dialogCodeHook": {"enabled": False},
+        "fulfillmentCodeHook": {"enabled": False},
+        "intentConfirmationSetting": {
             "promptSpecification": {
                 "messageGroups": [
                     {
@@ -114,7 +85,7 @@ def update_appointment_intent(
                 "allowInterrupt": True,
             },
         },
-        intentClosingSetting={
+        "intentClosingSetting": {
             "closingResponse": {
                 "messageGroups": [
                     {"message": {"plainTextMessage": closing_response(bot_language)}},
@@ -122,67 +93,22 @@ def update_appointment_intent(
                 "allowInterrupt": True,
             }
         },
-        slotPriorities=[
-            {
-                "priority": 1,
-                "slotId": appointment_slot_id,
-            },
-            {
-                "priority": 2,
-                "slotId": date_slot_id,
-            },
-            {
-                "priority": 3,
-                "slotId": time_slot_id,
-            },
+    }
+
+
+def intent_definition(bot_language):
+    """
+    Desired state of the MakeAppointment intent, its slot type and its slots (in priority order)
+    """
+    return dict(
+        intent_settings(bot_language),
+        slotTypes=[slot_type_definition(bot_language)],
+        slots=[
+            dict(slot_definition(slot_name, message_id, bot_language), slotTypeName=slot_type_name)
+            for slot_name, slot_type_name, message_id in SLOTS
         ],
-        botId=bot_id,
-        botVersion="DRAFT",
-        localeId=locale_id,
     )
-    logger.info(response)
 
-def create_appointment_intent(bot_id, locale_id):
-    logger = get_logger(__name__)
-    bot_language = os.environ.get("botLanguage")
 
-    # create custom slot type (AppointmentType)
-    slot_type_response = create_appointment_slot_type(bot_language, bot_id, locale_id)
-    logger.info(slot_type_response)
-    # extract slot_type_id
-    appointment_slot_type_id = slot_type_response["slotTypeId"]
-    # create intent
-    intent_response = create_intent(bot_id, locale_id)
-    logger.info(intent_response)
-    # extract intent_id
-    intent_id = intent_response["intentId"]
-    # create slots time, date and appointment type
-    time_slot_repsonse = create_appointment_slot(
-        "Time", "AMAZON.Time", "time", bot_language, bot_id, locale_id, intent_id
-    )
-    date_slot_response = create_appointment_slot(
-        "Date", "AMAZON.Date", "date", bot_language, bot_id, locale_id, intent_id
-    )
-    appointment_slot_response = create_appointment_slot(
-        "AppointmentType",
-        appointment_slot_type_id,
-        "appointmentType",
-        bot_language,
-        bot_id,
-        locale_id,
-        intent_id,
-    )
-    # extract slot id's
-    time_slot_id = time_slot_repsonse["slotId"]
-    date_slot_id = date_slot_response["slotId"]
-    appointment_slot_id = appointment_slot_response["slotId"]
-    # update the intent for prioritizing slots in the intent
-    update_appointment_intent(
-        bot_language,
-        intent_id,
-        appointment_slot_id,
-        date_slot_id,
-        time_slot_id,
-        bot_id,
-        locale_id,
-    )
+def populate(definition, locale_id, bot_language):
+    definition.add_intent(locale_id, intent_definition(bot_language))
@@ -14,6 +14,7 @@ import os
 from unittest import TestCase, mock
 from mock import patch
 import botocore
+from shared.testing import distinct_ids
 
 mock_env_variables = {
     "botLanguage": "English",
@@ -22,11 +23,12 @@ mock_env_variables = {
 
 @patch.dict(os.environ, mock_env_variables)
 class BookAppointmentIntentTest(TestCase):
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_intent(self, mock_client):
-        from book_appointment.intent import create_intent
-        create_intent(locale_id="en_US", bot_id="testid1234")
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from book_appointment.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateIntent",
             {
                 "intentName": "MakeAppointment",
@@ -36,11 +38,12 @@ class BookAppointmentIntentTest(TestCase):
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_appointment_slot_type(self, mock_client):
-        from book_appointment.intent import create_appointment_slot_type
-        create_appointment_slot_type(bot_language="English", locale_id="en_US", bot_id="testid1234")
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from book_appointment.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateSlotType",
             {
                 "slotTypeName": "AppointmentTypeValue",
@@ -57,24 +60,17 @@ class BookAppointmentIntentTest(TestCase):
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_appointment_slot(self, mock_client):
-        from book_appointment.intent import create_appointment_slot
-        create_appointment_slot(
-            slot_name="testName",
-            slot_type_id="testid1234",
-            message_id="appointmentType",
-            intent_id="testid1234",
-            bot_language="English",
-            locale_id="en_US",
-            bot_id="testid1234",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from book_appointment.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateSlot",
             {
-                "slotName": "testName",
-                "description": "testName information.",
-                "slotTypeId": "testid1234",
+                "slotName": "AppointmentType",
+                "description": "AppointmentType information.",
+                "slotTypeId": "AppointmentTypeValueId",
                 "valueElicitationSetting": {
                     "slotConstraint": "Required",
                     "promptSpecification": {
@@ -95,26 +91,19 @@ class BookAppointmentIntentTest(TestCase):
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
                 "localeId": "en_US",
-                "intentId": "testid1234",
+                "intentId": "MakeAppointmentId",
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_update_appointment_intent(self, mock_client):
-        from book_appointment.intent import update_appointment_intent
-        update_appointment_intent(
-            bot_language="English",
-            intent_id="testid1234",
-            appointment_slot_id="testName",
-            date_slot_id="testid1234",
-            time_slot_id="appointmentType",
-            bot_id="testid1234",
-            locale_id="en_US",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from book_appointment.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "UpdateIntent",
             {
-                "intentId": "testid1234",
+                "intentId": "MakeAppointmentId",
                 "intentName": "MakeAppointment",
                 "description": "MakeAppointment intent created by serverless bot.",
                 "sampleUtterances": [
@@ -152,9 +141,9 @@ class BookAppointmentIntentTest(TestCase):
                     }
                 },
                 "slotPriorities": [
-                    {"priority": 1, "slotId": "testName"},
-                    {"priority": 2, "slotId": "testid1234"},
-                    {"priority": 3, "slotId": "appointmentType"},
+                    {"priority": 1, "slotId": "AppointmentTypeId"},
+                    {"priority": 2, "slotId": "DateId"},
+                    {"priority": 3, "slotId": "TimeId"},
                 ],
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
@@ -162,37 +151,23 @@ class BookAppointmentIntentTest(TestCase):
             },
         )
 
-    @patch.dict(os.environ, mock_env_variables)
-    @patch("book_appointment.intent.create_appointment_slot_type", return_value={"slotTypeId": "testid1234"})
-    @patch("book_appointment.intent.create_appointment_slot", return_value={"slotId": "testid1234"})
-    @patch("book_appointment.intent.update_appointment_intent")
-    @patch("book_appointment.intent.create_intent", return_value={"intentId": "testid1234"})
-    def test_create_appointment_intent(
-        self,
-        mock_create_intent,
-        mock_update_appointment_intent,
-        mock_create_appointment_slot,
-        mock_create_appointment_slot_type,
-    ):
-        from book_appointment.intent import create_appointment_intent
-        create_appointment_intent(bot_id="testid1234", locale_id="en_US")
-        mock_create_appointment_slot_type.assert_called_with("English", "testid1234", "en_US")
-        mock_create_intent.assert_called_with("testid1234", "en_US")
-        mock_create_appointment_slot.assert_has_calls(
-            [
-                mock.call("Time", "AMAZON.Time", "time", "English", "testid1234", "en_US", "testid1234"),
-                mock.call("Date", "AMAZON.Date", "date", "English", "testid1234", "en_US", "testid1234"),
-                mock.call(
-                    "AppointmentType", "testid1234", "appointmentType", "English", "testid1234", "en_US", "testid1234"
-                ),
-            ]
+    def test_intent_definition(self):
+        from book_appointment.intent import intent_definition
+        definition = intent_definition("English")
+        self.assertEqual(definition["intentName"], "MakeAppointment")
+        self.assertEqual([slot_type["slotTypeName"] for slot_type in definition["slotTypes"]], ["AppointmentTypeValue"])
+        self.assertEqual(
+            [(slot["slotName"], slot["slotTypeName"]) for slot in definition["slots"]],
+            [("AppointmentType", "AppointmentTypeValue"), ("Date", "AMAZON.Date"), ("Time", "AMAZON.Time")],
         )
-        mock_update_appointment_intent.assert_called_with(
-            "English",
-            "testid1234",
-            "testid1234",
-            "testid1234",
-            "testid1234",
-            "testid1234",
-            "en_US",
+
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
+    def test_create_appointment_intent(self, mock_client):
+        from shared.testing import provision
+        from book_appointment.intent import populate
+        provision(populate)
+        operations = [call.args[0] for call in mock_client.call_args_list]
+        self.assertEqual(
+            sorted(operations), ["CreateIntent", "CreateSlot", "CreateSlot", "CreateSlot", "CreateSlotType", "UpdateIntent"]
         )
+        self.assertEqual(operations[-1], "UpdateIntent")
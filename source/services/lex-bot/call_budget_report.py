@@ -0,0 +1,124 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Count the lexv2-models calls of creating, updating and deleting the bot, per operation, locale and intent.
+Lex is replaced by the in-memory shared.lex_stand_in.LexStandIn, where every resource is ready at once, so the
+counts do not depend on how long Lex takes. test_lambda_function compares them with call_budget_baseline.json.
+
+Usage: python call_budget_report.py [report path, defaults to the baseline]
+"""
+import os
+import sys
+import json
+from types import SimpleNamespace
+from mock import patch
+
+os.environ.setdefault("AWS_SDK_USER_AGENT", '{ "user_agent_extra": "AwsSolution/SO0027/budget" }')
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "call_budget_baseline.json")
+BOT_LANGUAGES = ["English", "French"]
+FUNCTION_ARN = "arn:aws:lambda:us-east-1:123456789012:function:budget"
+ENVIRONMENT = {
+    "botName": "BudgetBot",
+    "botRole": "arn:aws:iam::123456789012:role/lex",
+    "childDirected": "No",
+    "botLanguage": BOT_LANGUAGES[0],
+    "additionalBotLanguages": ",".join(BOT_LANGUAGES[1:]),
+    "lexLambdaARN": FUNCTION_ARN,
+}
+
+
+def budget_event(request_type, request_id):
+    return {
+        "RequestType": request_type,
+        "RequestId": request_id,
+        "LogicalResourceId": "LexBot",
+        "PhysicalResourceId": "BudgetBot",
+        "ResourceProperties": {},
+    }
+
+
+def build_report():
+    """
+    Create the bot, update it without changes and delete it against a fresh Lex stand-in
+    :return: Dict of request type to the call budget of handling it
+    """
+    import lambda_function
+    from shared.client import use_stand_in
+    from shared.lex_stand_in import LexStandIn
+    from shared.resource_index import reset_index
+    from shared.tracing import start_trace, call_budget
+    from shared.waiter import start_invocation
+
+    context = SimpleNamespace(invoked_function_arn=FUNCTION_ARN)
+    requests = (
+        ("Create", lambda_function.create_resource),
+        ("Update", lambda_function.update_resource),
+        ("Delete", lambda_function.delete_resource),
+    )
+    report = {}
+    use_stand_in("lexv2-models", LexStandIn())
+    try:
+        # the rate limiter delays calls, it does not change them
+        with patch("shared.rate_limiter.TokenBucket.acquire", return_value=0), patch.dict(os.environ, ENVIRONMENT):
+            for request_type, handle in requests:
+                start_invocation(None)
+                start_trace()
+                reset_index()
+                handle(budget_event(request_type, f"budget-{request_type.lower()}"), context)
+                report[request_type] = call_budget()
+    finally:
+        use_stand_in("lexv2-models", None)
+    return report
+
+
+def flatten(budget, path=()):
+    """
+    :return: Dict of (request type, locale, intent..., operation) path to the number of calls
+    """
+    counts = {}
+    for key, value in budget.items():
+        if key == "operations":
+            counts.update({path + (operation,): calls for operation, calls in value.items()})
+        elif isinstance(value, dict):
+            counts.update(flatten(value, path if key in ("locales", "intents") else path + (key,)))
+    return counts
+
+
+def compare(baseline, report):
+    """
+    :return: List of the call counts of the report that differ from the baseline, as "path: before -> after"
+    """
+    before, after = flatten(baseline), flatten(report)
+    return [
+        f"{' '.join(path)}: {before.get(path, 0)} -> {after.get(path, 0)}"
+        for path in sorted(set(before) | set(after))
+        if before.get(path, 0) != after.get(path, 0)
+    ]
+
+
+def dumps(report):
+    return json.dumps(report, indent=2, sort_keys=True) + "\n"
+
+
+def main(argv):
+    path = argv[0] if argv else BASELINE_PATH
+    report = build_report()
+    with open(path, "w", encoding="utf-8") as report_file:
+        report_file.write(dumps(report))
+    print(", ".join(f"{request_type}: {budget['total']} calls" for request_type, budget in report.items()))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
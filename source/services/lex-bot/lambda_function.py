@@ -12,86 +12,87 @@
 ######################################################################################################################
 
 import os
-from time import sleep
+import json
+import hashlib
+import importlib
 import botocore
-from crhelper import CfnResource
 from shared.logger import get_logger
 from shared.client import get_client
-from leave_feedback.intent import create_feedback_intent
-from book_appointment.intent import create_appointment_intent
-from order_pizza.intent import create_order_pizza_intent
-from weather_forecast.intent import create_weather_intent
-from other_intents.help_intent import create_help_intent
-from other_intents.name_intent import create_name_intent
-
-from shared.helpers import detect_locale, abort_statement
+from shared.waiter import wait_for_status, start_invocation, WaiterTimeout
+from shared.bot_definition import BotDefinition
+from shared.bot_validation import validate_definition, DefinitionError
+from shared.bot_diff import read_locale, diff_locale, differs
+from shared.executor import Task, run_tasks
+from shared.bot_plan import (
+    compile_changes, compile_alias, compile_teardown, execute_plan, count_calls, dry_run, wait_for_bot_delete,
+    wait_for_bot_locale_delete,
+)
+from shared.bot_import import start_bot_import, wait_for_import
+from shared.checkpoint import get_checkpoint_store, run_phases, ContinueInNewInvocation
+from shared.resumable import ResumableResource
+from shared.rate_limiter import report_throttles
+from shared.tracing import start_trace, report_trace
+from shared.resource_index import reset_index, listing_params, find_resource, create_or_reuse, forget_resource
+from shared.helpers import detect_locale, abort_statement, LANGUAGE_LOCALES
 
 logger = get_logger(__name__)
-helper = CfnResource(json_logging=True, log_level="INFO")
+# modules populating the bot definition with their intents, imported when a definition is first built
+INTENT_MODULES = (
+    "leave_feedback.intent",
+    "book_appointment.intent",
+    "order_pizza.intent",
+    "weather_forecast.intent",
+    "other_intents.help_intent",
+    "other_intents.name_intent",
+)
+# the fingerprint of the last successful build of each locale is kept as a bot tag
+FINGERPRINT_TAG_PREFIX = "fingerprint:"
+BOT_TAGS = {"createdby": "serverless bot framework"}
+# the test alias always serves DRAFT, users are served a numbered version through the live alias
+TEST_ALIAS_NAME = "TestBotAlias"
+LIVE_ALIAS_NAME = "LiveBotAlias"
+# versions are described with the fingerprint of the definition they were created from
+RELEASE_DESCRIPTION_PREFIX = "Serverless Bot Framework release "
+DEFAULT_VERSION_RETENTION = 3
+# bots of a fleet provisioned at the same time
+FLEET_MAX_WORKERS = 8
+# CloudFormation rejects responses over 4096 bytes, the fields other than Data take up to about 1 KB of them
+FLEET_DATA_MAX_BYTES = 3000
+# Lex bot and alias ids are 10 characters long
+LEX_ID_LENGTH = 10
+# "import" uploads the whole definition with a single StartImport, "api" creates every resource with its own call
+IMPORT_MODE = "import"
+# crhelper sleeps before responding to a Delete so that its logs reach CloudWatch, 120 s by default. With the 15 minute
+# timeout it would sleep for that long in every teardown, the 60 s timeout this function had left no time for it
+DELETE_LOG_FLUSH_SECONDS = 5
+helper = ResumableResource(json_logging=True, log_level="INFO", sleep_on_delete=DELETE_LOG_FLUSH_SECONDS)
 client = get_client("lexv2-models")
+checkpoint_store = get_checkpoint_store()
 
 
 def wait_for_bot(bot_id):
-    response = client.describe_bot(botId=bot_id)
-    bot_status = response["botStatus"]
-    while bot_status == "Creating":
-        sleep(1)
-        response = client.describe_bot(botId=bot_id)
-        bot_status = response["botStatus"]
-    if bot_status != "Available":
+    response = wait_for_status(
+        client, "describe_bot", {"botId": bot_id}, "botStatus", ("Creating", "Updating"), resource="bot"
+    )
+    if response["botStatus"] != "Available":
         logger.error(response)
         raise RuntimeError("Failed to create Lex bot.")
 
 
 def wait_for_locale(bot_id, locale_id):
-    response = client.describe_bot_locale(
-        botId=bot_id, localeId=locale_id, botVersion="DRAFT"
+    response = wait_for_status(
+        client,
+        "describe_bot_locale",
+        {"botId": bot_id, "localeId": locale_id, "botVersion": "DRAFT"},
+        "botLocaleStatus",
+        ("Creating",),
+        resource="locale",
     )
-    bot_locale_status = response["botLocaleStatus"]
-    while bot_locale_status == "Creating":
-        sleep(1)
-        response = client.describe_bot_locale(
-            botId=bot_id, localeId=locale_id, botVersion="DRAFT"
-        )
-        bot_locale_status = response["botLocaleStatus"]
-    if bot_locale_status == "Failed":
+    if response["botLocaleStatus"] == "Failed":
         logger.error(response)
         raise RuntimeError("Failed to create Lex bot locale")
 
 
-def wait_for_build(bot_id, locale_id):
-    response = client.describe_bot_locale(
-        botId=bot_id, localeId=locale_id, botVersion="DRAFT"
-    )
-    bot_locale_status = response["botLocaleStatus"]
-    while bot_locale_status == "Building":
-        sleep(1)
-        response = client.describe_bot_locale(
-            botId=bot_id, localeId=locale_id, botVersion="DRAFT"
-        )
-        bot_locale_status = response["botLocaleStatus"]
-    if bot_locale_status == "Failed":
-        logger.error(response)
-        raise RuntimeError("Failed to create Lex bot locale")
-
-def wait_for_bot_delete(bot_id):
-    try:
-        response = client.describe_bot(botId=bot_id)
-        bot_status = response["botStatus"]
-        while bot_status == "Deleting":
-            sleep(1)
-            response = client.describe_bot(botId=bot_id)
-            bot_status = response["botStatus"]
-        if bot_status == "Failed":
-            logger.error(response)
-            raise RuntimeError("Failed to delete Lex bot.")
-    except botocore.exceptions.ClientError as error:
-        if error.response['Error']['Code'] == 'ResourceNotFoundException':
-            logger.info(f"Bot with bot_id {bot_id} successfully deleted.")
-        else:
-            logger.error(error)
-            raise RuntimeError("Failed to delete Lex bot.")
-
 def create_lex_bot_locale(bot_language, bot_id):
     locale_response = client.create_bot_locale(
         botId=bot_id,
@@ -103,109 +104,681 @@ def create_lex_bot_locale(bot_language, bot_id):
     return locale_response
 
 
+def bot_settings(bot_name, bot_role_arn, child_directed):
+    return {
+        "botName": bot_name,
+        "description": "Created by Serverless Bot Framework",
+        "roleArn": bot_role_arn,
+        "dataPrivacy": {"childDirected": child_directed == "Yes"},
+        "idleSessionTTLInSeconds": 300,
+    }
+
+
 def create_lex_bot(bot_name, bot_role_arn, child_directed):
-    bot_response = client.create_bot(
-        botName=bot_name,
-        description="Created by Serverless Bot Framework",
-        roleArn=bot_role_arn,
-        dataPrivacy={"childDirected": child_directed == "Yes"},
-        idleSessionTTLInSeconds=300,
-        botTags={"createdby": "serverless bot framework"},
+    bot_response = create_or_reuse(
+        "create_bot", dict(bot_settings(bot_name, bot_role_arn, child_directed), botTags=BOT_TAGS)
     )
     return bot_response
 
 
-def get_bot_alias_id(bot_id):
-    alias_response = client.list_bot_aliases(botId=bot_id)
-    alias_id = alias_response["botAliasSummaries"][0]["botAliasId"]
-    return alias_id
-
-def get_bot_id():
-    bot_name = os.environ.get("botName")
-    alias_response = client.list_bots(filters=[{
-        "name": "BotName",
-        "values": [bot_name],
-        "operator": "EQ",
-    }])
-    bot_id = alias_response["botSummaries"][0]["botId"]
-    return bot_id
-
-
-def configure_lex_bot(bot_name, bot_role_arn, child_directed, bot_language):
-    # Creating a Lex bot
-    bot_response = create_lex_bot(bot_name, bot_role_arn, child_directed)
-    logger.info(bot_response)
-    bot_id = bot_response["botId"]
+def update_lex_bot(bot_id, bot_name, bot_role_arn, child_directed):
+    settings = bot_settings(bot_name, bot_role_arn, child_directed)
+    current = client.describe_bot(botId=bot_id)
+    if not differs(settings, current, settings.keys()):
+        if current["botStatus"] != "Available":
+            # the bot may still be created by an earlier invocation of the same request
+            wait_for_bot(bot_id)
+        return False
+    logger.info(client.update_bot(botId=bot_id, **settings))
     wait_for_bot(bot_id)
-    bot_alias_id = get_bot_alias_id(bot_id)
+    return True
+
+
+def get_bot_alias(bot_id, alias_name):
+    alias_response = client.list_bot_aliases(botId=bot_id)
+    return next(
+        (alias for alias in alias_response["botAliasSummaries"] if alias["botAliasName"] == alias_name), None
+    )
 
-    # Creating a locale for the Lex bot
-    locale_response = create_lex_bot_locale(bot_language, bot_id)
-    locale_id = locale_response["localeId"]
-    wait_for_locale(bot_id, locale_id)
-    logger.info(locale_response)
 
-    return bot_id, bot_alias_id, locale_id
+def get_bot_alias_id(bot_id, alias_name=TEST_ALIAS_NAME):
+    alias_id = get_bot_alias(bot_id, alias_name)["botAliasId"]
+    return alias_id
 
 
-def create_bot_intents(bot_id, bot_alias_id, locale_id):
-    create_feedback_intent(bot_id, locale_id, bot_alias_id)
-    create_appointment_intent(bot_id, locale_id)
-    create_order_pizza_intent(bot_id, locale_id)
-    create_weather_intent(bot_id, locale_id)
-    create_help_intent(bot_id, locale_id)
-    create_name_intent(bot_id, locale_id)
+def get_bot_id(bot_name=None, replacing=False):
+    """
+    :param replacing: A bot of this name is created if there is none. A bot being deleted is then waited for,
+        as its name is only free once it is gone.
+    :return: The id of the bot, None if there is no bot of this name or it is being deleted
+    """
+    bot_name = bot_name or os.environ.get("botName")
+    summary = find_resource("bots", bot_name, **listing_params("bots", {"botName": bot_name}))
+    if summary is None:
+        return None
+    if summary.get("botStatus") == "Deleting":
+        if replacing:
+            wait_for_bot_delete(summary["botId"])
+            forget_resource("delete_bot", {"botId": summary["botId"]})
+        return None
+    return summary["botId"]
+
+
+def get_bot_locales(bot_id):
+    """
+    :return: Dict of locale id to the status of the locale
+    """
+    locale_response = client.list_bot_locales(botId=bot_id, botVersion="DRAFT")
+    return {summary["localeId"]: summary["botLocaleStatus"] for summary in locale_response["botLocaleSummaries"]}
+
+
+def get_bot_languages(bot_language=None, additional_bot_languages=None):
+    """
+    :return: The language of the bot followed by its additional languages, without duplicates.
+    Both default to the environment.
+    """
+    if bot_language is None:
+        bot_language = os.environ.get("botLanguage")
+        additional_bot_languages = os.environ.get("additionalBotLanguages", "")
+    languages = [bot_language] + (additional_bot_languages or "").split(",")
+    return list(dict.fromkeys(language.strip() for language in languages if language and language.strip()))
+
+
+def intent_modules():
+    """
+    :return: The intent modules, imported on first use so that delete requests do not load them
+    """
+    return [importlib.import_module(name) for name in INTENT_MODULES]
+
+
+def build_bot_definition(bot_name, bot_role_arn, child_directed, bot_languages):
+    definition = BotDefinition(
+        bot_settings(bot_name, bot_role_arn, child_directed),
+        {"botAliasName": TEST_ALIAS_NAME, "description": "Created By Serverless Bot Framework", "botVersion": "DRAFT"},
+    )
+    unsupported = [bot_language for bot_language in bot_languages if bot_language not in LANGUAGE_LOCALES]
+    if unsupported:
+        raise DefinitionError([f"Language {bot_language} is not supported" for bot_language in unsupported])
+    for bot_language in bot_languages:
+        locale_id = detect_locale(bot_language)
+        definition.add_locale(
+            locale_id, description=f"created {bot_language} from lambda", nluIntentConfidenceThreshold=0.4
+        )
+        for module in intent_modules():
+            try:
+                module.populate(definition, locale_id, bot_language)
+            except KeyError as error:
+                raise DefinitionError([f"{module.__name__} has no {bot_language} content for {error}"]) from error
+    return definition
+
+
+def run_per_locale(func, locale_ids, name):
+    """
+    Run func(locale_id) for all locales at the same time
+    :return: Dict of locale id to the result of func
+    """
+    tasks = [Task(locale_id, lambda _, locale_id=locale_id: func(locale_id)) for locale_id in locale_ids]
+    return run_tasks(tasks, max_workers=max(len(tasks), 1), name=name) if tasks else {}
+
+
+def run_plan(plan, name):
+    logger.info(f"Running {name} plan: {dict(count_calls(plan))}")
+    logger.debug("\n".join(dry_run(plan)))
+    return execute_plan(plan, name=name)
+
+
+def update_bot_locale(definition, bot_id, locale_id):
+    current = read_locale(bot_id, locale_id)
+    changes = diff_locale(definition.intents(locale_id), current)
+    logger.info(f"{len(changes)} changes for locale {locale_id}: {changes}")
+    run_plan(compile_changes(definition, locale_id, bot_id, current, changes), "update locale")
+    return changes
+
+
+def update_lex_bot_alias(definition, bot_id, bot_alias_id):
+    current = client.describe_bot_alias(botAliasId=bot_alias_id, botId=bot_id)
+    if not differs(definition.alias_settings, current, ("botVersion", "botAliasLocaleSettings")):
+        return False
+    run_plan(compile_alias(definition, bot_id, bot_alias_id), "update alias")
+    return True
+
+
+def build_status(locale_ids):
+    """
+    :return: Function returning the combined build status of the locales from a list_bot_locales response
+    """
+    def status(response):
+        statuses = [
+            summary["botLocaleStatus"]
+            for summary in response["botLocaleSummaries"]
+            if summary["localeId"] in locale_ids
+        ]
+        for combined in ("Building", "Failed"):
+            if combined in statuses:
+                return combined
+        return "Built"
+    return status
+
+
+def wait_for_builds(bot_id, locale_ids):
+    """
+    Wait for the builds of several locales with a single waiter, listing all locales of the bot on each poll
+    """
+    response = wait_for_status(
+        client,
+        "list_bot_locales",
+        {"botId": bot_id, "botVersion": "DRAFT"},
+        build_status(locale_ids),
+        ("Building",),
+        resource="locale",
+    )
+    failed = [
+        summary["localeId"]
+        for summary in response["botLocaleSummaries"]
+        if summary["localeId"] in locale_ids and summary["botLocaleStatus"] == "Failed"
+    ]
+    if failed:
+        logger.error(response)
+        raise RuntimeError(f"Failed to build Lex bot locales {failed}")
 
 
-def build_lex_bot(bot_id, locale_id):
-    # build fully configured bot
+def start_build(bot_id, locale_id):
+    status = client.describe_bot_locale(botId=bot_id, botVersion="DRAFT", localeId=locale_id)["botLocaleStatus"]
+    if status == "Building":
+        # started by an earlier invocation of the same request
+        return
     build_response = client.build_bot_locale(
         botId=bot_id, botVersion="DRAFT", localeId=locale_id
     )
     logger.info(build_response)
-    # wait for bot to finish building
-    wait_for_build(bot_id, locale_id)
 
 
-@helper.create
-def create_resource(event, _):
+def get_bot_arn(bot_id, context):
+    # the bot is created in the account and region of this function
+    function_arn = getattr(context, "invoked_function_arn", None)
+    if not function_arn:
+        return None
+    partition, _, region, account_id = function_arn.split(":")[1:5]
+    return f"arn:{partition}:lex:{region}:{account_id}:bot/{bot_id}"
+
+
+def get_build_fingerprint(bot_arn, locale_id):
+    tags = client.list_tags_for_resource(resourceARN=bot_arn).get("tags", {})
+    return tags.get(FINGERPRINT_TAG_PREFIX + locale_id)
+
+
+def set_build_fingerprint(bot_arn, locale_id, fingerprint):
+    client.tag_resource(resourceARN=bot_arn, tags={FINGERPRINT_TAG_PREFIX + locale_id: fingerprint})
+
+
+def needs_build(definition, bot_id, locale_id, context, changed):
+    """
+    :return: True unless nothing changed and the last successful build of the locale was of the same definition
+    """
+    if changed:
+        return True
+    bot_arn = get_bot_arn(bot_id, context)
+    if bot_arn is None:
+        logger.info(f"Locale {locale_id} is up to date, skipping build.")
+        return False
+    fingerprint = definition.fingerprint(locale_id)
+    if get_build_fingerprint(bot_arn, locale_id) == fingerprint:
+        logger.info(f"Locale {locale_id} build skipped, fingerprint unchanged: {fingerprint}")
+        return False
+    logger.info(f"Locale {locale_id} was not built from its current definition, building it.")
+    return True
+
+
+def complete_builds(definition, bot_id, locale_ids, context):
+    wait_for_builds(bot_id, locale_ids)
+    bot_arn = get_bot_arn(bot_id, context)
+    if bot_arn is not None:
+        for locale_id in locale_ids:
+            set_build_fingerprint(bot_arn, locale_id, definition.fingerprint(locale_id))
+
+
+def release_fingerprint(definition, locale_ids):
+    """
+    :return: Stable hash of the definition of all locales of a release
+    """
+    fingerprints = ",".join(f"{locale_id}={definition.fingerprint(locale_id)}" for locale_id in sorted(locale_ids))
+    return hashlib.sha256(fingerprints.encode("utf-8")).hexdigest()
+
+
+def get_released_version(bot_id, fingerprint):
+    """
+    :return: The version served by the live alias if it was created from the same definition, otherwise None
+    """
+    live_alias = get_bot_alias(bot_id, LIVE_ALIAS_NAME)
+    if live_alias is None or not live_alias.get("botVersion"):
+        return None
+    version = client.describe_bot_version(botId=bot_id, botVersion=live_alias["botVersion"])
+    if version.get("description") != RELEASE_DESCRIPTION_PREFIX + fingerprint:
+        return None
+    return live_alias["botVersion"]
+
+
+def create_release_version(bot_id, locale_ids, fingerprint):
+    response = client.create_bot_version(
+        botId=bot_id,
+        description=RELEASE_DESCRIPTION_PREFIX + fingerprint,
+        botVersionLocaleSpecification={locale_id: {"sourceBotVersion": "DRAFT"} for locale_id in locale_ids},
+    )
+    logger.info(response)
+    return response["botVersion"]
+
+
+def wait_for_bot_version(bot_id, bot_version):
+    response = wait_for_status(
+        client,
+        "describe_bot_version",
+        {"botId": bot_id, "botVersion": bot_version},
+        "botStatus",
+        ("Creating", "Versioning"),
+        resource="version",
+    )
+    if response["botStatus"] != "Available":
+        logger.error(response)
+        raise RuntimeError(f"Failed to create Lex bot version {bot_version}")
+
 
-    # Get environment variables
-    bot_language = os.environ.get("botLanguage")
+def wait_for_bot_alias(bot_id, bot_alias_id):
+    response = wait_for_status(
+        client,
+        "describe_bot_alias",
+        {"botId": bot_id, "botAliasId": bot_alias_id},
+        "botAliasStatus",
+        ("Creating",),
+        resource="alias",
+    )
+    if response["botAliasStatus"] != "Available":
+        logger.error(response)
+        raise RuntimeError("Failed to create Lex bot alias")
+
+
+def release_bot_version(definition, bot_id, bot_version):
+    """
+    Point the live alias at a version, creating the alias on the first release.
+    The alias keeps serving the previous version until the update switches it over.
+    :return: The id of the live alias
+    """
+    settings = dict(
+        definition.alias_settings,
+        botAliasName=LIVE_ALIAS_NAME,
+        description="Live alias created by Serverless Bot Framework",
+        botVersion=bot_version,
+    )
+    live_alias = get_bot_alias(bot_id, LIVE_ALIAS_NAME)
+    if live_alias is None:
+        bot_alias_id = client.create_bot_alias(botId=bot_id, **settings)["botAliasId"]
+    else:
+        bot_alias_id = live_alias["botAliasId"]
+        current = client.describe_bot_alias(botAliasId=bot_alias_id, botId=bot_id)
+        if differs(settings, current, ("botVersion", "botAliasLocaleSettings")):
+            logger.info(f"Switching {LIVE_ALIAS_NAME} from version {current.get('botVersion')} to {bot_version}")
+            client.update_bot_alias(botAliasId=bot_alias_id, botId=bot_id, **settings)
+    wait_for_bot_alias(bot_id, bot_alias_id)
+    return bot_alias_id
+
+
+def get_version_retention():
+    """
+    :return: How many numbered versions to keep, from the botVersionRetention environment variable
+    """
+    retention = os.environ.get("botVersionRetention")
+    return max(int(retention), 1) if retention else DEFAULT_VERSION_RETENTION
+
+
+def delete_old_versions(bot_id, retention):
+    """
+    Delete the numbered versions older than the newest retention ones, unless an alias still points at them
+    :return: The deleted versions
+    """
+    summaries = []
+    params = {"botId": bot_id}
+    while True:
+        response = client.list_bot_versions(**params)
+        summaries.extend(response["botVersionSummaries"])
+        if not response.get("nextToken"):
+            break
+        params["nextToken"] = response["nextToken"]
+    in_use = {alias.get("botVersion") for alias in client.list_bot_aliases(botId=bot_id)["botAliasSummaries"]}
+    versions = sorted(
+        (summary["botVersion"] for summary in summaries if summary["botVersion"].isdigit()), key=int, reverse=True
+    )
+    stale = [version for version in versions[retention:] if version not in in_use]
+    for version in stale:
+        logger.info(client.delete_bot_version(botId=bot_id, botVersion=version))
+    return stale
+
+
+def release_phases(definition, locale_ids):
+    """
+    Phases publishing the built DRAFT as a numbered version, switching the live alias over to it and deleting
+    versions beyond the retention. A release is skipped if the live alias serves a version of the same definition.
+    :return: List of (name, func(state)) tuples
+    """
+    def version(state):
+        if "botVersion" not in state:
+            fingerprint = release_fingerprint(definition, locale_ids)
+            released = get_released_version(state["botId"], fingerprint)
+            if released is not None:
+                logger.info(f"Version {released} is already released from this definition.")
+                state["botVersion"] = released
+                return
+            state["botVersion"] = create_release_version(state["botId"], locale_ids, fingerprint)
+        wait_for_bot_version(state["botId"], state["botVersion"])
+
+    def release(state):
+        state["liveBotAliasId"] = release_bot_version(definition, state["botId"], state["botVersion"])
+
+    def retention(state):
+        delete_old_versions(state["botId"], get_version_retention())
+
+    return [("version", version), ("release", release), ("retention", retention)]
+
+
+def provisioning_phases(bot_name, bot_role_arn, child_directed, bot_languages, context, mode=None):
+    """
+    Phases creating or updating the bot. Each phase looks up what already exists before changing anything,
+    so that it can be run again when an invocation stops before the phase is checkpointed.
+    Within a phase, the locales of the bot are handled at the same time.
+    In import mode, the bot, its locales and their intents are imported at once. The phases creating them
+    one call at a time only run if the import fails.
+    :return: List of (name, func(state)) tuples
+    """
+    definition = build_bot_definition(bot_name, bot_role_arn, child_directed, bot_languages)
+    validate_definition(definition)
+    languages = {detect_locale(bot_language): bot_language for bot_language in bot_languages}
+    locale_ids = list(languages)
+
+    def bot(state):
+        bot_id = get_bot_id(bot_name, replacing=True)
+        if bot_id is None:
+            bot_response = create_lex_bot(bot_name, bot_role_arn, child_directed)
+            logger.info(bot_response)
+            bot_id = bot_response["botId"]
+            wait_for_bot(bot_id)
+        else:
+            # Only change what differs from the current DRAFT definition, so the bot stays available
+            update_lex_bot(bot_id, bot_name, bot_role_arn, child_directed)
+        state.update(botId=bot_id, botAliasId=get_bot_alias_id(bot_id), localeIds=locale_ids)
+        state.setdefault("changedLocaleIds", [])
+
+    def locale(state):
+        locales = get_bot_locales(state["botId"])
+
+        def create_locale(locale_id):
+            if locales.get(locale_id) == "Deleting":
+                # removed by an earlier update, the locale is created again once it is gone
+                wait_for_bot_locale_delete(state["botId"], locale_id)
+                del locales[locale_id]
+            if locale_id not in locales:
+                logger.info(create_lex_bot_locale(languages[locale_id], state["botId"]))
+            if locales.get(locale_id, "Creating") == "Creating":
+                wait_for_locale(state["botId"], locale_id)
+
+        run_per_locale(create_locale, locale_ids, "create locales")
+        new_locale_ids = [locale_id for locale_id in locale_ids if locale_id not in locales]
+        state["changedLocaleIds"] = list(dict.fromkeys(state["changedLocaleIds"] + new_locale_ids))
+
+    def intents(state):
+        changes = run_per_locale(
+            lambda locale_id: update_bot_locale(definition, state["botId"], locale_id), locale_ids, "update locales"
+        )
+        changed = [locale_id for locale_id in locale_ids if changes[locale_id]]
+        state["changedLocaleIds"] = list(dict.fromkeys(state["changedLocaleIds"] + changed))
+
+    def bulk_import(state):
+        try:
+            if "importId" not in state:
+                state["importId"] = start_bot_import(definition, BOT_TAGS)
+            bot_id = wait_for_import(state["importId"])
+        except WaiterTimeout:
+            raise
+        except (RuntimeError, botocore.exceptions.ClientError, OSError) as error:
+            logger.warning(f"Bot import failed, creating its resources one call at a time instead: {error}")
+            return
+        # imported locales are not built
+        state.update(
+            botId=bot_id,
+            botAliasId=get_bot_alias_id(bot_id),
+            localeIds=locale_ids,
+            changedLocaleIds=locale_ids,
+            imported=True,
+        )
+
+    def unless_imported(func):
+        def phase(state):
+            if not state.get("imported"):
+                func(state)
+        return phase
+
+    def alias(state):
+        update_lex_bot_alias(definition, state["botId"], state["botAliasId"])
+
+    def build(state):
+        state["buildingLocaleIds"] = [
+            locale_id
+            for locale_id in locale_ids
+            if needs_build(definition, state["botId"], locale_id, context, locale_id in state["changedLocaleIds"])
+        ]
+        run_per_locale(lambda locale_id: start_build(state["botId"], locale_id), state["buildingLocaleIds"], "build")
+
+    def wait_build(state):
+        if state["buildingLocaleIds"]:
+            complete_builds(definition, state["botId"], state["buildingLocaleIds"], context)
+
+    def cleanup(state):
+        stale = [
+            ("locale", state["botId"], stale_locale_id)
+            for stale_locale_id, status in get_bot_locales(state["botId"]).items()
+            if stale_locale_id not in locale_ids and status != "Deleting"
+        ]
+        execute_plan(compile_teardown(stale), name="cleanup")
+
+    per_call = [("bot", bot), ("locale", locale), ("intents", intents)]
+    if mode == IMPORT_MODE:
+        per_call = [("import", bulk_import)] + [(name, unless_imported(func)) for name, func in per_call]
+    return per_call + [
+        ("alias", alias),
+        ("build", build),
+        ("wait_build", wait_build),
+        ("cleanup", cleanup),
+    ] + release_phases(definition, locale_ids)
+
+
+def checkpoint_key(event):
+    return f"{event['LogicalResourceId']}/{event['RequestId']}"
+
+
+def get_bot_specs(properties):
+    """
+    :param properties: The properties of the custom resource
+    :return: The bots of the fleet listed in the botSpecs property, or None if the resource is a single bot.
+    Settings a spec leaves out are those of the single bot in the environment.
+    """
+    specs = properties.get("botSpecs")
+    if not specs:
+        return None
+    if isinstance(specs, str):
+        specs = json.loads(specs)
+    names = [spec["botName"] for spec in specs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Bot names {names} of the fleet are not unique")
+    placeholder = {"BotId": "x" * LEX_ID_LENGTH, "BotAliasId": "x" * LEX_ID_LENGTH}
+    if len(json.dumps(fleet_data({name: placeholder for name in names}))) > FLEET_DATA_MAX_BYTES:
+        raise ValueError(f"The ids of the {len(names)} bots of the fleet do not fit in a CloudFormation response")
+    return [
+        {
+            "botName": spec["botName"],
+            "botLanguages": get_bot_languages(spec.get("botLanguage"), spec.get("additionalBotLanguages")),
+            "childDirected": spec.get("childDirected", os.environ.get("childDirected")),
+            "botRole": spec.get("botRole", os.environ.get("botRole")),
+        }
+        for spec in specs
+    ]
+
+
+def fleet_data(bots):
+    """
+    :param bots: Dict of bot name to the status of the provisioned bot
+    :return: The response data of a fleet, the id and live alias id of each bot keyed by "<botName>.<attribute>"
+    """
+    data = {}
+    for name, bot in bots.items():
+        data[f"{name}.BotId"] = bot["BotId"]
+        data[f"{name}.BotAliasId"] = bot["BotAliasId"]
+    return data
+
+
+def provision_fleet_bot(spec, key, context, mode):
+    """
+    Run the phases of one bot of a fleet, checkpointed under its own key. Once the bot completes or fails, its
+    status replaces the checkpoint so that continuations do not provision it again.
+    A failure is reported in the status rather than raised, so that the other bots carry on.
+    :return: Dict of the status of the bot, with its ids once it is provisioned
+    """
+    state = checkpoint_store.load(key) or {}
+    if state.get("status") in ("Completed", "Failed"):
+        return state
+    phases = provisioning_phases(
+        spec["botName"], spec["botRole"], spec["childDirected"], spec["botLanguages"], context, mode
+    )
+    try:
+        run_phases(phases, state, checkpoint_store, key)
+    except ContinueInNewInvocation as error:
+        return {"status": "InProgress", "phase": str(error)}
+    except Exception as error:  # NOSONAR reported with the status of the fleet
+        logger.error(f"Failed to provision bot {spec['botName']}: {error}", exc_info=True)
+        status = {"status": "Failed", "reason": str(error)}
+    else:
+        status = {"status": "Completed", "BotId": state["botId"], "BotAliasId": state["liveBotAliasId"]}
+    checkpoint_store.save(key, status)
+    return status
+
+
+def provision_fleet(event, context, specs):
+    """
+    Provision the bots of a fleet at the same time. They share the rate limits of the clients and the deadline
+    of the invocation. Each bot is checkpointed in its own parameter, and bots that complete or fail are not
+    provisioned again by a continuation.
+    :return: The physical resource id of the fleet
+    """
+    key = checkpoint_key(event)
+    keys = {spec["botName"]: f"{key}/{spec['botName']}" for spec in specs}
+    mode = os.environ.get("provisioningMode")
+    tasks = [
+        Task(spec["botName"], lambda _, spec=spec: provision_fleet_bot(spec, keys[spec["botName"]], context, mode))
+        for spec in specs
+    ]
+    bots = run_tasks(tasks, max_workers=min(len(tasks), FLEET_MAX_WORKERS), name="fleet")
+    statuses = {spec["botName"]: bots[spec["botName"]]["status"] for spec in specs}
+    logger.info(json.dumps({"fleetStatus": statuses}))
+
+    if "InProgress" in statuses.values():
+        raise ContinueInNewInvocation("fleet")
+    for bot_key in keys.values():
+        checkpoint_store.delete(bot_key)
+    failed = {name: bot["reason"] for name, bot in bots.items() if bot["status"] == "Failed"}
+    if failed:
+        raise RuntimeError(f"Failed to provision bots {failed}")
+
+    helper.Data.update(fleet_data(bots))
+    return f"{event['LogicalResourceId']}Fleet"
+
+
+def bot_names(properties):
+    """
+    :param properties: The properties of the custom resource
+    :return: The names of the bots the resource holds, those of its fleet or its single bot
+    """
+    specs = get_bot_specs(properties)
+    return [spec["botName"] for spec in specs] if specs else [properties.get("botName")]
+
+
+def provision(event, context):
+    properties = event.get("ResourceProperties", {})
+    specs = get_bot_specs(properties)
+    physical_resource_id = provision_fleet(event, context, specs) if specs else provision_bot(event, context)
+    old_properties = event.get("OldResourceProperties")
+    if old_properties is None or not (specs or get_bot_specs(old_properties)):
+        return physical_resource_id
+    # a fleet keeps its physical id, also when it switches from or to a single bot, so that CloudFormation does not
+    # delete the old resource along with the bots the new one still holds. The bots it no longer holds are deleted here
+    names = bot_names(properties)
+    removed = [name for name in bot_names(old_properties) if name not in names]
+    if removed:
+        delete_bots(removed)
+    return event["PhysicalResourceId"]
+
+
+def provision_bot(event, context):
+    bot_languages = get_bot_languages()
     bot_name = os.environ.get("botName")
     bot_role_arn = os.environ.get("botRole")
     child_directed = os.environ.get("childDirected")
 
-    # Create Lex bot and intents
-    bot_id, bot_alias_id, locale_id = configure_lex_bot(
-        bot_name, bot_role_arn, child_directed, bot_language
-    )
-    create_bot_intents(bot_id, bot_alias_id, locale_id)
-    build_lex_bot(bot_id, locale_id)
+    key = checkpoint_key(event)
+    state = checkpoint_store.load(key) or {}
+    if state:
+        logger.info(f"Resuming after phases {state['completedPhases']}")
+    mode = os.environ.get("provisioningMode")
+    phases = provisioning_phases(bot_name, bot_role_arn, child_directed, bot_languages, context, mode)
+    run_phases(phases, state, checkpoint_store, key)
 
     # Send response to Cloudformation
-    helper.Data.update(BotId=bot_id, BotAliasId=bot_alias_id)
-    return bot_id
+    helper.Data.update(
+        BotId=state["botId"],
+        BotAliasId=state["liveBotAliasId"],
+        BotVersion=state["botVersion"],
+        TestBotAliasId=state["botAliasId"],
+    )
+    return state["botId"]
+
+
+@helper.create
+def create_resource(event, context):
+    return provision(event, context)
+
+
+def delete_bots(bot_names):
+    """
+    Delete bots at the same time, without waiting for Lex to complete the deletes
+    """
+    targets = []
+    for bot_name in bot_names:
+        bot_id = get_bot_id(bot_name)
+        if bot_id is None:
+            logger.info(f"Bot {bot_name} not found, nothing to delete.")
+        else:
+            targets.append(("bot", bot_id))
+    logger.info(execute_plan(compile_teardown(targets), name="delete bots"))
 
 
 @helper.delete
 def delete_resource(event, _):
     try:
         logger.info(event)
-        bot_id = get_bot_id()
-        response = client.delete_bot(botId=bot_id, skipResourceInUseCheck=True)
-        logger.info(response)
+        # the properties of the event name the bots this resource was created with, even after a rename
+        properties = event.get("ResourceProperties", {})
+        delete_bots(bot_names(properties))
 
     except Exception as e:
         logger.error(e)
         raise RuntimeError("Failed to delete Bot.")
 
 @helper.update
-def update_resource(event, _):
-    delete_resource(event, _)
-    bot_id = get_bot_id()
-    wait_for_bot_delete(bot_id)
-    create_resource(event, _)
+def update_resource(event, context):
+    return provision(event, context)
+
 
 def handler(event, context):
-    helper(event, context)
+    start_invocation(context)
+    start_trace()
+    reset_index()
+    try:
+        helper(event, context)
+    finally:
+        report_throttles()
+        report_trace()
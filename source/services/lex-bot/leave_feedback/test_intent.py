@@ -14,6 +14,7 @@ import os
 from unittest import TestCase, mock
 from mock import patch
 import botocore
+from shared.testing import distinct_ids
 
 mock_env_variables = {
     "botLanguage": "English",
@@ -24,11 +25,12 @@ mock_env_variables = {
 
 @patch.dict(os.environ, mock_env_variables)
 class LeaveFeedbackIntentTest(TestCase):
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_intent(self, mock_client):
-        from leave_feedback.intent import create_intent
-        create_intent(locale_id="en_US", bot_id="testid1234")
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from leave_feedback.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateIntent",
             {
                 "intentName": "LeaveFeedback",
@@ -38,22 +40,17 @@ class LeaveFeedbackIntentTest(TestCase):
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_slot(self, mock_client):
-        from leave_feedback.intent import create_slot
-        create_slot(
-            slot_name="firstName",
-            slot_type_id="testid1234",
-            intent_id="testid1234",
-            locale_id="en_US",
-            bot_id="testid1234",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from leave_feedback.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateSlot",
             {
                 "slotName": "firstName",
                 "description": "firstName information.",
-                "slotTypeId": "testid1234",
+                "slotTypeId": "AMAZON.FirstName",
                 "valueElicitationSetting": {
                     "slotConstraint": "Required",
                     "promptSpecification": {
@@ -72,25 +69,19 @@ class LeaveFeedbackIntentTest(TestCase):
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
                 "localeId": "en_US",
-                "intentId": "testid1234",
+                "intentId": "LeaveFeedbackId",
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_update_feedback_intent(self, mock_client):
-        from leave_feedback.intent import update_feedback_intent
-        update_feedback_intent(
-            intent_id="testid1234",
-            bot_id="testid1234",
-            locale_id="en_US",
-            firstname_slot_id="testid1234",
-            lastname_slot_id="testid1234",
-            feedback_slot_id="testid1234",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from leave_feedback.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "UpdateIntent",
             {
-                "intentId": "testid1234",
+                "intentId": "LeaveFeedbackId",
                 "intentName": "LeaveFeedback",
                 "description": "LeaveFeedback intent created by serverless bot.",
                 "sampleUtterances": [
@@ -116,9 +107,9 @@ class LeaveFeedbackIntentTest(TestCase):
                     }
                 },
                 "slotPriorities": [
-                    {"priority": 1, "slotId": "testid1234"},
-                    {"priority": 2, "slotId": "testid1234"},
-                    {"priority": 3, "slotId": "testid1234"},
+                    {"priority": 1, "slotId": "firstNameId"},
+                    {"priority": 2, "slotId": "lastNameId"},
+                    {"priority": 3, "slotId": "feedbackId"},
                 ],
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
@@ -128,11 +119,15 @@ class LeaveFeedbackIntentTest(TestCase):
 
     @patch("botocore.client.BaseClient._make_api_call")
     def test_update_bot_alias(self, mock_client):
-        from leave_feedback.intent import update_bot_alias
-        update_bot_alias(
-            bot_id="testid1234",
-            bot_alias_id="testid1234",
+        from shared.bot_definition import BotDefinition
+        from shared.bot_plan import compile_alias, execute_plan
+        from leave_feedback.intent import populate
+        definition = BotDefinition(
+            {}, {"botAliasName": "TestBotAlias", "description": "Created By Serverless Bot Framework", "botVersion": "DRAFT"}
         )
+        definition.add_locale("en_US")
+        populate(definition, "en_US", "English")
+        execute_plan(compile_alias(definition, "testid1234", "testid1234"))
         mock_client.assert_called_with(
             "UpdateBotAlias",
             {
@@ -152,28 +147,18 @@ class LeaveFeedbackIntentTest(TestCase):
             },
         )
 
-    @patch("leave_feedback.intent.update_bot_alias")
-    @patch("leave_feedback.intent.update_feedback_intent")
-    @patch("leave_feedback.intent.create_slot", return_value="testid1234")
-    @patch("leave_feedback.intent.create_intent", return_value="testid1234")
-    def test_create_feedback_intent(
-        self,
-        mock_create_intent,
-        mock_create_slot,
-        mock_update_feedback_intent,
-        mock_update_bot_alias,
-    ):
-        from leave_feedback.intent import create_feedback_intent
-        create_feedback_intent(bot_id="testid1234", locale_id="en_US", bot_alias_id="testid1234")
-        mock_create_intent.assert_called_with("testid1234", "en_US")
-        mock_create_slot.assert_has_calls(
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
+    def test_create_feedback_intent(self, mock_client):
+        from shared.testing import provision
+        from leave_feedback.intent import populate
+        provision(populate)
+        slots = [call.args[1] for call in mock_client.call_args_list if call.args[0] == "CreateSlot"]
+        self.assertCountEqual(
+            [(slot["slotName"], slot["slotTypeId"]) for slot in slots],
             [
-                mock.call("firstName", "AMAZON.FirstName", "testid1234", "en_US", "testid1234"),
-                mock.call("lastName", "AMAZON.LastName", "testid1234", "en_US", "testid1234"),
-                mock.call("feedback", "AMAZON.AlphaNumeric", "testid1234", "en_US", "testid1234"),
-            ]
-        )
-        mock_update_feedback_intent.assert_called_with(
-            "testid1234", "testid1234", "en_US", "testid1234", "testid1234", "testid1234"
+                ("firstName", "AMAZON.FirstName"),
+                ("lastName", "AMAZON.LastName"),
+                ("feedback", "AMAZON.AlphaNumeric"),
+            ],
         )
-        mock_update_bot_alias.assert_called_with("testid1234", "testid1234")
+        self.assertEqual(mock_client.call_args_list[-1].args[0], "UpdateIntent")
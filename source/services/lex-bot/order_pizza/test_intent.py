@@ -14,6 +14,7 @@ import os
 from unittest import TestCase, mock
 from mock import patch
 import botocore
+from shared.testing import distinct_ids
 
 mock_env_variables = {
     "botLanguage": "English",
@@ -23,11 +24,12 @@ mock_env_variables = {
 
 @patch.dict(os.environ, mock_env_variables)
 class OrderPizzaIntentTest(TestCase):
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_intent(self, mock_client):
-        from order_pizza.intent import create_intent
-        create_intent(locale_id="en_US", bot_id="testid1234")
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from order_pizza.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateIntent",
             {
                 "intentName": "PizzaOrder",
@@ -37,13 +39,12 @@ class OrderPizzaIntentTest(TestCase):
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_pizza_slot_type(self, mock_client):
-        from order_pizza.intent import create_pizza_slot_type
-        create_pizza_slot_type(
-            slot_type_name="PizzaType", bot_language="English", locale_id="en_US", bot_id="testid1234"
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from order_pizza.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateSlotType",
             {
                 "slotTypeName": "PizzaType",
@@ -60,22 +61,17 @@ class OrderPizzaIntentTest(TestCase):
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_slot(self, mock_client):
-        from order_pizza.intent import create_slot
-        create_slot(
-            slot_name="crust",
-            slot_type_id="testid1234",
-            intent_id="testid1234",
-            locale_id="en_US",
-            bot_id="testid1234",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from order_pizza.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateSlot",
             {
                 "slotName": "crust",
                 "description": "crust information.",
-                "slotTypeId": "testid1234",
+                "slotTypeId": "PizzaCrustId",
                 "valueElicitationSetting": {
                     "slotConstraint": "Required",
                     "promptSpecification": {
@@ -90,23 +86,19 @@ class OrderPizzaIntentTest(TestCase):
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
                 "localeId": "en_US",
-                "intentId": "testid1234",
+                "intentId": "PizzaOrderId",
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_update_order_intent(self, mock_client):
-        from order_pizza.intent import update_order_intent
-        update_order_intent(
-            intent_id="testid1234",
-            bot_id="testid1234",
-            locale_id="en_US",
-            slot_ids=["testid1234", "testid1234", "testid1234", "testid1234"],
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from order_pizza.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "UpdateIntent",
             {
-                "intentId": "testid1234",
+                "intentId": "PizzaOrderId",
                 "intentName": "PizzaOrder",
                 "description": "PizzaOrder intent created by serverless bot.",
                 "sampleUtterances": [
@@ -129,10 +121,10 @@ class OrderPizzaIntentTest(TestCase):
                     },
                 },
                 "slotPriorities": [
-                    {"priority": 1, "slotId": "testid1234"},
-                    {"priority": 2, "slotId": "testid1234"},
-                    {"priority": 3, "slotId": "testid1234"},
-                    {"priority": 4, "slotId": "testid1234"},
+                    {"priority": 1, "slotId": "typeId"},
+                    {"priority": 2, "slotId": "sizeId"},
+                    {"priority": 3, "slotId": "crustId"},
+                    {"priority": 4, "slotId": "countId"},
                 ],
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
@@ -140,38 +132,33 @@ class OrderPizzaIntentTest(TestCase):
             },
         )
 
-    @patch("order_pizza.intent.update_order_intent")
-    @patch("order_pizza.intent.create_pizza_slot_type", return_value="testid1234")
-    @patch("order_pizza.intent.create_slot", return_value="testid1234")
-    @patch("order_pizza.intent.create_intent", return_value={"intentId": "testid1234"})
-    def test_create_appointment_intent(
-        self,
-        mock_create_intent,
-        mock_create_slot,
-        mock_create_pizza_slot_type,
-        mock_update_order_intent,
-    ):
-        from order_pizza.intent import create_order_pizza_intent
-        create_order_pizza_intent(bot_id="testid1234", locale_id="en_US")
-
-        mock_create_intent.assert_called_with("testid1234", "en_US")
-        mock_create_pizza_slot_type.assert_has_calls(
-            [
-                mock.call("PizzaType", "English", "testid1234", "en_US"),
-                mock.call("PizzaSize", "English", "testid1234", "en_US"),
-                mock.call("PizzaCrust", "English", "testid1234", "en_US"),
-            ]
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
+    def test_create_order_pizza_intent(self, mock_client):
+        from shared.testing import provision
+        from order_pizza.intent import populate
+        provision(populate)
+        operations = [call.args[0] for call in mock_client.call_args_list]
+        self.assertEqual(operations.count("CreateSlotType"), 3)
+        self.assertEqual(operations.count("CreateSlot"), 4)
+        # the intent is completed once all of its slots exist
+        self.assertEqual(operations[-1], "UpdateIntent")
+        count_slot = next(
+            call.args[1] for call in mock_client.call_args_list if call.args[1].get("slotName") == "count"
         )
+        self.assertEqual(count_slot["slotTypeId"], "AMAZON.Number")
 
-        mock_create_slot.assert_has_calls(
-            [
-                mock.call("type", "testid1234", "testid1234", "en_US", "testid1234"),
-                mock.call("size", "testid1234", "testid1234", "en_US", "testid1234"),
-                mock.call("crust", "testid1234", "testid1234", "en_US", "testid1234"),
-                mock.call("count", "AMAZON.Number", "testid1234", "en_US", "testid1234"),
-            ]
-        )
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
+    def test_create_order_pizza_intent_keeps_slot_priorities(self, mock_client):
+        from shared.testing import provision
+        from order_pizza.intent import populate
+        provision(populate)
 
-        mock_update_order_intent.assert_called_with(
-            "testid1234", "testid1234", "en_US", ["testid1234", "testid1234", "testid1234", "testid1234"]
+        crust_slot = next(
+            call.args[1] for call in mock_client.call_args_list if call.args[1].get("slotName") == "crust"
+        )
+        self.assertEqual(crust_slot["slotTypeId"], "PizzaCrustId")
+        update_intent = mock_client.call_args_list[-1].args[1]
+        self.assertEqual(
+            [priority["slotId"] for priority in update_intent["slotPriorities"]],
+            ["typeId", "sizeId", "crustId", "countId"],
         )
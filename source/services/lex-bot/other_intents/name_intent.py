@@ -11,76 +11,89 @@
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
 import os
-from shared.client import get_client
-from shared.logger import get_logger
-
-client = get_client("lexv2-models")
-logger = get_logger(__name__)
-
-
-def closing_response(language):
-    bot_name = os.environ.get("botName")
-    closing_response_value = {
-        "English": {"value": f"My name is {bot_name}, how can I help you?"},
-        "French": {"value": f"Mon nom est {bot_name}, comment puis-je vous aider?"},
-        "Italian": {"value": f"Mi chiamo {bot_name}, come posso aiutarti?"},
-        "Spanish": {"value": f"Mi nombre es {bot_name}, en qué puedo ayudarte?"},
-        "German": {"value": f"Mein Name ist {bot_name}, wie kann ich Ihnen helfen?"},
-        "Japanese": {"value": f"私は{bot_name}です。どんな御用でしょうか"},
-    }
-    return closing_response_value[language]
+from shared.content_catalog import content
+
+
+CLOSING_RESPONSE = {
+    "English": {"value": "My name is {bot_name}, how can I help you?"},
+    "French": {"value": "Mon nom est {bot_name}, comment puis-je vous aider?"},
+    "Italian": {"value": "Mi chiamo {bot_name}, come posso aiutarti?"},
+    "Spanish": {"value": "Mi nombre es {bot_name}, en qué puedo ayudarte?"},
+    "German": {"value": "Mein Name ist {bot_name}, wie kann ich Ihnen helfen?"},
+    "Japanese": {"value": "私は{bot_name}です。どんな御用でしょうか"},
+}
+
+
+def closing_response(language, bot_name=None):
+    bot_name = bot_name or os.environ.get("botName")
+    return {"value": content(language, "name_intent.closing_response")["value"].format(bot_name=bot_name)}
+
+
+UTTERANCES = {
+    "English": [
+        {"utterance": "what is your name"},
+        {"utterance": "who are you"},
+    ],
+    "French": [
+        {"utterance": "quel est votre nom"},
+        {"utterance": "qui êtes-vous"},
+        {"utterance": "exemple de réponse simple"},
+    ],
+    "Italian": [
+        {"utterance": "come ti chiami"},
+        {"utterance": "qual è il tuo nome"},
+        {"utterance": "tu chi sei"},
+    ],
+    "Spanish": [
+        {"utterance": "cual es tu nombre"},
+        {"utterance": "Quien eres tu"},
+    ],
+    "German": [
+        {"utterance": "wie heißen Sie"},
+        {"utterance": "wer bist du"},
+    ],
+    "Japanese": [
+        {"utterance": "名前"},
+        {"utterance": "名前はなんですか"},
+        {"utterance": "あなたのことを教えて"},
+    ],
+}
+
 
 def utterances(language):
-    utterance_values = {
-        "English": [
-            {"utterance": "what is your name"},
-            {"utterance": "who are you"},
-        ],
-        "French": [
-            {"utterance": "quel est votre nom"},
-            {"utterance": "qui êtes-vous"},
-            {"utterance": "exemple de réponse simple"},
-        ],
-        "Italian": [
-            {"utterance": "come ti chiami"},
-            {"utterance": "qual è il tuo nome"},
-            {"utterance": "tu chi sei"},
-        ],
-        "Spanish": [
-            {"utterance": "cual es tu nombre"},
-            {"utterance": "Quien eres tu"},
-        ],
-        "German": [
-            {"utterance": "wie heißen Sie"},
-            {"utterance": "wer bist du"},
-        ],
-        "Japanese": [
-            {"utterance": "名前"},
-            {"utterance": "名前はなんですか"},
-            {"utterance": "あなたのことを教えて"},
-        ],
-    }
-    return utterance_values[language]
-
-def create_name_intent(bot_id, locale_id):
-    bot_language = os.environ.get("botLanguage")
-    intent_response = client.create_intent(
-        intentName="Name",
-        description="Name intent created by serverless bot.",
-        botId=bot_id,
-        botVersion="DRAFT",
-        localeId=locale_id,
-        sampleUtterances=utterances(bot_language),
-        dialogCodeHook={"enabled": False},
-        fulfillmentCodeHook={"enabled": False},
-        intentClosingSetting={
+    return content(language, "name_intent.utterances")
+
+
+CONTENT = {
+    "closing_response": CLOSING_RESPONSE,
+    "utterances": UTTERANCES,
+}
+
+
+def intent_settings(bot_language, bot_name=None):
+    return {
+        "intentName": "Name",
+        "description": "Name intent created by serverless bot.",
+        "sampleUtterances": utterances(bot_language),
+        "dialogCodeHook": {"enabled": False},
+        "fulfillmentCodeHook": {"enabled": False},
+        "intentClosingSetting": {
             "closingResponse": {
                 "messageGroups": [
-                    {"message": {"plainTextMessage": closing_response(bot_language)}},
+                    {"message": {"plainTextMessage": closing_response(bot_language, bot_name)}},
                 ],
                 "allowInterrupt": True,
             }
         },
-    )
-    logger.info(intent_response)
+    }
+
+
+def intent_definition(bot_language, bot_name=None):
+    """
+    Desired state of the Name intent, which has no slots
+    """
+    return dict(intent_settings(bot_language, bot_name), slotTypes=[], slots=[])
+
 
+def populate(definition, locale_id, bot_language):
+    definition.add_intent(locale_id, intent_definition(bot_language, definition.bot_settings.get("botName")))
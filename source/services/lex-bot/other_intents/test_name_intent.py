@@ -14,6 +14,7 @@ import os
 from unittest import TestCase, mock
 from mock import patch
 import botocore
+from shared.testing import distinct_ids
 
 mock_env_variables = {
     "botLanguage": "English",
@@ -84,11 +85,12 @@ class BookAppointmentIntentTest(TestCase):
 
         self.assertRaises(KeyError, utterances, "invalidLanguage")
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_name_intent(self, mock_client):
-        from other_intents.name_intent import create_name_intent
-        create_name_intent(locale_id="en_US", bot_id="testid1234")
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from other_intents.name_intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateIntent",
             {
                 "intentName": "Name",
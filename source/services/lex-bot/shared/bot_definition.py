@@ -0,0 +1,74 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import copy
+import json
+import hashlib
+
+
+class BotDefinition:
+    """
+    In-memory definition of a Lex bot. Settings are kept as dicts using the lexv2-models request parameter names,
+    intents additionally carry their slotTypes and their slots (in priority order, referencing slot types by name).
+    """
+
+    def __init__(self, bot_settings, alias_settings):
+        self.bot_settings = bot_settings
+        self.alias_settings = dict(alias_settings, botAliasLocaleSettings={})
+        self.locales = {}
+
+    def add_locale(self, locale_id, **locale_settings):
+        if locale_id in self.locales:
+            raise ValueError(f"Locale {locale_id} is already defined")
+        self.locales[locale_id] = {"settings": locale_settings, "intents": []}
+
+    def add_intent(self, locale_id, intent):
+        if any(existing["intentName"] == intent["intentName"] for existing in self.intents(locale_id)):
+            raise ValueError(f"Intent {intent['intentName']} is already defined for locale {locale_id}")
+        self.locales[locale_id]["intents"].append(intent)
+
+    def set_alias_locale_settings(self, locale_id, locale_settings):
+        self.alias_settings["botAliasLocaleSettings"][locale_id] = locale_settings
+
+    def locale_settings(self, locale_id):
+        return self.locales[locale_id]["settings"]
+
+    def intents(self, locale_id):
+        return self.locales[locale_id]["intents"]
+
+    def slot_types(self, locale_id):
+        """
+        :return: Dict of slot type name to slot type definition, for all intents of the locale
+        :raises ValueError: if two intents define the same slot type differently
+        """
+        slot_types = {}
+        for intent in self.intents(locale_id):
+            for slot_type in intent["slotTypes"]:
+                name = slot_type["slotTypeName"]
+                if name in slot_types and slot_types[name] != slot_type:
+                    raise ValueError(f"Slot type {name} has conflicting definitions in locale {locale_id}")
+                slot_types[name] = slot_type
+        return slot_types
+
+    def fingerprint(self, locale_id):
+        """
+        :return: Stable hash of the definition of a locale, which is everything a build of the locale depends on
+        """
+        content = json.dumps(self.locales[locale_id], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def to_dict(self):
+        return copy.deepcopy({
+            "bot": self.bot_settings,
+            "alias": self.alias_settings,
+            "locales": self.locales,
+        })
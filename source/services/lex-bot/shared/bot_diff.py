@@ -0,0 +1,157 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+from shared.client import get_client
+from shared.executor import Task, run_tasks
+from shared.resource_index import list_resources
+
+client = get_client("lexv2-models")
+
+INTENT_KEYS = (
+    "intentName",
+    "description",
+    "sampleUtterances",
+    "dialogCodeHook",
+    "fulfillmentCodeHook",
+    "intentConfirmationSetting",
+    "intentClosingSetting",
+)
+SLOT_KEYS = ("description", "slotTypeName", "valueElicitationSetting", "obfuscationSetting")
+SLOT_TYPE_KEYS = ("description", "slotTypeValues", "valueSelectionSetting")
+# intents every locale is created with, they are not managed by the intent modules
+BUILT_IN_INTENTS = ("FallbackIntent",)
+
+
+def matches(desired, current):
+    """
+    Compare a desired value with the one described by Lex. Keys Lex adds with default values are ignored.
+    """
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(matches(value, current.get(key)) for key, value in desired.items())
+    if isinstance(desired, list):
+        return (
+            isinstance(current, list)
+            and len(desired) == len(current)
+            and all(matches(value, current_value) for value, current_value in zip(desired, current))
+        )
+    return desired == current
+
+
+def differs(desired, current, keys):
+    """
+    :return: True if any of the managed keys differs between the desired and the current definition
+    """
+    for key in keys:
+        if key not in desired:
+            if current.get(key) is not None:
+                return True
+        elif not matches(desired[key], current.get(key)):
+            return True
+    return False
+
+
+def read_intent(intent_id, params):
+    intent = client.describe_intent(intentId=intent_id, **params)
+    slot_summaries = list_resources("slots", intentId=intent_id, **params).values()
+    tasks = [
+        Task(summary["slotName"], lambda _, slot_id=summary["slotId"]: client.describe_slot(
+            slotId=slot_id, intentId=intent_id, **params
+        ))
+        for summary in slot_summaries
+    ]
+    intent["slots"] = run_tasks(tasks, name=f"read {intent['intentName']}") if tasks else {}
+    slot_names = {slot["slotId"]: name for name, slot in intent["slots"].items()}
+    priorities = sorted(intent.get("slotPriorities", []), key=lambda priority: priority["priority"])
+    intent["slotOrder"] = [slot_names[priority["slotId"]] for priority in priorities if priority["slotId"] in slot_names]
+    return intent
+
+
+def read_locale(bot_id, locale_id):
+    """
+    Read the DRAFT definition of a bot locale
+    :return: Dict with the slotTypes and intents (including their slots) of the locale, keyed by name
+    """
+    params = {"botId": bot_id, "botVersion": "DRAFT", "localeId": locale_id}
+    slot_type_summaries = list_resources("slotTypes", **params).values()
+    intent_summaries = [
+        summary
+        for summary in list_resources("intents", **params).values()
+        if summary["intentName"] not in BUILT_IN_INTENTS
+    ]
+    tasks = [
+        Task(f"slotType:{summary['slotTypeName']}", lambda _, slot_type_id=summary["slotTypeId"]: (
+            client.describe_slot_type(slotTypeId=slot_type_id, **params)
+        ))
+        for summary in slot_type_summaries
+    ] + [
+        Task(f"intent:{summary['intentName']}", lambda _, intent_id=summary["intentId"]: read_intent(intent_id, params))
+        for summary in intent_summaries
+    ]
+    results = run_tasks(tasks, name="read locale") if tasks else {}
+    slot_types = {result["slotTypeName"]: result for key, result in results.items() if key.startswith("slotType:")}
+    intents = {result["intentName"]: result for key, result in results.items() if key.startswith("intent:")}
+
+    # slots reference custom slot types by id and built-in slot types by name
+    slot_type_names = {slot_type["slotTypeId"]: name for name, slot_type in slot_types.items()}
+    for intent in intents.values():
+        for slot in intent["slots"].values():
+            slot["slotTypeName"] = slot_type_names.get(slot["slotTypeId"], slot["slotTypeId"])
+    return {"slotTypes": slot_types, "intents": intents}
+
+
+def diff_locale(desired_intents, current):
+    """
+    Compare the desired intent definitions of a locale with its current DRAFT definition
+    :param desired_intents: List of intent definitions, as returned by the intent_definition functions
+    :param current: The current definition, as returned by read_locale
+    :return: List of (action, kind, name) changes. Slot names are (intent name, slot name) tuples.
+    """
+    changes = []
+    desired_slot_types = {
+        slot_type["slotTypeName"]: slot_type for intent in desired_intents for slot_type in intent["slotTypes"]
+    }
+    for name, slot_type in desired_slot_types.items():
+        if name not in current["slotTypes"]:
+            changes.append(("create", "slotType", name))
+        elif differs(slot_type, current["slotTypes"][name], SLOT_TYPE_KEYS):
+            changes.append(("update", "slotType", name))
+
+    for intent in desired_intents:
+        name = intent["intentName"]
+        current_intent = current["intents"].get(name)
+        if current_intent is None:
+            changes.append(("create", "intent", name))
+            changes.extend(("create", "slot", (name, slot["slotName"])) for slot in intent["slots"])
+            if intent["slots"]:
+                # an intent with slots is only completed once its slots exist
+                changes.append(("update", "intent", name))
+            continue
+
+        slot_order = [slot["slotName"] for slot in intent["slots"]]
+        for slot in intent["slots"]:
+            current_slot = current_intent["slots"].get(slot["slotName"])
+            if current_slot is None:
+                changes.append(("create", "slot", (name, slot["slotName"])))
+            elif differs(slot, current_slot, SLOT_KEYS):
+                changes.append(("update", "slot", (name, slot["slotName"])))
+        if differs(intent, current_intent, INTENT_KEYS) or slot_order != current_intent["slotOrder"]:
+            changes.append(("update", "intent", name))
+        changes.extend(
+            ("delete", "slot", (name, slot_name)) for slot_name in current_intent["slots"] if slot_name not in slot_order
+        )
+
+    desired_intent_names = [intent["intentName"] for intent in desired_intents]
+    changes.extend(("delete", "intent", name) for name in current["intents"] if name not in desired_intent_names)
+    changes.extend(
+        ("delete", "slotType", name) for name in current["slotTypes"] if name not in desired_slot_types
+    )
+    return changes
@@ -0,0 +1,167 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import io
+import json
+import base64
+import hashlib
+import zipfile
+import urllib.request
+from shared.client import get_client
+from shared.logger import get_logger
+from shared.waiter import wait_for_status
+
+client = get_client("lexv2-models")
+logger = get_logger(__name__)
+
+MANIFEST = {"metadata": {"schemaVersion": "1", "fileFormat": "LexJson", "resourceType": "Bot"}}
+# every locale needs a fallback intent, the per-call path gets it from CreateBotLocale
+FALLBACK_INTENT = {
+    "name": "FallbackIntent",
+    "description": "Default intent when no other intent matches",
+    "parentIntentSignature": "AMAZON.FallbackIntent",
+}
+UPLOAD_TIMEOUT_SECONDS = 30
+
+
+def identifier(*path):
+    """
+    :return: A stable 10 character identifier for a resource of the archive. Lex assigns its own ids on import.
+    """
+    digest = hashlib.sha256("/".join(path).encode("utf-8")).digest()
+    return base64.b32encode(digest).decode("ascii")[:10]
+
+
+def render_slot_type(slot_type, locale_id):
+    rendered = {key: value for key, value in slot_type.items() if key != "slotTypeName"}
+    return dict(
+        rendered,
+        name=slot_type["slotTypeName"],
+        identifier=identifier(locale_id, "slotType", slot_type["slotTypeName"]),
+    )
+
+
+def render_intent(intent, locale_id):
+    rendered = {key: value for key, value in intent.items() if key not in ("intentName", "slotTypes", "slots")}
+    return dict(
+        rendered,
+        name=intent["intentName"],
+        identifier=identifier(locale_id, "intent", intent["intentName"]),
+        slotPriorities=[
+            {"priority": priority, "slotName": slot["slotName"]}
+            for priority, slot in enumerate(intent["slots"], start=1)
+        ],
+    )
+
+
+def render_slot(slot, intent_name, locale_id):
+    rendered = {key: value for key, value in slot.items() if key != "slotName"}
+    return dict(rendered, name=slot["slotName"], identifier=identifier(locale_id, intent_name, slot["slotName"]))
+
+
+def render_files(definition):
+    """
+    Render a bot definition into the files of the Lex JSON import format
+    :param definition: The desired BotDefinition
+    :return: Dict of archive path to the JSON document of the file
+    """
+    bot_name = definition.bot_settings["botName"]
+    files = {
+        "Manifest.json": MANIFEST,
+        f"{bot_name}/Bot.json": {
+            "name": bot_name,
+            "version": "DRAFT",
+            "description": definition.bot_settings.get("description"),
+            "identifier": identifier(bot_name),
+            "dataPrivacy": definition.bot_settings["dataPrivacy"],
+            "idleSessionTTLInSeconds": definition.bot_settings["idleSessionTTLInSeconds"],
+        },
+    }
+    for locale_id in definition.locales:
+        locale_path = f"{bot_name}/BotLocales/{locale_id}"
+        settings = definition.locale_settings(locale_id)
+        files[f"{locale_path}/BotLocale.json"] = {
+            "identifier": locale_id,
+            "version": None,
+            "description": settings.get("description"),
+            "voiceSettings": settings.get("voiceSettings"),
+            "nluConfidenceThreshold": settings.get("nluIntentConfidenceThreshold"),
+        }
+        for name, slot_type in definition.slot_types(locale_id).items():
+            files[f"{locale_path}/SlotTypes/{name}/SlotType.json"] = render_slot_type(slot_type, locale_id)
+        files[f"{locale_path}/Intents/FallbackIntent/Intent.json"] = dict(
+            FALLBACK_INTENT, identifier=identifier(locale_id, "intent", "FallbackIntent")
+        )
+        for intent in definition.intents(locale_id):
+            intent_path = f"{locale_path}/Intents/{intent['intentName']}"
+            files[f"{intent_path}/Intent.json"] = render_intent(intent, locale_id)
+            for slot in intent["slots"]:
+                files[f"{intent_path}/Slots/{slot['slotName']}/Slot.json"] = render_slot(
+                    slot, intent["intentName"], locale_id
+                )
+    return files
+
+
+def render_archive(definition):
+    """
+    :return: The import archive of a bot definition as zip file bytes, built in memory
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, document in render_files(definition).items():
+            archive.writestr(path, json.dumps(document, indent=2, ensure_ascii=False))
+    return buffer.getvalue()
+
+
+def upload_archive(upload_url, archive):
+    request = urllib.request.Request(upload_url, data=archive, method="PUT")
+    with urllib.request.urlopen(request, timeout=UPLOAD_TIMEOUT_SECONDS) as response:  # NOSONAR presigned https url
+        logger.info(f"Uploaded {len(archive)} bytes import archive, status {response.status}")
+
+
+def start_bot_import(definition, bot_tags):
+    """
+    Upload the import archive of a bot definition and start importing it, replacing the DRAFT version of the bot
+    if it already exists
+    :return: The import id
+    """
+    upload = client.create_upload_url()
+    upload_archive(upload["uploadUrl"], render_archive(definition))
+    settings = definition.bot_settings
+    response = client.start_import(
+        importId=upload["importId"],
+        resourceSpecification={
+            "botImportSpecification": {
+                "botName": settings["botName"],
+                "roleArn": settings["roleArn"],
+                "dataPrivacy": settings["dataPrivacy"],
+                "idleSessionTTLInSeconds": settings["idleSessionTTLInSeconds"],
+                "botTags": bot_tags,
+            }
+        },
+        mergeStrategy="Overwrite",
+    )
+    logger.info(response)
+    return response["importId"]
+
+
+def wait_for_import(import_id):
+    """
+    :return: The id of the imported bot
+    """
+    response = wait_for_status(
+        client, "describe_import", {"importId": import_id}, "importStatus", ("InProgress",), resource="import"
+    )
+    if response["importStatus"] != "Completed":
+        logger.error(response)
+        raise RuntimeError(f"Failed to import Lex bot: {response.get('failureReasons')}")
+    return response["importedResourceId"]
@@ -0,0 +1,378 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import json
+from collections import Counter
+import botocore
+from shared.client import get_client
+from shared.logger import get_logger
+from shared.executor import Task, run_tasks
+from shared.waiter import wait_for_status
+from shared.bot_diff import INTENT_KEYS
+from shared.resource_index import CREATE_OPERATIONS, DELETE_OPERATIONS, create_or_reuse, forget_resource
+
+client = get_client("lexv2-models")
+logger = get_logger(__name__)
+
+PLAN_CONCURRENCY = 6
+# kind of teardown target: (delete operation, parameters identifying the target after botId).
+# Deleting a target deletes the targets it contains: a bot its locales, a locale its slot types and intents,
+# an intent its slots.
+TEARDOWN_TARGETS = {
+    "slot": ("delete_slot", ("localeId", "intentId", "slotId")),
+    "intent": ("delete_intent", ("localeId", "intentId")),
+    "slotType": ("delete_slot_type", ("localeId", "slotTypeId")),
+    "locale": ("delete_bot_locale", ("localeId",)),
+    "bot": ("delete_bot", ()),
+}
+TEARDOWN_OPERATIONS = {operation for operation, _ in TEARDOWN_TARGETS.values()}
+
+
+class Ref:
+    """
+    A request parameter that is only known once another step of the plan has run, for example the id it created
+    """
+
+    def __init__(self, step, key):
+        self.step = step
+        self.key = key
+
+    def __eq__(self, other):
+        return isinstance(other, Ref) and (self.step, self.key) == (other.step, other.key)
+
+    def __repr__(self):
+        return f"<{self.step}.{self.key}>"
+
+
+class Step:
+    """
+    A single lexv2-models call of a plan
+    :param name: Unique name of the step
+    :param operation: The client method to call, for example create_intent
+    :param params: Request parameters, values may be Ref
+    :param depends_on: Steps that must run first, in addition to the steps referenced by params
+    :param locale_id: Locale the step belongs to
+    :param intent: Intent the step belongs to, if any
+    """
+
+    def __init__(self, name, operation, params, depends_on=(), locale_id=None, intent=None):
+        self.name = name
+        self.operation = operation
+        self.params = params
+        self.depends_on = tuple(dict.fromkeys(tuple(depends_on) + tuple(ref.step for ref in find_refs(params))))
+        self.locale_id = locale_id
+        self.intent = intent
+
+    def __repr__(self):
+        return f"Step({self.name!r})"
+
+
+def find_refs(value):
+    if isinstance(value, Ref):
+        return [value]
+    if isinstance(value, dict):
+        return [ref for item in value.values() for ref in find_refs(item)]
+    if isinstance(value, list):
+        return [ref for item in value for ref in find_refs(item)]
+    return []
+
+
+def resolve(value, results):
+    if isinstance(value, Ref):
+        return results[value.step][value.key]
+    if isinstance(value, dict):
+        return {key: resolve(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve(item, results) for item in value]
+    return value
+
+
+def compile_changes(definition, locale_id, bot_id, current, changes):
+    """
+    Compile the changes of a locale into a dependency-ordered plan
+    :param definition: The desired BotDefinition
+    :param locale_id: The locale the changes apply to
+    :param bot_id: Id of the bot
+    :param current: The current definition of the locale, as returned by bot_diff.read_locale
+    :param changes: List of (action, kind, name) changes, as returned by bot_diff.diff_locale
+    :return: List of Step
+    """
+    params = {"botId": bot_id, "botVersion": "DRAFT", "localeId": locale_id}
+    intents = {intent["intentName"]: intent for intent in definition.intents(locale_id)}
+    slot_types = definition.slot_types(locale_id)
+    actions = {(action, kind, name) for action, kind, name in changes}
+
+    def step_name(operation, name):
+        return f"{operation}:{locale_id}:{name}"
+
+    def slot_type_id(name):
+        if ("create", "slotType", name) in actions:
+            return Ref(step_name("create_slot_type", name), "slotTypeId")
+        if name in current["slotTypes"]:
+            return current["slotTypes"][name]["slotTypeId"]
+        return name  # built-in slot type
+
+    def intent_id(name):
+        if ("create", "intent", name) in actions:
+            return Ref(step_name("create_intent", name), "intentId")
+        return current["intents"][name]["intentId"]
+
+    def slot_id(intent_name, slot_name):
+        if ("create", "slot", (intent_name, slot_name)) in actions:
+            return Ref(step_name("create_slot", f"{intent_name}.{slot_name}"), "slotId")
+        return current["intents"][intent_name]["slots"][slot_name]["slotId"]
+
+    def slot_definition(intent_name, slot_name):
+        return next(slot for slot in intents[intent_name]["slots"] if slot["slotName"] == slot_name)
+
+    steps = []
+    for action, kind, name in changes:
+        if kind == "slotType" and action == "create":
+            steps.append(Step(
+                step_name("create_slot_type", name), "create_slot_type", dict(slot_types[name], **params),
+                locale_id=locale_id,
+            ))
+        elif kind == "slotType" and action == "update":
+            steps.append(Step(
+                step_name("update_slot_type", name), "update_slot_type",
+                dict(slot_types[name], slotTypeId=current["slotTypes"][name]["slotTypeId"], **params),
+                locale_id=locale_id,
+            ))
+        elif kind == "intent" and action == "create":
+            intent = intents[name]
+            settings = {key: value for key, value in intent.items() if key in INTENT_KEYS}
+            if intent["slots"]:
+                # the intent is completed with its slot priorities once the slots exist
+                settings = {"intentName": name}
+            steps.append(Step(
+                step_name("create_intent", name), "create_intent", dict(settings, **params),
+                locale_id=locale_id, intent=name,
+            ))
+
+    for action, kind, name in changes:
+        if kind == "slot" and action in ("create", "update"):
+            intent_name, slot_name = name
+            slot = slot_definition(intent_name, slot_name)
+            slot_params = {key: value for key, value in slot.items() if key != "slotTypeName"}
+            slot_params.update(slotTypeId=slot_type_id(slot["slotTypeName"]), intentId=intent_id(intent_name))
+            depends_on = []
+            if ("update", "slotType", slot["slotTypeName"]) in actions:
+                depends_on.append(step_name("update_slot_type", slot["slotTypeName"]))
+            if action == "update":
+                slot_params["slotId"] = slot_id(intent_name, slot_name)
+            steps.append(Step(
+                step_name(f"{action}_slot", f"{intent_name}.{slot_name}"), f"{action}_slot",
+                dict(slot_params, **params), depends_on=depends_on, locale_id=locale_id, intent=intent_name,
+            ))
+
+    for action, kind, name in changes:
+        if kind == "intent" and action == "update":
+            intent = intents[name]
+            steps.append(Step(
+                step_name("update_intent", name),
+                "update_intent",
+                dict(
+                    {key: value for key, value in intent.items() if key in INTENT_KEYS},
+                    intentId=intent_id(name),
+                    slotPriorities=[
+                        {"priority": priority, "slotId": slot_id(name, slot["slotName"])}
+                        for priority, slot in enumerate(intent["slots"], start=1)
+                    ],
+                    **params,
+                ),
+                depends_on=[step.name for step in steps if step.intent == name],
+                locale_id=locale_id,
+                intent=name,
+            ))
+
+    def slot_target(intent_name, slot_name):
+        return ("slot", bot_id, locale_id, current["intents"][intent_name]["intentId"],
+                current["intents"][intent_name]["slots"][slot_name]["slotId"])
+
+    targets, names, after, references = [], {}, {}, {}
+    for action, kind, name in changes:
+        if action == "delete" and kind == "slot":
+            target = slot_target(*name)
+            names[target] = f"{locale_id}:{name[0]}.{name[1]}"
+            # the intent stops listing the slot in its priorities first
+            if ("update", "intent", name[0]) in actions:
+                after[target] = [step_name("update_intent", name[0])]
+        elif action == "delete" and kind == "intent":
+            target = ("intent", bot_id, locale_id, current["intents"][name]["intentId"])
+            names[target] = f"{locale_id}:{name}"
+        elif action == "delete" and kind == "slotType":
+            target = ("slotType", bot_id, locale_id, current["slotTypes"][name]["slotTypeId"])
+            names[target] = f"{locale_id}:{name}"
+            using = [
+                (intent_name, slot_name)
+                for intent_name, intent in current["intents"].items()
+                for slot_name, slot in intent["slots"].items() if slot.get("slotTypeName") == name
+            ]
+            # a slot type can only be deleted once no slot references it anymore
+            references[target] = [slot_target(*slot) for slot in using]
+            after[target] = [
+                step_name("update_slot", f"{intent_name}.{slot_name}") for intent_name, slot_name in using
+                if ("update", "slot", (intent_name, slot_name)) in actions
+            ]
+        else:
+            continue
+        targets.append(target)
+    return steps + compile_teardown(targets, references, after, names=names)
+
+
+def contains(outer, inner):
+    """
+    :return: True if deleting the outer target deletes the inner one
+    """
+    return len(outer) < len(inner) and inner[1:len(outer)] == outer[1:]
+
+
+def narrowest(targets):
+    """
+    :return: The targets that are not deleted along with another target, without duplicates
+    """
+    targets = list(dict.fromkeys(targets))
+    return [target for target in targets if not any(contains(other, target) for other in targets)]
+
+
+def compile_teardown(targets, references=None, after=None, names=None):
+    """
+    Compile the deletion of resources at the narrowest scope: slot, intent, slot type, locale, bot.
+    Targets inside another target are deleted along with it. Other deletes run at the same time, except for slot
+    types, deleted after the slots using them. Lex completes the deletes of bots and locales in the background,
+    they are not waited for: creating the bot or locale again waits until it is gone.
+    :param targets: Tuples of (kind of TEARDOWN_TARGETS, bot id, ids of the target)
+    :param references: Dict of slot type target to the slot targets using it
+    :param after: Dict of target to the names of steps of the same plan to run before it is deleted
+    :param names: Dict of target to the name of its steps, defaults to its ids
+    :return: List of Step
+    """
+    kept = narrowest(targets)
+    names = names or {}
+
+    def target_name(target):
+        return names.get(target) or ":".join(target[1:])
+
+    def delete_step_name(target):
+        return f"{TEARDOWN_TARGETS[target[0]][0]}:{target_name(target)}"
+
+    steps = []
+    for target in kept:
+        kind, bot_id, *ids = target
+        operation, id_keys = TEARDOWN_TARGETS[kind]
+        params = dict(zip(id_keys, ids), botId=bot_id)
+        if kind == "bot":
+            params["skipResourceInUseCheck"] = True
+        else:
+            params["botVersion"] = "DRAFT"
+        depends_on = list((after or {}).get(target, ()))
+        for slot in (references or {}).get(target, ()):
+            container = next((other for other in kept if other == slot or contains(other, slot)), None)
+            if container is not None:
+                depends_on.append(delete_step_name(container))
+        steps.append(Step(
+            delete_step_name(target), operation, params, depends_on=depends_on, locale_id=params.get("localeId")
+        ))
+    return steps
+
+
+def wait_for_deleted(describe, params, status_key, resource):
+    try:
+        response = wait_for_status(client, describe, params, status_key, ("Deleting",), resource=resource)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] != "ResourceNotFoundException":
+            logger.error(error)
+            raise RuntimeError(f"Failed to delete Lex {resource}.")
+        logger.info(f"Lex {resource} {params} deleted.")
+        return
+    if response[status_key] == "Failed":
+        logger.error(response)
+        raise RuntimeError(f"Failed to delete Lex {resource}.")
+
+
+def wait_for_bot_delete(bot_id):
+    wait_for_deleted("describe_bot", {"botId": bot_id}, "botStatus", "bot")
+
+
+def wait_for_bot_locale_delete(bot_id, locale_id):
+    wait_for_deleted(
+        "describe_bot_locale", {"botId": bot_id, "botVersion": "DRAFT", "localeId": locale_id}, "botLocaleStatus",
+        "locale",
+    )
+
+
+def compile_alias(definition, bot_id, bot_alias_id):
+    """
+    Compile the update of the bot alias, which connects every locale to its code hook
+    """
+    return [Step(
+        "update_bot_alias",
+        "update_bot_alias",
+        dict(definition.alias_settings, botAliasId=bot_alias_id, botId=bot_id),
+    )]
+
+
+def delete(operation, params):
+    """
+    Delete a resource, which is done if it is already gone, for example after an interrupted invocation
+    """
+    try:
+        return getattr(client, operation)(**params)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] != "ResourceNotFoundException":
+            raise
+        logger.info(f"Nothing to {operation}, {params} not found")
+        return {}
+
+
+def execute_plan(steps, max_workers=PLAN_CONCURRENCY, name="plan"):
+    """
+    Run the calls of a plan, each as soon as the steps it depends on have completed.
+    Creates reuse resources the listings of this invocation already show, deletes of resources already gone
+    succeed.
+    :return: Dict of step name to the response of its call
+    """
+    def call(step):
+        def func(results):
+            params = resolve(step.params, results)
+            if step.operation in CREATE_OPERATIONS:
+                response = create_or_reuse(step.operation, params)
+            elif step.operation in TEARDOWN_OPERATIONS or step.operation in DELETE_OPERATIONS:
+                response = delete(step.operation, params)
+            else:
+                response = getattr(client, step.operation)(**params)
+            if step.operation in DELETE_OPERATIONS:
+                forget_resource(step.operation, params)
+            logger.debug(response)
+            return response
+        return func
+
+    tasks = [Task(step.name, call(step), depends_on=step.depends_on) for step in steps]
+    return run_tasks(tasks, max_workers=max_workers, name=name) if tasks else {}
+
+
+def dry_run(steps):
+    """
+    :return: The calls of a plan as JSON lines, with the values of other steps shown as <step.key>
+    """
+    return [
+        json.dumps({"step": step.name, "operation": step.operation, "params": step.params, "dependsOn": step.depends_on},
+                   default=repr, ensure_ascii=False)
+        for step in steps
+    ]
+
+
+def count_calls(steps):
+    """
+    :return: Counter of the number of calls per operation of a plan
+    """
+    return Counter(step.operation for step in steps)
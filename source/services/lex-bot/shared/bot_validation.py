@@ -0,0 +1,147 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import re
+
+# Lex V2 limits, in characters
+MAX_NAME_LENGTH = 100
+MAX_DESCRIPTION_LENGTH = 200
+MAX_UTTERANCE_LENGTH = 200
+MAX_MESSAGE_LENGTH = 1000
+MAX_SLOT_VALUE_LENGTH = 140
+SLOT_REFERENCE = re.compile(r"\{([^{}]*)\}")
+BUILT_IN_SLOT_TYPE_PREFIX = "AMAZON."
+
+
+class DefinitionError(ValueError):
+    """
+    Raised when the content of a bot definition would be rejected by Lex, with every problem found
+    """
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__(f"{len(problems)} problems in the bot definition: " + "; ".join(problems))
+
+
+def normalize_utterance(utterance):
+    return " ".join(utterance.casefold().split())
+
+
+def plain_text_messages(setting):
+    """
+    :return: The values of all plain text messages nested in an intent or slot setting
+    """
+    if isinstance(setting, dict):
+        for key, value in setting.items():
+            if key == "plainTextMessage" and isinstance(value, dict):
+                yield value.get("value")
+            else:
+                yield from plain_text_messages(value)
+    elif isinstance(setting, list):
+        for value in setting:
+            yield from plain_text_messages(value)
+
+
+def check_length(problems, where, what, value, maximum):
+    if not isinstance(value, str) or not value.strip():
+        problems.append(f"{where}: {what} is empty")
+    elif len(value) > maximum:
+        problems.append(f"{where}: {what} has {len(value)} characters, more than {maximum}")
+
+
+def check_references(problems, where, what, text, slot_names):
+    if not isinstance(text, str):
+        return
+    for reference in SLOT_REFERENCE.findall(text):
+        if reference not in slot_names:
+            problems.append(f"{where}: {what} '{text}' references unknown slot {{{reference}}}")
+
+
+def validate_slot_type(where, slot_type):
+    problems = []
+    check_length(problems, where, "name", slot_type.get("slotTypeName"), MAX_NAME_LENGTH)
+    check_length(problems, where, "description", slot_type.get("description"), MAX_DESCRIPTION_LENGTH)
+    seen = set()
+    for slot_type_value in slot_type.get("slotTypeValues", []):
+        value = slot_type_value.get("sampleValue", {}).get("value")
+        check_length(problems, where, "value", value, MAX_SLOT_VALUE_LENGTH)
+        if isinstance(value, str):
+            if normalize_utterance(value) in seen:
+                problems.append(f"{where}: value '{value}' is duplicated")
+            seen.add(normalize_utterance(value))
+    return problems
+
+
+def validate_intent(where, intent, slot_type_names):
+    """
+    :return: List of problems of an intent, its slots and their prompts
+    """
+    problems = []
+    check_length(problems, where, "name", intent.get("intentName"), MAX_NAME_LENGTH)
+    check_length(problems, where, "description", intent.get("description"), MAX_DESCRIPTION_LENGTH)
+    slot_names = [slot["slotName"] for slot in intent.get("slots", [])]
+    if len(set(slot_names)) != len(slot_names):
+        problems.append(f"{where}: slot names {slot_names} are not unique")
+    seen = set()
+    for sample in intent.get("sampleUtterances", []):
+        utterance = sample.get("utterance")
+        check_length(problems, where, "utterance", utterance, MAX_UTTERANCE_LENGTH)
+        check_references(problems, where, "utterance", utterance, slot_names)
+        if isinstance(utterance, str):
+            if normalize_utterance(utterance) in seen:
+                problems.append(f"{where}: utterance '{utterance}' is duplicated")
+            seen.add(normalize_utterance(utterance))
+    for message in plain_text_messages(intent):
+        check_length(problems, where, "message", message, MAX_MESSAGE_LENGTH)
+        check_references(problems, where, "message", message, slot_names)
+    for slot in intent.get("slots", []):
+        slot_where = f"{where} slot {slot['slotName']}"
+        check_length(problems, slot_where, "name", slot["slotName"], MAX_NAME_LENGTH)
+        slot_type_name = slot.get("slotTypeName", "")
+        if not slot_type_name.startswith(BUILT_IN_SLOT_TYPE_PREFIX) and slot_type_name not in slot_type_names:
+            problems.append(f"{slot_where}: slot type {slot_type_name} is not defined")
+    return problems
+
+
+def validate_locale(definition, locale_id):
+    """
+    :return: List of problems of the intents and slot types of a locale, including utterances shared by intents
+    """
+    try:
+        slot_types = definition.slot_types(locale_id)
+    except ValueError as error:
+        return [str(error)]
+    problems = []
+    for name, slot_type in slot_types.items():
+        problems.extend(validate_slot_type(f"{locale_id} slot type {name}", slot_type))
+    utterance_intents = {}
+    for intent in definition.intents(locale_id):
+        problems.extend(validate_intent(f"{locale_id} intent {intent['intentName']}", intent, slot_types))
+        for utterance in {normalize_utterance(sample["utterance"]) for sample in intent.get("sampleUtterances", [])
+                          if isinstance(sample.get("utterance"), str)}:
+            utterance_intents.setdefault(utterance, []).append(intent["intentName"])
+    for utterance, intent_names in utterance_intents.items():
+        if len(intent_names) > 1:
+            problems.append(f"{locale_id}: utterance '{utterance}' is shared by intents {', '.join(intent_names)}")
+    return problems
+
+
+def validate_definition(definition):
+    """
+    Check the content of every locale of a bot definition, without calling Lex
+    :raises DefinitionError: listing every problem found
+    """
+    problems = []
+    for locale_id in definition.locales:
+        problems.extend(validate_locale(definition, locale_id))
+    if problems:
+        raise DefinitionError(problems)
@@ -0,0 +1,114 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import copy
+import json
+from shared.client import get_client
+from shared.logger import get_logger
+from shared.waiter import WaiterTimeout, remaining_seconds
+from shared.tracing import phase
+from shared.resumable import ContinueInNewInvocation
+
+logger = get_logger(__name__)
+
+# a phase is only started when at least this many seconds are left in the invocation
+PHASE_MIN_SECONDS = 10
+
+
+class LocalCheckpointStore:
+    """
+    Keeps checkpoints in memory, for tests and local runs
+    """
+
+    def __init__(self):
+        self.checkpoints = {}
+
+    def load(self, key):
+        return copy.deepcopy(self.checkpoints.get(key))
+
+    def save(self, key, state):
+        self.checkpoints[key] = copy.deepcopy(state)
+
+    def delete(self, key):
+        self.checkpoints.pop(key, None)
+
+
+class SSMCheckpointStore:
+    """
+    Keeps checkpoints as JSON in SSM parameters below a path prefix
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix.rstrip("/")
+
+    @property
+    def client(self):
+        # created on first use, delete requests never checkpoint
+        return get_client("ssm")
+
+    def parameter_name(self, key):
+        return f"{self.prefix}/{key}"
+
+    def load(self, key):
+        try:
+            response = self.client.get_parameter(Name=self.parameter_name(key))
+        except self.client.exceptions.ParameterNotFound:
+            return None
+        return json.loads(response["Parameter"]["Value"])
+
+    def save(self, key, state):
+        self.client.put_parameter(
+            Name=self.parameter_name(key), Value=json.dumps(state), Type="String", Overwrite=True
+        )
+
+    def delete(self, key):
+        try:
+            self.client.delete_parameter(Name=self.parameter_name(key))
+        except self.client.exceptions.ParameterNotFound:
+            pass
+
+
+def get_checkpoint_store():
+    prefix = os.environ.get("checkpointParameterPrefix")
+    return SSMCheckpointStore(prefix) if prefix else LocalCheckpointStore()
+
+
+def run_phases(phases, state, store, key):
+    """
+    Run the phases of a request that did not complete yet, saving the state after each of them
+    :param phases: List of (name, func(state)) tuples. Each phase must be safe to run again from its start.
+    :param state: Dict of the request state, completedPhases lists the phases that already ran
+    :param store: The checkpoint store
+    :param key: Key of the request in the checkpoint store
+    :raises ContinueInNewInvocation: if there is not enough time left to complete the next phase
+    """
+    state.setdefault("completedPhases", [])
+    for name, func in phases:
+        if name in state["completedPhases"]:
+            continue
+        remaining = remaining_seconds()
+        if remaining is not None and remaining < PHASE_MIN_SECONDS:
+            store.save(key, state)
+            logger.info(f"{remaining:.1f}s left, continuing with phase {name} in a new invocation.")
+            raise ContinueInNewInvocation(name)
+        try:
+            with phase(name):
+                func(state)
+        except WaiterTimeout as error:
+            store.save(key, state)
+            logger.info(f"{error}, continuing with phase {name} in a new invocation.")
+            raise ContinueInNewInvocation(name) from error
+        state["completedPhases"].append(name)
+        store.save(key, state)
+        logger.info(f"Phase {name} completed.")
+    store.delete(key)
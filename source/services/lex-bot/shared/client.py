@@ -15,23 +15,59 @@ import json
 import boto3
 from botocore.config import Config
 from shared.logger import get_logger
+from shared.rate_limiter import attach as attach_rate_limiter
+from shared.tracing import attach as attach_tracing
 
 
 logger = get_logger(__name__)
 
-CLIENT_CONFIG = Config(retries = {"mode": "standard"}, **json.loads(os.environ["AWS_SDK_USER_AGENT"]))
-
+_client_config = None
 _helpers_service_clients = dict()
+# in-process stand-ins answering the calls of a service instead of AWS, see shared.lex_stand_in
+_stand_ins = dict()
+# services whose calls are recorded on the provisioning timeline
+TRACED_SERVICES = ("lexv2-models",)
+
+
+def get_client_config():
+    """
+    :return: The botocore config of the clients, parsed from the environment on first use
+    """
+    global _client_config
+    if _client_config is None:
+        _client_config = Config(retries = {"mode": "standard"}, **json.loads(os.environ["AWS_SDK_USER_AGENT"]))
+    return _client_config
 
 
-def get_client(service_name, config=CLIENT_CONFIG):
+def get_client(service_name, config=None):
     global _helpers_service_clients
     if service_name not in _helpers_service_clients:
         logger.debug(f"Initializing global boto3 client for {service_name}")
-        _helpers_service_clients[service_name] = boto3.client(service_name, config=config)
+        _helpers_service_clients[service_name] = boto3.client(service_name, config=config or get_client_config())
+        attach_rate_limiter(_helpers_service_clients[service_name], service_name)
+        if service_name in TRACED_SERVICES:
+            attach_tracing(_helpers_service_clients[service_name])
+        if service_name in _stand_ins:
+            _stand_ins[service_name].attach(_helpers_service_clients[service_name])
     return _helpers_service_clients[service_name]
 
 
+def use_stand_in(service_name, stand_in):
+    """
+    Answer the calls of the clients of a service with a stand-in, for example a LexStandIn, instead of AWS
+    :param stand_in: Object with attach(client) and detach(client) methods, or None to call AWS again
+    """
+    client = _helpers_service_clients.get(service_name)
+    previous = _stand_ins.pop(service_name, None)
+    if previous is not None and client is not None:
+        previous.detach(client)
+    if stand_in is not None:
+        _stand_ins[service_name] = stand_in
+        if client is not None:
+            stand_in.attach(client)
+
+
 def reset_client():
-    global _helpers_service_clients
+    global _helpers_service_clients, _client_config
     _helpers_service_clients = dict()
+    _client_config = None
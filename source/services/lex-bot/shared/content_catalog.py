@@ -0,0 +1,190 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Localized content of the bot, built once per process from the CONTENT tables of the content modules.
+
+Usage: python -m shared.content_catalog <path>  writes the catalog to path, to be loaded with contentCatalogPath
+"""
+import os
+import sys
+import json
+import importlib
+import threading
+
+LANGUAGE_LOCALES = {
+    "English": "en_US",
+    "French": "fr_FR",
+    "Italian": "it_IT",
+    "Spanish": "es_US",
+    "German": "de_DE",
+    "Japanese": "ja_JP"
+}
+# namespace of the artifacts: module defining a CONTENT dict of table name to table
+CONTENT_MODULES = {
+    "shared": "shared.helpers",
+    "order_pizza": "order_pizza.order_helpers",
+    "book_appointment": "book_appointment.appointment_helpers",
+    "leave_feedback": "leave_feedback.feedback_helpers",
+    "weather_forecast": "weather_forecast.weather_helpers",
+    "help_intent": "other_intents.help_intent",
+    "name_intent": "other_intents.name_intent",
+}
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def read_only(*_, **__):
+    raise TypeError("Catalog content is read-only")
+
+
+class FrozenDict(dict):
+    """
+    A dict that cannot be changed. Copies of it are plain dicts.
+    """
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """
+    A list that cannot be changed. Copies of it are plain lists.
+    """
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def flatten(table, path=()):
+    """
+    Walk down a table to the levels keyed by language
+    :return: Iterator of (locale id, artifact path, value)
+    """
+    if table and all(key in LANGUAGE_LOCALES for key in table):
+        for language, value in table.items():
+            yield LANGUAGE_LOCALES[language], ".".join(path), value
+    else:
+        for key, value in table.items():
+            yield from flatten(value, path + (key,))
+
+
+class ContentCatalog:
+    """
+    Read-only content keyed by (locale id, artifact), where an artifact is the dotted path of a table,
+    for example ("en_US", "order_pizza.slot_types.PizzaSize")
+    """
+
+    def __init__(self, entries):
+        self.entries = {locale_id: freeze(artifacts) for locale_id, artifacts in entries.items()}
+
+    @classmethod
+    def from_modules(cls, modules=None):
+        entries = {}
+        for namespace, module_name in (modules or CONTENT_MODULES).items():
+            content = importlib.import_module(module_name).CONTENT
+            for locale_id, artifact, value in flatten(content, (namespace,)):
+                entries.setdefault(locale_id, {})[artifact] = value
+        return cls(entries)
+
+    def get(self, locale_id, artifact):
+        try:
+            return self.entries[locale_id][artifact]
+        except KeyError:
+            raise KeyError(f"{artifact} for {locale_id}") from None
+
+    def locale_ids(self):
+        return sorted(self.entries)
+
+    def artifacts(self, locale_id):
+        return sorted(self.entries.get(locale_id, {}))
+
+    def dumps(self):
+        return json.dumps(self.entries, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, text):
+        return cls(json.loads(text))
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as catalog_file:
+            catalog_file.write(self.dumps())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as catalog_file:
+            return cls.loads(catalog_file.read())
+
+
+def get_catalog():
+    """
+    :return: The catalog of this process, loaded from contentCatalogPath if set, otherwise built from the modules
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                path = os.environ.get("contentCatalogPath")
+                _catalog = ContentCatalog.load(path) if path else ContentCatalog.from_modules()
+    return _catalog
+
+
+def reset_catalog():
+    global _catalog
+    _catalog = None
+
+
+def content(language, artifact, *path):
+    """
+    :return: Read-only content of an artifact in a language, path selecting a sub-table keyed above the language
+    """
+    return get_catalog().get(LANGUAGE_LOCALES[language], ".".join((artifact,) + path))
+
+
+def main(argv):
+    ContentCatalog.from_modules().dump(argv[0])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,133 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import json
+from contextvars import copy_context
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from shared.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class Task:
+    """
+    A unit of provisioning work.
+    :param name: Unique name of the task, used as the key of its result
+    :param func: Callable receiving a dict of the results of completed tasks (keyed by task name)
+    :param depends_on: Names of the tasks that must complete before this one starts
+    """
+
+    def __init__(self, name, func, depends_on=()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self):
+        return f"Task({self.name!r}, depends_on={self.depends_on!r})"
+
+
+def validate_tasks(tasks):
+    """
+    Check that task names are unique, every dependency exists and that the dependency graph has no cycles
+    :param tasks: List of Task
+    :raises ValueError: if the task graph cannot be executed
+    """
+    names = [task.name for task in tasks]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate task names in {names}")
+    for task in tasks:
+        missing = set(task.depends_on) - set(names)
+        if missing:
+            raise ValueError(f"Task {task.name} depends on unknown tasks {sorted(missing)}")
+
+    remaining = {task.name: set(task.depends_on) for task in tasks}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between tasks {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def summarize_timings(name, durations, wall_clock):
+    """
+    Compare the wall clock time of a concurrent run against the time the same tasks take back to back
+    :param name: Name of the run, for logging
+    :param durations: Dict of task name to task duration in seconds
+    :param wall_clock: Elapsed time of the concurrent run in seconds
+    :return: Dict summary of the run
+    """
+    serial = sum(durations.values())
+    return {
+        "run": name,
+        "tasks": len(durations),
+        "wallClockSeconds": round(wall_clock, 3),
+        "serialSeconds": round(serial, 3),
+        "savedSeconds": round(max(serial - wall_clock, 0), 3),
+        "speedup": round(serial / wall_clock, 2) if wall_clock > 0 else 1.0,
+    }
+
+
+def run_tasks(tasks, max_workers=DEFAULT_MAX_WORKERS, name="provisioning"):
+    """
+    Run tasks on a bounded worker pool, starting each task as soon as all of its dependencies have completed.
+    The first failure stops new tasks from being scheduled and is re-raised once the running tasks finish.
+    :param tasks: List of Task
+    :param max_workers: Maximum number of tasks running at the same time
+    :param name: Name of the run, for logging
+    :return: Dict of task name to the value returned by the task
+    """
+    validate_tasks(tasks)
+    pending = {task.name: task for task in tasks}
+    results = {}
+    durations = {}
+    error = None
+    start = perf_counter()
+
+    def timed(task, inputs):
+        task_start = perf_counter()
+        try:
+            return task.func(inputs)
+        finally:
+            durations[task.name] = perf_counter() - task_start
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        running = {}
+        while pending or running:
+            if error is None:
+                ready = [task for task in pending.values() if all(dep in results for dep in task.depends_on)]
+                for task in ready:
+                    del pending[task.name]
+                    # each task runs in a copy of the context of the caller, which holds its tracing phase
+                    running[pool.submit(copy_context().run, timed, task, dict(results))] = task.name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task_name = running.pop(future)
+                try:
+                    results[task_name] = future.result()
+                except Exception as e:  # NOSONAR the first failure is re-raised after the running tasks finish
+                    logger.error(f"Task {task_name} failed: {e}")
+                    error = error or e
+
+    if error is not None:
+        raise error
+
+    summary = summarize_timings(name, durations, perf_counter() - start)
+    logger.info(json.dumps(summary))
+    return results
@@ -10,27 +10,27 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
+from shared.content_catalog import content, LANGUAGE_LOCALES
 
 
 def detect_locale(language):
-    language_locale = {
-        "English": "en_US",
-        "French": "fr_FR",
-        "Italian": "it_IT",
-        "Spanish": "es_US",
-        "German": "de_DE",
-        "Japanese": "ja_JP"
-    }
-    return language_locale[language]
+    return LANGUAGE_LOCALES[language]
+
+
+ABORT_STATEMENT = {
+    "English": "Sorry, I am not able to assist at this time",
+    "French": "Je vous prie de m'excuser, mais je ne suis pas en mesure de vous aider pour le moment",
+    "Italian": "Mi dispiace, ma non posso aiutarti al momento",
+    "Spanish": "Disculpe, no puedo ayudarlo en este momento",
+    "German": "Entschuldigung! Leider kann ich Ihnen dieses Mal nicht helfen.",
+    "Japanese": "申し訳ありませんが、現時点ではサポートできません "
+}
 
 
 def abort_statement(language):
-    statement = {
-        "English": "Sorry, I am not able to assist at this time",
-        "French": "Je vous prie de m'excuser, mais je ne suis pas en mesure de vous aider pour le moment",
-        "Italian": "Mi dispiace, ma non posso aiutarti al momento",
-        "Spanish": "Disculpe, no puedo ayudarlo en este momento",
-        "German": "Entschuldigung! Leider kann ich Ihnen dieses Mal nicht helfen.",
-        "Japanese": "申し訳ありませんが、現時点ではサポートできません "
-    }
-    return statement[language]
+    return content(language, "shared.abort_statement")
+
+
+CONTENT = {
+    "abort_statement": ABORT_STATEMENT,
+}
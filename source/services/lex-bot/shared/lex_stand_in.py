@@ -0,0 +1,629 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+In-process stand-in for the lexv2-models operations of the framework, for benchmarks and tests without network.
+
+The stand-in answers the HTTP requests of a real boto3 client, so the rate limiter, retries, tracing and response
+parsing of the client all run as they do against Lex. Plug it in with shared.client.use_stand_in.
+"""
+import io
+import copy
+import json
+import zipfile
+import threading
+from collections import deque
+from time import monotonic, sleep
+import botocore
+from botocore.awsrequest import AWSResponse
+
+PAGE_SIZE = 10
+ERROR_STATUS = {
+    "ValidationException": 400,
+    "ResourceNotFoundException": 404,
+    "ConflictException": 409,
+    "PreconditionFailedException": 412,
+    "ThrottlingException": 429,
+}
+# seconds a resource stays in its transitional state
+DEFAULT_TRANSITIONS = {"bot": 0.0, "locale": 0.0, "build": 0.0, "version": 0.0, "alias": 0.0, "import": 0.0}
+TEST_ALIAS_ID = "TSTALIASID"
+UPLOAD_URL_PREFIX = "https://lex-stand-in/uploads/"
+FALLBACK_INTENT_ID = "FALLBCKINT"
+# parameters of a request that identify the resource rather than describe it
+ID_KEYS = ("botId", "botVersion", "localeId", "intentId", "slotId", "slotTypeId", "botAliasId")
+
+
+class LexError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class ResponseBody:
+    def __init__(self, content):
+        self.content = content
+
+    def stream(self, **_):
+        yield self.content
+
+
+def page(items, params, key):
+    """
+    :return: The page of a list response selected by the nextToken and maxResults of the request
+    """
+    start = int(params.get("nextToken") or 0)
+    end = start + (params.get("maxResults") or PAGE_SIZE)
+    response = {key: items[start:end]}
+    if end < len(items):
+        response["nextToken"] = str(end)
+    return response
+
+
+def settings(params):
+    return {key: copy.deepcopy(value) for key, value in params.items() if key not in ID_KEYS}
+
+
+def imported_settings(document, name_key):
+    """
+    :return: The settings of a resource from its file in an import archive, its name under the key of the API
+    """
+    rendered = {key: value for key, value in document.items() if key not in ("name", "identifier")}
+    return dict(rendered, **{name_key: document["name"]})
+
+
+class LexStandIn:
+    """
+    Keeps bots, their aliases, versions, DRAFT locales, slot types, intents, slots and imports in memory.
+    :param latencies: Dict of operation name, or "*" for all of them, to the seconds a call takes. The upload of an
+        import archive is the UploadArchive operation.
+    :param transitions: Dict of resource (bot, locale, build, version, alias, import) to the seconds it stays in its
+        transitional state
+    :param rates: Dict of operation name to the calls per second after which calls are throttled
+    """
+
+    def __init__(self, latencies=None, transitions=None, rates=None, clock=monotonic, wait=sleep):
+        self.latencies = latencies or {}
+        self.transitions = dict(DEFAULT_TRANSITIONS, **(transitions or {}))
+        self.rates = rates or {}
+        self.clock = clock
+        self.wait = wait
+        self.lock = threading.Lock()
+        self.calls = []
+        self.throttled = []
+        self.bots = {}
+        self.tags = {}
+        self.imports = {}
+        self._recent = {}
+        self._ids = {}
+
+    # plugging into clients
+
+    def attach(self, client):
+        service_id = client.meta.service_model.service_id.hyphenize()
+        events = client.meta.events
+        events.register(f"choose-signer.{service_id}", self.choose_signer, unique_id="lex-stand-in-signer")
+        events.register(f"before-parameter-build.{service_id}", self.capture, unique_id="lex-stand-in-capture")
+        events.register(f"before-send.{service_id}", self.before_send, unique_id="lex-stand-in-send")
+
+    def detach(self, client):
+        service_id = client.meta.service_model.service_id.hyphenize()
+        events = client.meta.events
+        events.unregister(f"choose-signer.{service_id}", unique_id="lex-stand-in-signer")
+        events.unregister(f"before-parameter-build.{service_id}", unique_id="lex-stand-in-capture")
+        events.unregister(f"before-send.{service_id}", unique_id="lex-stand-in-send")
+
+    def choose_signer(self, **_):
+        return botocore.UNSIGNED
+
+    def capture(self, params, model, context, **_):
+        context["standIn"] = (model.name, copy.deepcopy(params))
+
+    def before_send(self, request, **_):
+        operation, params = request.context["standIn"]
+        self.wait(self.latencies.get(operation, self.latencies.get("*", 0.0)))
+        try:
+            status, body = 200, self.call(operation, params)
+            headers = {}
+        except LexError as error:
+            status, body = ERROR_STATUS[error.code], {"message": str(error)}
+            headers = {"x-amzn-ErrorType": error.code}
+        content = json.dumps(body).encode("utf-8")
+        headers.update({"Content-Type": "application/json", "Content-Length": str(len(content))})
+        return AWSResponse(request.url, status, headers, ResponseBody(content))
+
+    def call(self, operation, params):
+        """
+        Answer one call
+        :return: The response, before serialization
+        :raises LexError: with the error code Lex would answer
+        """
+        with self.lock:
+            self.calls.append((operation, params))
+            self.throttle(operation)
+            handler = getattr(self, operation, None)
+            if handler is None or operation[0].islower():
+                raise LexError("ValidationException", f"{operation} is not supported by the stand-in")
+            return handler(**params)
+
+    def throttle(self, operation):
+        rate = self.rates.get(operation)
+        if rate is None:
+            return
+        now = self.clock()
+        recent = self._recent.setdefault(operation, deque())
+        while recent and recent[0] <= now - 1.0:
+            recent.popleft()
+        if len(recent) >= rate:
+            self.throttled.append(operation)
+            raise LexError("ThrottlingException", "Rate exceeded")
+        recent.append(now)
+
+    # state
+
+    def new_id(self, prefix):
+        self._ids[prefix] = self._ids.get(prefix, 0) + 1
+        return f"{prefix}{self._ids[prefix]:0{10 - len(prefix)}d}"
+
+    def transition(self, resource, status, final_status):
+        """
+        :return: Status record of a resource entering a transitional status
+        """
+        return {"status": status, "until": self.clock() + self.transitions[resource], "next": final_status}
+
+    def status(self, record):
+        state = record["state"]
+        if state.get("next") and self.clock() >= state["until"]:
+            record["state"] = {"status": state["next"]}
+        return record["state"]["status"]
+
+    def bot(self, botId):
+        if botId not in self.bots:
+            raise LexError("ResourceNotFoundException", f"Bot {botId} not found")
+        return self.bots[botId]
+
+    def locale(self, botId, localeId, botVersion="DRAFT"):
+        locales = self.bot(botId)["locales"]
+        if botVersion != "DRAFT" or localeId not in locales:
+            raise LexError("ResourceNotFoundException", f"Locale {localeId} of bot {botId} not found")
+        return locales[localeId]
+
+    def child(self, parent, kind, resource_id):
+        if resource_id not in parent[kind]:
+            raise LexError("ResourceNotFoundException", f"{kind} {resource_id} not found")
+        return parent[kind][resource_id]
+
+    def change(self, locale):
+        """
+        Record a change of the DRAFT definition of a locale, which has to be built again
+        """
+        if self.status(locale) == "Building":
+            raise LexError("PreconditionFailedException", "The locale is being built")
+        if self.status(locale) == "Built":
+            locale["state"] = {"status": "NotBuilt"}
+
+    def check_name(self, resources, name_key, name, resource_id=None):
+        for existing_id, resource in resources.items():
+            if resource["settings"][name_key] == name and existing_id != resource_id:
+                raise LexError("ConflictException", f"{name} already exists")
+
+    # bots
+
+    def CreateBot(self, **params):
+        self.check_name(self.bots, "botName", params["botName"])
+        bot_id = self.new_id("BOT")
+        self.bots[bot_id] = {
+            "settings": settings(params),
+            "state": self.transition("bot", "Creating", "Available"),
+            "locales": {},
+            "aliases": {
+                TEST_ALIAS_ID: {
+                    "settings": {"botAliasName": "TestBotAlias", "botVersion": "DRAFT"},
+                    "state": {"status": "Available"},
+                }
+            },
+            "versions": {},
+        }
+        self.tags[bot_id] = dict(params.get("botTags", {}))
+        return dict(settings(params), botId=bot_id, botStatus="Creating")
+
+    def DescribeBot(self, botId):
+        bot = self.bot(botId)
+        return dict(bot["settings"], botId=botId, botStatus=self.status(bot))
+
+    def UpdateBot(self, botId, **params):
+        bot = self.bot(botId)
+        bot["settings"] = settings(params)
+        return dict(bot["settings"], botId=botId, botStatus=self.status(bot))
+
+    def DeleteBot(self, botId, **_):
+        self.bot(botId)
+        del self.bots[botId]
+        self.tags.pop(botId, None)
+        return {"botId": botId, "botStatus": "Deleting"}
+
+    def ListBots(self, filters=(), **params):
+        summaries = []
+        for bot_id, bot in self.bots.items():
+            name = bot["settings"]["botName"]
+            if all(name in condition["values"] if condition["operator"] == "EQ"
+                   else any(value in name for value in condition["values"]) for condition in filters):
+                summaries.append({"botId": bot_id, "botName": name, "botStatus": self.status(bot)})
+        return page(summaries, params, "botSummaries")
+
+    # aliases
+
+    def alias_response(self, bot_id, alias_id, alias):
+        return dict(alias["settings"], botId=bot_id, botAliasId=alias_id, botAliasStatus=self.status(alias))
+
+    def CreateBotAlias(self, botId, **params):
+        aliases = self.bot(botId)["aliases"]
+        self.check_name(aliases, "botAliasName", params["botAliasName"])
+        alias_id = self.new_id("ALS")
+        aliases[alias_id] = {
+            "settings": dict(settings(params), botVersion=params.get("botVersion")),
+            "state": self.transition("alias", "Creating", "Available"),
+        }
+        return self.alias_response(botId, alias_id, aliases[alias_id])
+
+    def DescribeBotAlias(self, botId, botAliasId):
+        return self.alias_response(botId, botAliasId, self.child(self.bot(botId), "aliases", botAliasId))
+
+    def UpdateBotAlias(self, botId, botAliasId, **params):
+        alias = self.child(self.bot(botId), "aliases", botAliasId)
+        version = params.get("botVersion", "DRAFT")
+        if version != "DRAFT" and version not in self.bot(botId)["versions"]:
+            raise LexError("ResourceNotFoundException", f"Version {version} not found")
+        alias["settings"] = dict(settings(params), botVersion=version)
+        return self.alias_response(botId, botAliasId, alias)
+
+    def ListBotAliases(self, botId, **params):
+        summaries = [
+            self.alias_response(botId, alias_id, alias) for alias_id, alias in self.bot(botId)["aliases"].items()
+        ]
+        return page(summaries, params, "botAliasSummaries")
+
+    # versions
+
+    def CreateBotVersion(self, botId, botVersionLocaleSpecification, **params):
+        bot = self.bot(botId)
+        for locale_id in botVersionLocaleSpecification:
+            if self.status(self.locale(botId, locale_id)) != "Built":
+                raise LexError("ValidationException", f"Locale {locale_id} is not built")
+        version = str(max((int(version) for version in bot["versions"]), default=0) + 1)
+        bot["versions"][version] = {
+            "settings": settings(params), "state": self.transition("version", "Versioning", "Available")
+        }
+        return dict(settings(params), botId=botId, botVersion=version, botStatus="Versioning")
+
+    def DescribeBotVersion(self, botId, botVersion):
+        version = self.child(self.bot(botId), "versions", botVersion)
+        return dict(version["settings"], botId=botId, botVersion=botVersion, botStatus=self.status(version))
+
+    def ListBotVersions(self, botId, **params):
+        versions = self.bot(botId)["versions"]
+        summaries = [
+            dict(versions[version]["settings"], botVersion=version, botStatus=self.status(versions[version]))
+            for version in sorted(versions, key=int, reverse=True)
+        ]
+        return page(summaries, params, "botVersionSummaries")
+
+    def DeleteBotVersion(self, botId, botVersion, **_):
+        bot = self.bot(botId)
+        self.child(bot, "versions", botVersion)
+        if any(alias["settings"].get("botVersion") == botVersion for alias in bot["aliases"].values()):
+            raise LexError("PreconditionFailedException", f"Version {botVersion} is used by an alias")
+        del bot["versions"][botVersion]
+        return {"botId": botId, "botVersion": botVersion, "botStatus": "Deleting"}
+
+    # locales
+
+    def CreateBotLocale(self, botId, botVersion, localeId, **params):
+        locales = self.bot(botId)["locales"]
+        if localeId in locales:
+            raise LexError("ConflictException", f"Locale {localeId} already exists")
+        locales[localeId] = {
+            "settings": settings(params),
+            "state": self.transition("locale", "Creating", "NotBuilt"),
+            "slotTypes": {},
+            "intents": {
+                FALLBACK_INTENT_ID: {
+                    "settings": {"intentName": "FallbackIntent", "parentIntentSignature": "AMAZON.FallbackIntent"},
+                    "slots": {},
+                }
+            },
+        }
+        return dict(settings(params), botId=botId, botVersion=botVersion, localeId=localeId, botLocaleStatus="Creating")
+
+    def DescribeBotLocale(self, botId, botVersion, localeId):
+        locale = self.locale(botId, localeId, botVersion)
+        return dict(
+            locale["settings"], botId=botId, botVersion=botVersion, localeId=localeId,
+            botLocaleStatus=self.status(locale), intentsCount=len(locale["intents"]),
+            slotTypesCount=len(locale["slotTypes"]),
+        )
+
+    def ListBotLocales(self, botId, botVersion, **params):
+        summaries = [
+            {"localeId": locale_id, "botLocaleStatus": self.status(locale)}
+            for locale_id, locale in self.bot(botId)["locales"].items()
+        ]
+        return page(summaries if botVersion == "DRAFT" else [], params, "botLocaleSummaries")
+
+    def DeleteBotLocale(self, botId, botVersion, localeId):
+        self.locale(botId, localeId, botVersion)
+        del self.bots[botId]["locales"][localeId]
+        return {"botId": botId, "botVersion": botVersion, "localeId": localeId, "botLocaleStatus": "Deleting"}
+
+    def BuildBotLocale(self, botId, botVersion, localeId):
+        locale = self.locale(botId, localeId, botVersion)
+        if self.status(locale) in ("Creating", "Building"):
+            raise LexError("PreconditionFailedException", f"Locale {localeId} is {self.status(locale)}")
+        locale["state"] = self.transition("build", "Building", "Built")
+        return {"botId": botId, "botVersion": botVersion, "localeId": localeId, "botLocaleStatus": "Building"}
+
+    # slot types
+
+    def slot_type_response(self, params, slot_type_id, slot_type):
+        return dict(slot_type["settings"], slotTypeId=slot_type_id, **self.scope(params))
+
+    def scope(self, params):
+        return {key: params[key] for key in ("botId", "botVersion", "localeId") if key in params}
+
+    def CreateSlotType(self, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        self.check_name(locale["slotTypes"], "slotTypeName", params["slotTypeName"])
+        self.change(locale)
+        slot_type_id = self.new_id("STY")
+        locale["slotTypes"][slot_type_id] = {"settings": settings(params)}
+        return self.slot_type_response(params, slot_type_id, locale["slotTypes"][slot_type_id])
+
+    def DescribeSlotType(self, slotTypeId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        return self.slot_type_response(params, slotTypeId, self.child(locale, "slotTypes", slotTypeId))
+
+    def UpdateSlotType(self, slotTypeId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        slot_type = self.child(locale, "slotTypes", slotTypeId)
+        self.check_name(locale["slotTypes"], "slotTypeName", params["slotTypeName"], slotTypeId)
+        self.change(locale)
+        slot_type["settings"] = settings(params)
+        return self.slot_type_response(params, slotTypeId, slot_type)
+
+    def DeleteSlotType(self, slotTypeId, skipResourceInUseCheck=False, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        self.child(locale, "slotTypes", slotTypeId)
+        in_use = any(
+            slot["settings"].get("slotTypeId") == slotTypeId
+            for intent in locale["intents"].values() for slot in intent["slots"].values()
+        )
+        if in_use and not skipResourceInUseCheck:
+            raise LexError("PreconditionFailedException", f"Slot type {slotTypeId} is used by a slot")
+        self.change(locale)
+        del locale["slotTypes"][slotTypeId]
+
+    def ListSlotTypes(self, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        summaries = [
+            {"slotTypeId": slot_type_id, "slotTypeName": slot_type["settings"]["slotTypeName"]}
+            for slot_type_id, slot_type in locale["slotTypes"].items()
+        ]
+        return page(summaries, params, "slotTypeSummaries")
+
+    # intents
+
+    def intent_response(self, params, intent_id, intent):
+        return dict(intent["settings"], intentId=intent_id, **self.scope(params))
+
+    def CreateIntent(self, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        self.check_name(locale["intents"], "intentName", params["intentName"])
+        self.change(locale)
+        intent_id = self.new_id("INT")
+        locale["intents"][intent_id] = {"settings": settings(params), "slots": {}}
+        return self.intent_response(params, intent_id, locale["intents"][intent_id])
+
+    def DescribeIntent(self, intentId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        return self.intent_response(params, intentId, self.child(locale, "intents", intentId))
+
+    def UpdateIntent(self, intentId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        intent = self.child(locale, "intents", intentId)
+        self.check_name(locale["intents"], "intentName", params["intentName"], intentId)
+        for priority in params.get("slotPriorities", []):
+            if priority["slotId"] not in intent["slots"]:
+                raise LexError("ValidationException", f"Slot {priority['slotId']} is not a slot of the intent")
+        self.change(locale)
+        intent["settings"] = settings(params)
+        return self.intent_response(params, intentId, intent)
+
+    def DeleteIntent(self, intentId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        self.child(locale, "intents", intentId)
+        self.change(locale)
+        del locale["intents"][intentId]
+
+    def ListIntents(self, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        summaries = [
+            dict(intentId=intent_id, **{
+                key: intent["settings"][key] for key in ("intentName", "parentIntentSignature")
+                if key in intent["settings"]
+            })
+            for intent_id, intent in locale["intents"].items()
+        ]
+        return page(summaries, params, "intentSummaries")
+
+    # slots
+
+    def slot_response(self, params, slot_id, slot):
+        return dict(slot["settings"], slotId=slot_id, intentId=params["intentId"], **self.scope(params))
+
+    def CreateSlot(self, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        intent = self.child(locale, "intents", params["intentId"])
+        self.check_name(intent["slots"], "slotName", params["slotName"])
+        slot_type_id = params.get("slotTypeId", "")
+        if not slot_type_id.startswith("AMAZON.") and slot_type_id not in locale["slotTypes"]:
+            raise LexError("PreconditionFailedException", f"Slot type {slot_type_id} not found")
+        self.change(locale)
+        slot_id = self.new_id("SLT")
+        intent["slots"][slot_id] = {"settings": dict(settings(params), slotTypeId=slot_type_id)}
+        return self.slot_response(params, slot_id, intent["slots"][slot_id])
+
+    def DescribeSlot(self, slotId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        intent = self.child(locale, "intents", params["intentId"])
+        return self.slot_response(params, slotId, self.child(intent, "slots", slotId))
+
+    def UpdateSlot(self, slotId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        slot = self.child(self.child(locale, "intents", params["intentId"]), "slots", slotId)
+        self.change(locale)
+        slot["settings"] = dict(settings(params), slotTypeId=params.get("slotTypeId"))
+        return self.slot_response(params, slotId, slot)
+
+    def DeleteSlot(self, slotId, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        intent = self.child(locale, "intents", params["intentId"])
+        self.child(intent, "slots", slotId)
+        self.change(locale)
+        del intent["slots"][slotId]
+
+    def ListSlots(self, **params):
+        locale = self.locale(params["botId"], params["localeId"], params["botVersion"])
+        intent = self.child(locale, "intents", params["intentId"])
+        summaries = [
+            {"slotId": slot_id, "slotName": slot["settings"]["slotName"],
+             "slotTypeId": slot["settings"].get("slotTypeId")}
+            for slot_id, slot in intent["slots"].items()
+        ]
+        return page(summaries, params, "slotSummaries")
+
+    # imports
+
+    def upload_record(self, import_id):
+        if import_id not in self.imports:
+            raise LexError("ResourceNotFoundException", f"Import {import_id} not found")
+        return self.imports[import_id]
+
+    def upload(self, upload_url, archive):
+        """
+        Stands in for shared.bot_import.upload_archive, keeping the archive for the import of the upload url
+        """
+        self.wait(self.latencies.get("UploadArchive", self.latencies.get("*", 0.0)))
+        with self.lock:
+            self.calls.append(("UploadArchive", {"uploadUrl": upload_url}))
+            self.upload_record(upload_url[len(UPLOAD_URL_PREFIX):])["archive"] = archive
+
+    def CreateUploadUrl(self):
+        import_id = self.new_id("IMP")
+        self.imports[import_id] = {"archive": None, "state": {"status": "Uploading"}}
+        return {"importId": import_id, "uploadUrl": f"{UPLOAD_URL_PREFIX}{import_id}"}
+
+    def StartImport(self, importId, resourceSpecification, mergeStrategy, **_):
+        """
+        Create the bot of the archive, or replace the DRAFT locales of the bot of the same name. The resources are
+        there at once, the import itself stays InProgress for the import transition.
+        """
+        upload = self.upload_record(importId)
+        if upload["archive"] is None:
+            raise LexError("ValidationException", f"Nothing was uploaded for import {importId}")
+        with zipfile.ZipFile(io.BytesIO(upload["archive"])) as archive:
+            files = {path.split("/", 1)[-1]: json.loads(archive.read(path)) for path in archive.namelist()}
+        specification = resourceSpecification["botImportSpecification"]
+        bot_id = next(
+            (bot_id for bot_id, bot in self.bots.items() if bot["settings"]["botName"] == specification["botName"]),
+            None,
+        )
+        if bot_id is None:
+            bot_id = self.CreateBot(**specification)["botId"]
+            self.bots[bot_id]["state"] = {"status": "Available"}
+        elif mergeStrategy != "Overwrite":
+            raise LexError("ConflictException", f"{specification['botName']} already exists")
+        self.bots[bot_id]["locales"] = self.imported_locales(files)
+        upload["state"] = self.transition("import", "InProgress", "Completed")
+        upload["botId"] = bot_id
+        return {"importId": importId, "importStatus": "InProgress", "mergeStrategy": mergeStrategy}
+
+    def imported_locales(self, files):
+        """
+        :param files: Dict of path below the bot directory of the archive to the JSON document of the file
+        :return: The DRAFT locales of the archive, not built
+        """
+        locales = {}
+        for path, document in sorted(files.items()):
+            parts = path.split("/")
+            if parts[0] == "BotLocales" and parts[2:] == ["BotLocale.json"]:
+                locales[parts[1]] = {
+                    "settings": {
+                        "description": document.get("description"),
+                        "voiceSettings": document.get("voiceSettings"),
+                        "nluIntentConfidenceThreshold": document.get("nluConfidenceThreshold"),
+                    },
+                    "state": {"status": "NotBuilt"},
+                    "slotTypes": {},
+                    "intents": {},
+                }
+        for locale_id, locale in locales.items():
+            prefix = f"BotLocales/{locale_id}/"
+            documents = {
+                tuple(path[len(prefix):].split("/")): document for path, document in files.items()
+                if path.startswith(prefix)
+            }
+            for parts, document in documents.items():
+                if parts[0] == "SlotTypes":
+                    locale["slotTypes"][self.new_id("STY")] = {"settings": imported_settings(document, "slotTypeName")}
+            slot_type_ids = {
+                slot_type["settings"]["slotTypeName"]: slot_type_id
+                for slot_type_id, slot_type in locale["slotTypes"].items()
+            }
+            for parts, document in documents.items():
+                if parts[0] != "Intents" or len(parts) != 3:
+                    continue
+                settings = imported_settings(document, "intentName")
+                priorities = settings.pop("slotPriorities", [])
+                slots = {}
+                for slot_parts, slot_document in documents.items():
+                    if slot_parts[:3] == ("Intents", parts[1], "Slots"):
+                        slot = imported_settings(slot_document, "slotName")
+                        slot_type_name = slot.pop("slotTypeName", "")
+                        slot["slotTypeId"] = slot_type_ids.get(slot_type_name, slot_type_name)
+                        slots[slot["slotName"]] = (self.new_id("SLT"), {"settings": slot})
+                settings["slotPriorities"] = [
+                    {"priority": priority["priority"], "slotId": slots[priority["slotName"]][0]}
+                    for priority in priorities
+                ]
+                locale["intents"][self.new_id("INT")] = {"settings": settings, "slots": dict(slots.values())}
+        return locales
+
+    def DescribeImport(self, importId):
+        upload = self.upload_record(importId)
+        response = {"importId": importId, "importStatus": self.status(upload)}
+        if upload.get("botId"):
+            response["importedResourceId"] = upload["botId"]
+        return response
+
+    # tags
+
+    def tagged_bot_id(self, resourceARN):
+        bot_id = resourceARN.rsplit("/", 1)[-1]
+        self.bot(bot_id)
+        return bot_id
+
+    def TagResource(self, resourceARN, tags):
+        self.tags[self.tagged_bot_id(resourceARN)].update(tags)
+        return {}
+
+    def ListTagsForResource(self, resourceARN):
+        return {"tags": dict(self.tags[self.tagged_bot_id(resourceARN)])}
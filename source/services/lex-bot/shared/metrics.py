@@ -0,0 +1,49 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import json
+import time
+
+NAMESPACE = "ServerlessBotFramework"
+
+
+def metric_line(name, value, unit="Seconds", **dimensions):
+    """
+    Build a CloudWatch Embedded Metric Format document for a single metric
+    :param name: The metric name
+    :param value: The metric value
+    :param unit: The CloudWatch unit of the metric
+    :param dimensions: Dimension names and values of the metric
+    :return: The EMF document as a dict
+    """
+    document = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": NAMESPACE,
+                    "Dimensions": [sorted(dimensions)],
+                    "Metrics": [{"Name": name, "Unit": unit}],
+                }
+            ],
+        },
+        name: value,
+    }
+    document.update(dimensions)
+    return document
+
+
+def put_metric(name, value, unit="Seconds", **dimensions):
+    """
+    Emit a metric by writing an EMF document to stdout, which Lambda forwards to CloudWatch Logs as-is
+    """
+    print(json.dumps(metric_line(name, value, unit, **dimensions)))  # NOSONAR EMF documents must be raw log lines
@@ -0,0 +1,193 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import threading
+from fnmatch import fnmatchcase
+from time import monotonic, sleep
+from shared.logger import get_logger
+from shared.metrics import put_metric
+
+logger = get_logger(__name__)
+
+# (operation pattern, requests per second, burst) per service, the first matching pattern wins.
+# The Lex model building API allows a few mutating requests per second per account, describes and lists allow more.
+SERVICE_BUDGETS = {
+    "lexv2-models": (
+        ("CreateSlot", 4.0, 4),
+        ("CreateIntent", 4.0, 4),
+        ("UpdateIntent", 4.0, 4),
+        ("BuildBotLocale", 1.0, 2),
+        ("Describe*", 8.0, 8),
+        ("List*", 8.0, 8),
+        ("*", 4.0, 4),
+    ),
+}
+# (requests per second, burst) shared by all operations of a service, on top of their own budget
+SERVICE_TOTAL_BUDGETS = {
+    "lexv2-models": (10.0, 10),
+}
+THROTTLE_ERROR_CODES = ("ThrottlingException", "TooManyRequestsException", "Throttling")
+# a throttled operation continues at this fraction of its rate, never below the minimum rate
+THROTTLE_BACKOFF = 0.5
+MIN_RATE = 0.5
+# rate regained by each successful request, until the budget is reached again
+RATE_RECOVERY = 0.1
+
+_limiters = {}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Callers reserve a token and sleep outside the lock until it is theirs.
+    """
+
+    def __init__(self, rate, burst, clock=monotonic, wait=sleep):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.clock = clock
+        self.wait = wait
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take a token, waiting until one is available
+        :return: Seconds waited
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        if delay:
+            self.wait(delay)
+        return delay
+
+    def throttled(self):
+        with self.lock:
+            self.rate = max(MIN_RATE, self.rate * THROTTLE_BACKOFF)
+
+    def succeeded(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY)
+
+
+class RateLimiter:
+    """
+    Per-operation token buckets of a service, hooked into the request lifecycle of its boto3 clients.
+    Every request also takes a token of the total bucket, if any, so the operations together stay within it.
+    """
+
+    def __init__(self, budgets, clock=monotonic, wait=sleep, total=None):
+        self.budgets = budgets
+        self.clock = clock
+        self.wait = wait
+        self.total = None if total is None else TokenBucket(*total, clock, wait)
+        self.buckets = {}
+        self.throttles = {}
+        self.wait_seconds = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, operation):
+        with self.lock:
+            if operation not in self.buckets:
+                rate, burst = next(
+                    (rate, burst) for pattern, rate, burst in self.budgets if fnmatchcase(operation, pattern)
+                )
+                self.buckets[operation] = TokenBucket(rate, burst, self.clock, self.wait)
+            return self.buckets[operation]
+
+    def before_send(self, event_name, **kwargs):
+        """
+        Handler of the before-send event, emitted for every attempt of a request including retries
+        """
+        operation = event_name.rsplit(".", 1)[-1]
+        waited = self.bucket(operation).acquire()
+        if self.total is not None:
+            waited += self.total.acquire()
+        if waited:
+            with self.lock:
+                self.wait_seconds[operation] = self.wait_seconds.get(operation, 0) + waited
+
+    def needs_retry(self, event_name, response=None, caught_exception=None, **kwargs):
+        """
+        Handler of the needs-retry event, emitted after every attempt. It only observes the attempt and
+        returns None, so the retry handler of the client still decides whether and when to retry.
+        """
+        if response is None:
+            return None
+        operation = event_name.rsplit(".", 1)[-1]
+        error_code = response[1].get("Error", {}).get("Code")
+        if error_code in THROTTLE_ERROR_CODES:
+            self.bucket(operation).throttled()
+            if self.total is not None:
+                self.total.throttled()
+            with self.lock:
+                self.throttles[operation] = self.throttles.get(operation, 0) + 1
+            logger.warning(f"{operation} throttled, reduced its rate to {self.bucket(operation).rate} per second")
+        elif error_code is None:
+            self.bucket(operation).succeeded()
+            if self.total is not None:
+                self.total.succeeded()
+        return None
+
+    def summary(self):
+        """
+        :return: Dict of operation to its throttle count, current rate and seconds spent waiting for a token
+        """
+        with self.lock:
+            return {
+                operation: {
+                    "throttles": self.throttles.get(operation, 0),
+                    "rate": round(bucket.rate, 3),
+                    "waitSeconds": round(self.wait_seconds.get(operation, 0), 3),
+                }
+                for operation, bucket in self.buckets.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.throttles.clear()
+            self.wait_seconds.clear()
+
+
+def attach(client, service_name):
+    """
+    Route every request of a boto3 client through the rate limiter of its service, if the service has budgets
+    :return: The rate limiter, or None if the service is not rate limited
+    """
+    if service_name not in SERVICE_BUDGETS:
+        return None
+    if service_name not in _limiters:
+        total = SERVICE_TOTAL_BUDGETS.get(service_name)
+        _limiters[service_name] = RateLimiter(SERVICE_BUDGETS[service_name], total=total)
+    limiter = _limiters[service_name]
+    service_id = client.meta.service_model.service_id.hyphenize()
+    client.meta.events.register(f"before-send.{service_id}", limiter.before_send)
+    client.meta.events.register(f"needs-retry.{service_id}", limiter.needs_retry)
+    return limiter
+
+
+def report_throttles():
+    """
+    Log the rate limiter summary of every service and emit the throttle counts per operation, then start counting anew
+    """
+    for service_name, limiter in _limiters.items():
+        summary = limiter.summary()
+        if summary:
+            logger.info(f"{service_name} rate limits: {summary}")
+        for operation, stats in summary.items():
+            put_metric("Throttles", stats["throttles"], unit="Count", Service=service_name, Operation=operation)
+        limiter.reset()
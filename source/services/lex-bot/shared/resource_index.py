@@ -0,0 +1,152 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import json
+import threading
+import botocore
+from shared.client import get_client
+from shared.logger import get_logger
+
+client = get_client("lexv2-models")
+logger = get_logger(__name__)
+
+# kind of resource: (list operation, result key, name key, id key)
+LISTINGS = {
+    "bots": ("list_bots", "botSummaries", "botName", "botId"),
+    "slotTypes": ("list_slot_types", "slotTypeSummaries", "slotTypeName", "slotTypeId"),
+    "intents": ("list_intents", "intentSummaries", "intentName", "intentId"),
+    "slots": ("list_slots", "slotSummaries", "slotName", "slotId"),
+}
+CREATE_OPERATIONS = {
+    "create_bot": "bots",
+    "create_slot_type": "slotTypes",
+    "create_intent": "intents",
+    "create_slot": "slots",
+}
+DELETE_OPERATIONS = {
+    "delete_bot": "bots",
+    "delete_slot_type": "slotTypes",
+    "delete_intent": "intents",
+    "delete_slot": "slots",
+}
+# errors of a create call finding the resource already there
+CONFLICT_ERROR_CODES = ("ConflictException", "PreconditionFailedException")
+
+_listings = {}
+_listing_locks = {}
+_index_lock = threading.Lock()
+
+
+def reset_index():
+    """
+    Forget the listings of a previous invocation
+    """
+    with _index_lock:
+        _listings.clear()
+        _listing_locks.clear()
+
+
+def listing_params(kind, params):
+    """
+    :return: The parameters of the list call covering the resource created or deleted with params
+    """
+    if kind == "bots":
+        return {"filters": [{"name": "BotName", "values": [params["botName"]], "operator": "EQ"}]} \
+            if "botName" in params else {}
+    scope = ("botId", "botVersion", "localeId") + (("intentId",) if kind == "slots" else ())
+    return {key: params[key] for key in scope if key in params}
+
+
+def listing_key(kind, params):
+    return kind, json.dumps(params, sort_keys=True)
+
+
+def list_resources(kind, refresh=False, **params):
+    """
+    List resources, following nextToken, the first time they are asked for in this invocation
+    :param kind: A key of LISTINGS
+    :param refresh: List again even if the resources were already listed
+    :param params: Parameters of the list call
+    :return: Dict of resource name to its summary
+    """
+    key = listing_key(kind, params)
+    with _index_lock:
+        lock = _listing_locks.setdefault(key, threading.Lock())
+    with lock:
+        if refresh or key not in _listings:
+            operation, result_key, name_key, _ = LISTINGS[kind]
+            summaries = {}
+            request = dict(params)
+            while True:
+                response = getattr(client, operation)(**request)
+                summaries.update((summary[name_key], summary) for summary in response.get(result_key, []))
+                if not response.get("nextToken"):
+                    break
+                request["nextToken"] = response["nextToken"]
+            _listings[key] = summaries
+        return dict(_listings[key])
+
+
+def find_resource(kind, name, **params):
+    """
+    :return: The summary of the resource with that name, or None
+    """
+    return list_resources(kind, **params).get(name)
+
+
+def cached_listing(kind, params):
+    with _index_lock:
+        return _listings.get(listing_key(kind, listing_params(kind, params)))
+
+
+def create_or_reuse(operation, params):
+    """
+    Create a resource, unless a listing of this invocation already shows it. A create failing because the resource
+    exists, for example when a retried call had succeeded, lists the resources again and reuses the existing one.
+    :param operation: A key of CREATE_OPERATIONS
+    :param params: Parameters of the create call
+    :return: The create response, or the summary of the existing resource
+    """
+    kind = CREATE_OPERATIONS[operation]
+    _, _, name_key, _ = LISTINGS[kind]
+    name = params[name_key]
+    listing = cached_listing(kind, params)
+    if listing is not None and name in listing:
+        logger.info(f"Reusing {kind} {name}")
+        return listing[name]
+    try:
+        response = getattr(client, operation)(**params)
+    except botocore.exceptions.ClientError as error:
+        if error.response["Error"]["Code"] not in CONFLICT_ERROR_CODES:
+            raise
+        existing = list_resources(kind, refresh=True, **listing_params(kind, params)).get(name)
+        if existing is None:
+            raise
+        logger.info(f"Reusing {kind} {name} after {error.response['Error']['Code']}")
+        return existing
+    if listing is not None:
+        with _index_lock:
+            listing[name] = dict(response, **{name_key: name})
+    return response
+
+
+def forget_resource(operation, params):
+    """
+    Remove a deleted resource from the listings of this invocation
+    """
+    kind = DELETE_OPERATIONS[operation]
+    id_key = LISTINGS[kind][3]
+    with _index_lock:
+        for (listing_kind, _), listing in _listings.items():
+            if listing_kind == kind:
+                for name in [name for name, summary in listing.items() if summary.get(id_key) == params[id_key]]:
+                    del listing[name]
@@ -0,0 +1,178 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Deadline-aware execution of crhelper custom resources. The module only depends on crhelper and boto3, the
+webclient-setup function links to this file instead of keeping a copy of it.
+"""
+import os
+import json
+import logging
+import threading
+import boto3
+from botocore.config import Config
+from crhelper import CfnResource
+from crhelper.resource_helper import FAILED
+
+logger = logging.getLogger(__name__)
+
+# event key counting the invocations a request was handed over to
+CONTINUATION_KEY = "ContinuationCount"
+# event key of the progress the new invocation resumes from
+TOKEN_KEY = "ContinuationToken"
+# CloudFormation fails a custom resource that did not respond within an hour
+CLOUDFORMATION_TIMEOUT_SECONDS = 3600
+# the invocation is flagged as out of time this many seconds before it times out, leaving time to hand over
+HANDOVER_SECONDS = 5
+
+_lambda_client = None
+
+
+class ContinueInNewInvocation(Exception):
+    """
+    Raised once the progress of a request is saved and a new invocation has to complete it
+    :param token: JSON serializable progress passed to the new invocation, see get_continuation_token
+    """
+
+    def __init__(self, reason="", token=None):
+        super().__init__(reason)
+        self.token = token
+
+
+def get_lambda_client():
+    global _lambda_client
+    if _lambda_client is None:
+        user_agent = json.loads(os.environ.get("AWS_SDK_USER_AGENT", "{}"))
+        _lambda_client = boto3.client("lambda", config=Config(retries={"mode": "standard"}, **user_agent))
+    return _lambda_client
+
+
+def max_continuations(invocation_seconds):
+    """
+    The invocations of a request, the first one included, have to complete within CLOUDFORMATION_TIMEOUT_SECONDS.
+    One invocation is kept in reserve for the time continuations spend queued.
+    :param invocation_seconds: Duration of an invocation, the timeout of the function
+    :return: Number of times a request may be handed over to a new invocation
+    """
+    return max(int(CLOUDFORMATION_TIMEOUT_SECONDS // invocation_seconds) - 2, 0)
+
+
+def get_continuation_token(event):
+    """
+    :return: The progress handed over by the previous invocation of the request, or None on its first invocation
+    """
+    return event.get(TOKEN_KEY)
+
+
+class ResumableResource(CfnResource):
+    """
+    CfnResource that hands a request over to a new asynchronous invocation of the function, instead of failing it,
+    when the handler raises ContinueInNewInvocation.
+    The handover is cooperative: HANDOVER_SECONDS before the timeout a timer only flags the invocation as out of
+    time, the handler checks it between two steps with continue_if_out_of_time, and the function invokes itself
+    once the handler has returned. A request is never run by two invocations at the same time, and every
+    invocation whose handler completes answers CloudFormation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._continued = False
+        self._out_of_time = threading.Event()
+        self._handover_timer = None
+        self._invocation_seconds = None
+
+    def __call__(self, event, context):
+        self._continued = False
+        self._out_of_time.clear()
+        self._invocation_seconds = None
+        try:
+            super().__call__(event, context)
+        finally:
+            if self._handover_timer is not None:
+                self._handover_timer.cancel()
+
+    def remaining_seconds(self):
+        """
+        :return: Seconds left before the request has to be handed over, or None outside of a Lambda invocation
+        """
+        get_remaining_time = getattr(getattr(self, "_context", None), "get_remaining_time_in_millis", None)
+        if get_remaining_time is None:
+            return None
+        return get_remaining_time() / 1000 - HANDOVER_SECONDS
+
+    def out_of_time(self):
+        """
+        :return: True once the invocation has to hand the request over
+        """
+        return self._out_of_time.is_set()
+
+    def continue_if_out_of_time(self, token, seconds=0):
+        """
+        :param token: Progress to resume from in the new invocation
+        :param seconds: Time the next step of the handler needs
+        :raises ContinueInNewInvocation: if the invocation is out of time or less than seconds are left in it
+        """
+        remaining = self.remaining_seconds()
+        if self.out_of_time() or (remaining is not None and remaining < seconds):
+            raise ContinueInNewInvocation(f"{max(remaining or 0, 0):.1f} seconds left", token)
+
+    def _wrap_function(self, func):
+        try:
+            self.PhysicalResourceId = func(self._event, self._context) if func else ""
+        except ContinueInNewInvocation as error:
+            logger.info(f"Continuing in a new invocation: {error}")
+            self._continue_in_new_invocation(error.token)
+        except Exception as e:
+            logger.error(str(e), exc_info=True)
+            self.Reason = str(e)
+            self.Status = FAILED
+
+    def _set_timeout(self):
+        # crhelper still fails the request 0.5 s before the timeout if the handler ignores the flag
+        super()._set_timeout()
+        self._invocation_seconds = self._context.get_remaining_time_in_millis() / 1000
+        self._handover_timer = threading.Timer(
+            max(self._invocation_seconds - HANDOVER_SECONDS, 0), self._out_of_time.set
+        )
+        self._handover_timer.start()
+
+    def _continue_in_new_invocation(self, token):
+        continuation = self._event.get(CONTINUATION_KEY, 0) + 1
+        # crhelper does not set the timeout under SAM local, the time left in the invocation stands in for its duration
+        invocation_seconds = self._invocation_seconds or self._context.get_remaining_time_in_millis() / 1000
+        limit = max_continuations(invocation_seconds)
+        if continuation > limit:
+            self.Reason = f"Request not completed after {limit} continuations"
+            self.Status = FAILED
+            return
+        event = dict(self._event, **{CONTINUATION_KEY: continuation})
+        if token is not None:
+            event[TOKEN_KEY] = token
+        try:
+            response = get_lambda_client().invoke(
+                FunctionName=self._context.invoked_function_arn,
+                InvocationType="Event",
+                Payload=json.dumps(event),
+            )
+        except Exception as e:
+            logger.error(str(e), exc_info=True)
+            self.Reason = f"Failed to continue the request in a new invocation: {e}"
+            self.Status = FAILED
+            return
+        logger.info(f"Continuation {continuation} invoked with status {response['StatusCode']}")
+        self._continued = True
+
+    def _cfn_response(self, event):
+        if self._continued:
+            logger.info("Request handed over to a new invocation, not responding to CloudFormation yet")
+            return
+        super()._cfn_response(event)
@@ -0,0 +1,59 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+from unittest import TestCase
+
+
+class BotDefinitionTest(TestCase):
+    def test_add_intent(self):
+        from shared.bot_definition import BotDefinition
+        definition = BotDefinition({"botName": "testbot"}, {"botAliasName": "TestBotAlias"})
+        definition.add_locale("en_US", nluIntentConfidenceThreshold=0.4)
+        definition.add_intent("en_US", {"intentName": "Help", "slotTypes": [], "slots": []})
+        self.assertEqual(definition.locale_settings("en_US"), {"nluIntentConfidenceThreshold": 0.4})
+        self.assertEqual([intent["intentName"] for intent in definition.intents("en_US")], ["Help"])
+        self.assertRaises(ValueError, definition.add_intent, "en_US", {"intentName": "Help"})
+        self.assertRaises(ValueError, definition.add_locale, "en_US")
+
+    def test_slot_types(self):
+        from shared.bot_definition import BotDefinition
+        definition = BotDefinition({}, {})
+        definition.add_locale("en_US")
+        definition.add_intent("en_US", {"intentName": "A", "slotTypes": [{"slotTypeName": "T", "v": 1}], "slots": []})
+        definition.add_intent("en_US", {"intentName": "B", "slotTypes": [{"slotTypeName": "T", "v": 1}], "slots": []})
+        self.assertEqual(definition.slot_types("en_US"), {"T": {"slotTypeName": "T", "v": 1}})
+        definition.add_intent("en_US", {"intentName": "C", "slotTypes": [{"slotTypeName": "T", "v": 2}], "slots": []})
+        self.assertRaises(ValueError, definition.slot_types, "en_US")
+
+    def test_to_dict(self):
+        from shared.bot_definition import BotDefinition
+        definition = BotDefinition({"botName": "testbot"}, {"botAliasName": "TestBotAlias"})
+        definition.add_locale("en_US")
+        definition.set_alias_locale_settings("en_US", {"enabled": True})
+        result = definition.to_dict()
+        result["alias"]["botAliasLocaleSettings"].clear()
+        self.assertEqual(definition.alias_settings["botAliasLocaleSettings"], {"en_US": {"enabled": True}})
+        self.assertEqual(sorted(result), ["alias", "bot", "locales"])
+
+    def test_fingerprint(self):
+        from shared.bot_definition import BotDefinition
+
+        def definition(utterance):
+            bot_definition = BotDefinition({}, {})
+            bot_definition.add_locale("en_US", nluIntentConfidenceThreshold=0.4)
+            bot_definition.add_intent(
+                "en_US", {"intentName": "Help", "sampleUtterances": [{"utterance": utterance}], "slotTypes": [], "slots": []}
+            )
+            return bot_definition
+
+        self.assertEqual(definition("help").fingerprint("en_US"), definition("help").fingerprint("en_US"))
+        self.assertNotEqual(definition("help").fingerprint("en_US"), definition("help me").fingerprint("en_US"))
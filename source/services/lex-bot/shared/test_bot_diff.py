@@ -0,0 +1,139 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import copy
+from unittest import TestCase, mock
+from mock import patch
+
+mock_env_variables = {
+    "botName": "testbot",
+    "botLanguage": "English",
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+
+
+def desired():
+    from order_pizza.intent import intent_definition as order_pizza_definition
+    from other_intents.help_intent import intent_definition as help_definition
+    return [order_pizza_definition("English"), help_definition("English")]
+
+
+def as_described(desired_intents):
+    """
+    Build what read_locale returns for a locale that matches the desired intents, with ids and Lex defaults added
+    """
+    slot_types = {}
+    for intent in desired_intents:
+        for slot_type in intent["slotTypes"]:
+            slot_types[slot_type["slotTypeName"]] = dict(
+                copy.deepcopy(slot_type), slotTypeId=f"{slot_type['slotTypeName']}-id", creationDateTime="now"
+            )
+    intents = {}
+    for intent in desired_intents:
+        described = {key: copy.deepcopy(value) for key, value in intent.items() if key not in ("slots", "slotTypes")}
+        described["intentId"] = f"{intent['intentName']}-id"
+        described["slots"] = {}
+        for slot in intent["slots"]:
+            slot_type_name = slot["slotTypeName"]
+            described["slots"][slot["slotName"]] = dict(
+                copy.deepcopy(slot),
+                slotId=f"{slot['slotName']}-id",
+                slotTypeId=slot_types[slot_type_name]["slotTypeId"] if slot_type_name in slot_types else slot_type_name,
+            )
+        described["slotOrder"] = [slot["slotName"] for slot in intent["slots"]]
+        intents[intent["intentName"]] = described
+    return {"slotTypes": slot_types, "intents": intents}
+
+
+@patch.dict(os.environ, mock_env_variables)
+class BotDiffTest(TestCase):
+    def setUp(self):
+        from shared.resource_index import reset_index
+        reset_index()
+
+    def test_matches_ignores_lex_defaults(self):
+        from shared.bot_diff import matches
+        self.assertTrue(matches({"a": {"b": 1}}, {"a": {"b": 1, "active": True}, "c": 2}))
+        self.assertFalse(matches({"a": [{"b": 1}]}, {"a": [{"b": 1}, {"b": 2}]}))
+        self.assertFalse(matches({"a": 1}, {}))
+
+    def test_diff_locale_without_changes(self):
+        from shared.bot_diff import diff_locale
+        desired_intents = desired()
+        self.assertEqual(diff_locale(desired_intents, as_described(desired_intents)), [])
+
+    def test_diff_locale_detects_changes(self):
+        from shared.bot_diff import diff_locale
+        desired_intents = desired()
+        current = as_described(desired_intents)
+        current["intents"]["Help"]["sampleUtterances"] = [{"utterance": "help"}]
+        current["slotTypes"]["PizzaCrust"]["slotTypeValues"] = []
+        current["intents"]["PizzaOrder"]["slots"]["extra"] = {"slotId": "extra-id", "slotTypeName": "AMAZON.Number"}
+        current["intents"]["Old"] = {"intentId": "old-id", "intentName": "Old", "slots": {}, "slotOrder": []}
+        current["slotTypes"]["OldType"] = {"slotTypeId": "old-type-id", "slotTypeName": "OldType"}
+        changes = diff_locale(desired_intents, current)
+        self.assertCountEqual(
+            changes,
+            [
+                ("update", "slotType", "PizzaCrust"),
+                ("update", "intent", "Help"),
+                ("delete", "slot", ("PizzaOrder", "extra")),
+                ("delete", "intent", "Old"),
+                ("delete", "slotType", "OldType"),
+            ],
+        )
+
+    def test_diff_locale_detects_slot_priority_changes(self):
+        from shared.bot_diff import diff_locale
+        desired_intents = desired()
+        current = as_described(desired_intents)
+        current["intents"]["PizzaOrder"]["slotOrder"].reverse()
+        self.assertEqual(diff_locale(desired_intents, current), [("update", "intent", "PizzaOrder")])
+
+    @patch("shared.resource_index.client")
+    @patch("shared.bot_diff.client")
+    def test_read_locale(self, mock_client, mock_index_client):
+        from shared.bot_diff import read_locale
+        mock_index_client.list_slot_types.return_value = {
+            "slotTypeSummaries": [{"slotTypeId": "st1", "slotTypeName": "PizzaType"}]
+        }
+        mock_index_client.list_intents.side_effect = [
+            {
+                "intentSummaries": [{"intentId": "i1", "intentName": "PizzaOrder"}],
+                "nextToken": "page2",
+            },
+            {"intentSummaries": [{"intentId": "fallback", "intentName": "FallbackIntent"}]},
+        ]
+        mock_client.describe_slot_type.return_value = {"slotTypeId": "st1", "slotTypeName": "PizzaType"}
+        mock_client.describe_intent.return_value = {
+            "intentId": "i1",
+            "intentName": "PizzaOrder",
+            "slotPriorities": [{"priority": 2, "slotId": "s1"}, {"priority": 1, "slotId": "s2"}],
+        }
+        mock_index_client.list_slots.return_value = {
+            "slotSummaries": [{"slotId": "s1", "slotName": "type"}, {"slotId": "s2", "slotName": "count"}]
+        }
+        mock_client.describe_slot.side_effect = lambda slotId, **_: {
+            "s1": {"slotId": "s1", "slotName": "type", "slotTypeId": "st1"},
+            "s2": {"slotId": "s2", "slotName": "count", "slotTypeId": "AMAZON.Number"},
+        }[slotId]
+
+        current = read_locale("botid", "en_US")
+
+        self.assertEqual(list(current["intents"]), ["PizzaOrder"])
+        self.assertEqual(current["intents"]["PizzaOrder"]["slotOrder"], ["count", "type"])
+        self.assertEqual(current["intents"]["PizzaOrder"]["slots"]["type"]["slotTypeName"], "PizzaType")
+        self.assertEqual(current["intents"]["PizzaOrder"]["slots"]["count"]["slotTypeName"], "AMAZON.Number")
+        mock_index_client.list_intents.assert_called_with(
+            botId="botid", botVersion="DRAFT", localeId="en_US", nextToken="page2"
+        )
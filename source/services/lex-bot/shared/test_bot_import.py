@@ -0,0 +1,131 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import io
+import os
+import json
+import zipfile
+from unittest import TestCase, mock
+from mock import patch
+import pytest
+
+mock_env_variables = {
+    "botName": "testbot",
+    "botLanguage": "English",
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+
+
+def definition():
+    from shared.bot_definition import BotDefinition
+    from order_pizza.intent import populate
+    bot_definition = BotDefinition(
+        {
+            "botName": "testbot",
+            "description": "Created by Serverless Bot Framework",
+            "roleArn": "testARN",
+            "dataPrivacy": {"childDirected": False},
+            "idleSessionTTLInSeconds": 300,
+        },
+        {},
+    )
+    bot_definition.add_locale("en_US", description="created English from lambda", nluIntentConfidenceThreshold=0.4)
+    populate(bot_definition, "en_US", "English")
+    return bot_definition
+
+
+@patch.dict(os.environ, mock_env_variables)
+class BotImportTest(TestCase):
+    def setUp(self):
+        from shared.waiter import start_invocation
+        from shared.testing import FakeClock
+        self.clock = FakeClock()
+        start_invocation(None, self.clock, self.clock.wait)
+
+    def test_render_files(self):
+        from shared.bot_import import render_files
+        files = render_files(definition())
+        self.assertEqual(files["Manifest.json"]["metadata"]["fileFormat"], "LexJson")
+        self.assertEqual(files["testbot/Bot.json"]["dataPrivacy"], {"childDirected": False})
+        locale = "testbot/BotLocales/en_US"
+        self.assertEqual(files[f"{locale}/BotLocale.json"]["nluConfidenceThreshold"], 0.4)
+        self.assertIn(f"{locale}/Intents/FallbackIntent/Intent.json", files)
+        self.assertEqual(files[f"{locale}/SlotTypes/PizzaCrust/SlotType.json"]["name"], "PizzaCrust")
+
+        intent = files[f"{locale}/Intents/PizzaOrder/Intent.json"]
+        self.assertEqual(intent["name"], "PizzaOrder")
+        self.assertNotIn("slots", intent)
+        self.assertEqual(
+            [priority["slotName"] for priority in intent["slotPriorities"]], ["type", "size", "crust", "count"]
+        )
+        slot = files[f"{locale}/Intents/PizzaOrder/Slots/count/Slot.json"]
+        self.assertEqual(slot["slotTypeName"], "AMAZON.Number")
+        self.assertRegex(slot["identifier"], "^[A-Z2-7]{10}$")
+        self.assertNotEqual(slot["identifier"], files[f"{locale}/Intents/PizzaOrder/Slots/size/Slot.json"]["identifier"])
+
+    def test_render_archive(self):
+        from shared.bot_import import render_archive, render_files
+        bot_definition = definition()
+        with zipfile.ZipFile(io.BytesIO(render_archive(bot_definition))) as archive:
+            self.assertEqual(sorted(archive.namelist()), sorted(render_files(bot_definition)))
+            self.assertEqual(json.loads(archive.read("testbot/Bot.json"))["name"], "testbot")
+
+    @patch("urllib.request.urlopen")
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_start_bot_import(self, mock_client, mock_urlopen):
+        from shared.bot_import import start_bot_import
+        mock_client.side_effect = [
+            {"importId": "testimportid", "uploadUrl": "https://upload"},
+            {"importId": "testimportid", "importStatus": "InProgress"},
+        ]
+        self.assertEqual(start_bot_import(definition(), {"createdby": "test"}), "testimportid")
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual((request.full_url, request.get_method()), ("https://upload", "PUT"))
+        self.assertTrue(zipfile.is_zipfile(io.BytesIO(request.data)))
+        mock_client.assert_called_with(
+            "StartImport",
+            {
+                "importId": "testimportid",
+                "resourceSpecification": {
+                    "botImportSpecification": {
+                        "botName": "testbot",
+                        "roleArn": "testARN",
+                        "dataPrivacy": {"childDirected": False},
+                        "idleSessionTTLInSeconds": 300,
+                        "botTags": {"createdby": "test"},
+                    }
+                },
+                "mergeStrategy": "Overwrite",
+            },
+        )
+
+    @patch(
+        "botocore.client.BaseClient._make_api_call",
+        side_effect=[
+            {"importStatus": "InProgress"},
+            {"importStatus": "Completed", "importedResourceId": "testbotid"},
+        ],
+    )
+    def test_wait_for_import(self, mock_client):
+        from shared.bot_import import wait_for_import
+        self.assertEqual(wait_for_import("testimportid"), "testbotid")
+        mock_client.assert_called_with("DescribeImport", {"importId": "testimportid"})
+        self.assertEqual(len(self.clock.waits), 1)
+
+    @patch(
+        "botocore.client.BaseClient._make_api_call",
+        return_value={"importStatus": "Failed", "failureReasons": ["invalid slot"]},
+    )
+    def test_wait_for_import_failed(self, mock_client):
+        from shared.bot_import import wait_for_import
+        with pytest.raises(RuntimeError, match="invalid slot"):
+            wait_for_import("testimportid")
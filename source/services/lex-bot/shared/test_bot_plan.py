@@ -0,0 +1,192 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import json
+from unittest import TestCase
+from mock import patch
+
+mock_env_variables = {
+    "botName": "testbot",
+    "botLanguage": "English",
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+
+
+def definition():
+    from shared.bot_definition import BotDefinition
+    from order_pizza.intent import populate as populate_order_pizza
+    from other_intents.help_intent import populate as populate_help
+    bot_definition = BotDefinition({"botName": "testbot"}, {"botAliasName": "TestBotAlias", "botVersion": "DRAFT"})
+    bot_definition.add_locale("en_US")
+    populate_order_pizza(bot_definition, "en_US", "English")
+    populate_help(bot_definition, "en_US", "English")
+    return bot_definition
+
+
+def as_described(bot_definition, intent_names=None):
+    from shared.test_bot_diff import as_described as describe
+    intents = bot_definition.intents("en_US")
+    return describe([intent for intent in intents if intent_names is None or intent["intentName"] in intent_names])
+
+
+@patch.dict(os.environ, mock_env_variables)
+class BotPlanTest(TestCase):
+    def setUp(self):
+        with patch.dict(os.environ, mock_env_variables):
+            from shared.resource_index import reset_index
+        reset_index()
+
+    def test_compile_changes_without_changes(self):
+        from shared.bot_plan import compile_changes, execute_plan
+        bot_definition = definition()
+        steps = compile_changes(bot_definition, "en_US", "botid", as_described(bot_definition), [])
+        self.assertEqual(steps, [])
+        self.assertEqual(execute_plan(steps), {})
+
+    def test_compile_locale(self):
+        from shared.bot_plan import count_calls
+        from shared.testing import compile_locale
+        steps = compile_locale(definition(), "en_US", "botid")
+        self.assertEqual(
+            count_calls(steps),
+            {"create_slot_type": 3, "create_intent": 2, "create_slot": 4, "update_intent": 1},
+        )
+        update_intent = next(step for step in steps if step.operation == "update_intent")
+        self.assertCountEqual(
+            update_intent.depends_on,
+            ["create_intent:en_US:PizzaOrder"] + [f"create_slot:en_US:PizzaOrder.{name}" for name in ("type", "size", "crust", "count")],
+        )
+        # an intent without slots is created with all of its settings at once
+        create_help = next(step for step in steps if step.name == "create_intent:en_US:Help")
+        self.assertEqual(create_help.depends_on, ())
+        self.assertIn("sampleUtterances", create_help.params)
+
+    @patch("shared.bot_plan.client")
+    def test_execute_plan_creates_missing_intent(self, mock_client):
+        from shared.bot_diff import diff_locale
+        from shared.bot_plan import compile_changes, execute_plan
+        bot_definition = definition()
+        current = as_described(bot_definition, ["Help"])
+        mock_client.create_slot_type.side_effect = lambda **kwargs: {"slotTypeId": f"new-{kwargs['slotTypeName']}"}
+        mock_client.create_intent.return_value = {"intentId": "new-intent"}
+        mock_client.create_slot.side_effect = lambda **kwargs: {"slotId": f"new-{kwargs['slotName']}"}
+
+        changes = diff_locale(bot_definition.intents("en_US"), current)
+        with patch("shared.resource_index.client", mock_client):
+            results = execute_plan(compile_changes(bot_definition, "en_US", "botid", current, changes))
+
+        self.assertEqual(len(results), 3 + 1 + 4 + 1)
+        pizza_type_slot = bot_definition.intents("en_US")[0]["slots"][0]
+        mock_client.create_slot.assert_any_call(**{
+            **{key: value for key, value in pizza_type_slot.items() if key != "slotTypeName"},
+            "slotTypeId": "new-PizzaType",
+            "intentId": "new-intent",
+            "botId": "botid",
+            "botVersion": "DRAFT",
+            "localeId": "en_US",
+        })
+        slot_priorities = mock_client.update_intent.call_args.kwargs["slotPriorities"]
+        self.assertEqual(
+            slot_priorities,
+            [
+                {"priority": 1, "slotId": "new-type"},
+                {"priority": 2, "slotId": "new-size"},
+                {"priority": 3, "slotId": "new-crust"},
+                {"priority": 4, "slotId": "new-count"},
+            ],
+        )
+
+    @patch("shared.bot_plan.client")
+    def test_execute_plan_deletes_after_updates(self, mock_client):
+        from shared.bot_plan import compile_changes, execute_plan
+        bot_definition = definition()
+        current = as_described(bot_definition)
+        current["intents"]["PizzaOrder"]["slots"]["extra"] = {"slotId": "extra-id", "slotTypeName": "OldType"}
+        current["slotTypes"]["OldType"] = {"slotTypeId": "old-type-id", "slotTypeName": "OldType"}
+        changes = [
+            ("update", "intent", "PizzaOrder"),
+            ("delete", "slot", ("PizzaOrder", "extra")),
+            ("delete", "slotType", "OldType"),
+        ]
+        execute_plan(compile_changes(bot_definition, "en_US", "botid", current, changes))
+        names = [call[0] for call in mock_client.mock_calls]
+        self.assertEqual(names, ["update_intent", "delete_slot", "delete_slot_type"])
+
+    def test_dry_run(self):
+        from shared.bot_plan import dry_run
+        from shared.testing import compile_locale
+        lines = [json.loads(line) for line in dry_run(compile_locale(definition(), "en_US", "botid"))]
+        create_slot = next(line for line in lines if line["step"] == "create_slot:en_US:PizzaOrder.crust")
+        self.assertEqual(create_slot["operation"], "create_slot")
+        self.assertEqual(create_slot["params"]["slotTypeId"], "<create_slot_type:en_US:PizzaCrust.slotTypeId>")
+        self.assertEqual(create_slot["params"]["intentId"], "<create_intent:en_US:PizzaOrder.intentId>")
+
+    def test_compile_alias(self):
+        from shared.bot_plan import compile_alias
+        bot_definition = definition()
+        bot_definition.set_alias_locale_settings("en_US", {"enabled": True})
+        (step,) = compile_alias(bot_definition, "botid", "aliasid")
+        self.assertEqual(step.operation, "update_bot_alias")
+        self.assertEqual(step.params["botAliasLocaleSettings"], {"en_US": {"enabled": True}})
+        self.assertEqual((step.params["botId"], step.params["botAliasId"]), ("botid", "aliasid"))
+
+    def test_compile_teardown_at_narrowest_scope(self):
+        from shared.bot_plan import compile_teardown
+        slot = ("slot", "bot2", "fr_FR", "intent1", "slot1")
+        slot_type = ("slotType", "bot2", "fr_FR", "type1")
+        steps = compile_teardown(
+            [
+                ("bot", "bot1"),
+                ("intent", "bot1", "en_US", "intent1"),
+                ("locale", "bot2", "en_US"),
+                ("slotType", "bot2", "en_US", "type1"),
+                slot,
+                ("intent", "bot2", "fr_FR", "intent1"),
+                slot_type,
+                ("slot", "bot2", "fr_FR", "intent2", "slot2"),
+            ],
+            references={slot_type: [slot, ("slot", "bot2", "fr_FR", "intent2", "slot2")]},
+        )
+        self.assertEqual(
+            [(step.name, step.depends_on) for step in steps],
+            [
+                ("delete_bot:bot1", ()),
+                ("delete_bot_locale:bot2:en_US", ()),
+                ("delete_intent:bot2:fr_FR:intent1", ()),
+                (
+                    "delete_slot_type:bot2:fr_FR:type1",
+                    ("delete_intent:bot2:fr_FR:intent1", "delete_slot:bot2:fr_FR:intent2:slot2"),
+                ),
+                ("delete_slot:bot2:fr_FR:intent2:slot2", ()),
+            ],
+        )
+        self.assertEqual(steps[0].params, {"botId": "bot1", "skipResourceInUseCheck": True})
+        self.assertEqual(steps[1].params, {"botId": "bot2", "botVersion": "DRAFT", "localeId": "en_US"})
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_execute_teardown(self, mock_client):
+        import botocore
+        from shared.bot_plan import compile_teardown, execute_plan
+
+        def make_api_call(operation, params):
+            if operation == "DeleteBot" and params["botId"] == "bot1":
+                return {"botStatus": "Deleting"}
+            # bot2 is already gone
+            raise botocore.exceptions.ClientError({"Error": {"Code": "ResourceNotFoundException"}}, operation)
+
+        mock_client.side_effect = make_api_call
+        steps = compile_teardown([("bot", "bot1"), ("bot", "bot2")])
+        results = execute_plan(steps)
+        self.assertEqual(results, {"delete_bot:bot1": {"botStatus": "Deleting"}, "delete_bot:bot2": {}})
+        # the deletes Lex completes in the background are not waited for
+        self.assertEqual(sorted(call[0][0] for call in mock_client.call_args_list), ["DeleteBot", "DeleteBot"])
@@ -0,0 +1,108 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+from time import perf_counter
+from unittest import TestCase
+from mock import patch
+import pytest
+from shared.bot_definition import BotDefinition
+from shared.bot_validation import validate_definition, DefinitionError
+
+mock_env_variables = {
+    "botName": "testbot",
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+# validating every supported language, building the definition included
+VALIDATION_BUDGET_SECONDS = 0.5
+
+
+def intent(name, utterances, slots=(), slot_types=(), message="Done"):
+    return {
+        "intentName": name,
+        "description": f"{name} intent",
+        "sampleUtterances": [{"utterance": utterance} for utterance in utterances],
+        "intentClosingSetting": {
+            "closingResponse": {"messageGroups": [{"message": {"plainTextMessage": {"value": message}}}]}
+        },
+        "slotTypes": list(slot_types),
+        "slots": list(slots),
+    }
+
+
+def definition_with(*intents):
+    definition = BotDefinition({"botName": "testbot"}, {"botAliasName": "TestBotAlias"})
+    definition.add_locale("en_US")
+    for value in intents:
+        definition.add_intent("en_US", value)
+    return definition
+
+
+class BotValidationTest(TestCase):
+    @patch.dict(os.environ, mock_env_variables)
+    def test_supported_languages_are_valid(self):
+        from lambda_function import build_bot_definition
+        from shared.helpers import LANGUAGE_LOCALES
+        start = perf_counter()
+        validate_definition(build_bot_definition("testbot", "testARN", "no", list(LANGUAGE_LOCALES)))
+        self.assertLess(perf_counter() - start, VALIDATION_BUDGET_SECONDS)
+
+    def test_duplicate_and_shared_utterances(self):
+        with pytest.raises(DefinitionError) as error:
+            validate_definition(definition_with(
+                intent("Help", ["help", "Help  me", "help me"]),
+                intent("Name", ["who are you", "HELP"]),
+            ))
+        self.assertEqual(
+            error.value.problems,
+            [
+                "en_US intent Help: utterance 'help me' is duplicated",
+                "en_US: utterance 'help' is shared by intents Help, Name",
+            ],
+        )
+
+    def test_slot_references(self):
+        size = {"slotName": "size", "slotTypeName": "PizzaSize"}
+        count = {"slotName": "count", "slotTypeName": "AMAZON.Number"}
+        slot_type = {
+            "slotTypeName": "PizzaSize",
+            "description": "Size",
+            "slotTypeValues": [{"sampleValue": {"value": "small"}}, {"sampleValue": {"value": "Small"}}],
+        }
+        with pytest.raises(DefinitionError) as error:
+            validate_definition(definition_with(
+                intent("Order", ["{count} {size} pizzas", "a {crust} pizza"], [size, count], [slot_type],
+                       message="Your {size} {topping} pizza"),
+                intent("Other", ["other"], [{"slotName": "city", "slotTypeName": "City"}]),
+            ))
+        self.assertEqual(
+            error.value.problems,
+            [
+                "en_US slot type PizzaSize: value 'Small' is duplicated",
+                "en_US intent Order: utterance 'a {crust} pizza' references unknown slot {crust}",
+                "en_US intent Order: message 'Your {size} {topping} pizza' references unknown slot {topping}",
+                "en_US intent Other slot city: slot type City is not defined",
+            ],
+        )
+
+    def test_lex_limits(self):
+        with pytest.raises(DefinitionError) as error:
+            validate_definition(definition_with(intent("Help", ["x" * 201, " "], message="m" * 1001)))
+        self.assertEqual(
+            error.value.problems,
+            [
+                "en_US intent Help: utterance has 201 characters, more than 200",
+                "en_US intent Help: utterance is empty",
+                "en_US intent Help: message has 1001 characters, more than 1000",
+            ],
+        )
+        self.assertIsInstance(error.value, ValueError)
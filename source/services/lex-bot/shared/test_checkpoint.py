@@ -0,0 +1,95 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import json
+from unittest import TestCase, mock
+from mock import patch
+import pytest
+
+mock_env_variables = {
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+
+
+@patch.dict(os.environ, mock_env_variables)
+class CheckpointTest(TestCase):
+    def setUp(self):
+        from shared.waiter import start_invocation
+        start_invocation(None)
+
+    def test_run_phases(self):
+        from shared.checkpoint import LocalCheckpointStore, run_phases
+        store = LocalCheckpointStore()
+        calls = []
+        phases = [(name, lambda state, name=name: calls.append(name)) for name in ("first", "second", "third")]
+        state = {"completedPhases": ["first"]}
+        run_phases(phases, state, store, "key")
+        self.assertEqual(calls, ["second", "third"])
+        self.assertEqual(state["completedPhases"], ["first", "second", "third"])
+        self.assertIsNone(store.load("key"))
+
+    def test_run_phases_continues_when_time_is_short(self):
+        from shared.checkpoint import LocalCheckpointStore, ContinueInNewInvocation, run_phases
+        from shared.waiter import start_invocation
+        store = LocalCheckpointStore()
+        remaining = iter([30000, 5000])
+
+        def first(state):
+            state["botId"] = "testbotid"
+            start_invocation(mock.Mock(get_remaining_time_in_millis=lambda: next(remaining)))
+
+        start_invocation(mock.Mock(get_remaining_time_in_millis=lambda: next(remaining)))
+        with pytest.raises(ContinueInNewInvocation):
+            run_phases([("first", first), ("second", mock.Mock())], {}, store, "key")
+        self.assertEqual(store.load("key"), {"completedPhases": ["first"], "botId": "testbotid"})
+
+    def test_run_phases_continues_when_a_wait_times_out(self):
+        from shared.checkpoint import LocalCheckpointStore, ContinueInNewInvocation, run_phases
+        from shared.waiter import WaiterTimeout
+        store = LocalCheckpointStore()
+        with pytest.raises(ContinueInNewInvocation):
+            run_phases([("wait", mock.Mock(side_effect=WaiterTimeout("timed out")))], {}, store, "key")
+        self.assertEqual(store.load("key"), {"completedPhases": []})
+
+    def test_run_phases_failure(self):
+        from shared.checkpoint import LocalCheckpointStore, run_phases
+        store = LocalCheckpointStore()
+        with pytest.raises(RuntimeError):
+            run_phases([("fail", mock.Mock(side_effect=RuntimeError("failed")))], {}, store, "key")
+        self.assertIsNone(store.load("key"))
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_ssm_checkpoint_store(self, mock_client):
+        from shared.checkpoint import SSMCheckpointStore
+        store = SSMCheckpointStore("/test/checkpoints/")
+        store.save("LexBot/request1", {"completedPhases": ["bot"]})
+        mock_client.assert_called_with(
+            "PutParameter",
+            {
+                "Name": "/test/checkpoints/LexBot/request1",
+                "Value": json.dumps({"completedPhases": ["bot"]}),
+                "Type": "String",
+                "Overwrite": True,
+            },
+        )
+        mock_client.return_value = {"Parameter": {"Value": '{"completedPhases": ["bot"]}'}}
+        self.assertEqual(store.load("LexBot/request1"), {"completedPhases": ["bot"]})
+        store.delete("LexBot/request1")
+        mock_client.assert_called_with("DeleteParameter", {"Name": "/test/checkpoints/LexBot/request1"})
+
+    @patch.dict(os.environ, {"checkpointParameterPrefix": "/test/checkpoints"})
+    def test_get_checkpoint_store(self):
+        from shared.checkpoint import SSMCheckpointStore, LocalCheckpointStore, get_checkpoint_store
+        self.assertIsInstance(get_checkpoint_store(), SSMCheckpointStore)
+        del os.environ["checkpointParameterPrefix"]
+        self.assertIsInstance(get_checkpoint_store(), LocalCheckpointStore)
@@ -0,0 +1,80 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import copy
+import json
+import tempfile
+from unittest import TestCase
+from mock import patch
+import pytest
+from shared.content_catalog import ContentCatalog, get_catalog, reset_catalog, content, freeze
+
+
+class ContentCatalogTest(TestCase):
+    def setUp(self):
+        reset_catalog()
+
+    def tearDown(self):
+        reset_catalog()
+
+    def test_catalog_is_built_once(self):
+        from order_pizza.order_helpers import slot_types, SLOT_TYPES
+        catalog = get_catalog()
+        self.assertIs(get_catalog(), catalog)
+        self.assertIs(slot_types("PizzaSize", "German"), slot_types("PizzaSize", "German"))
+        self.assertEqual(slot_types("PizzaSize", "German"), SLOT_TYPES["PizzaSize"]["German"])
+        self.assertEqual(catalog.locale_ids(), ["de_DE", "en_US", "es_US", "fr_FR", "it_IT", "ja_JP"])
+        self.assertIn("order_pizza.slot_types.PizzaCrust", catalog.artifacts("en_US"))
+        self.assertIn("book_appointment.slot_message", catalog.artifacts("en_US"))
+
+    def test_content_is_read_only(self):
+        utterances = content("English", "order_pizza.order_utterances")
+        with pytest.raises(TypeError):
+            utterances.append({"utterance": "more pizza"})
+        with pytest.raises(TypeError):
+            utterances[0]["utterance"] = "less pizza"
+        copied = copy.deepcopy(utterances)
+        copied[0]["utterance"] = "less pizza"
+        self.assertEqual(type(copied[0]), dict)
+        self.assertNotEqual(utterances[0]["utterance"], "less pizza")
+        self.assertEqual(json.loads(json.dumps(utterances)), list(utterances))
+
+    def test_missing_content(self):
+        with pytest.raises(KeyError, match="order_pizza.slot_types.PizzaTopping for en_US"):
+            content("English", "order_pizza.slot_types", "PizzaTopping")
+        with pytest.raises(KeyError):
+            content("Klingon", "shared.abort_statement")
+
+    def test_serialized_catalog(self):
+        catalog = get_catalog()
+        loaded = ContentCatalog.loads(catalog.dumps())
+        self.assertEqual(loaded.entries, catalog.entries)
+        self.assertNotIn("\n", catalog.dumps())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.json")
+            ContentCatalog({"en_US": {"shared.abort_statement": "Sorry"}}).dump(path)
+            reset_catalog()
+            with patch.dict(os.environ, {"contentCatalogPath": path}):
+                self.assertEqual(content("English", "shared.abort_statement"), "Sorry")
+
+    @patch.dict(os.environ, {"botName": "testbot"})
+    def test_name_intent_template(self):
+        from other_intents.name_intent import closing_response
+        self.assertEqual(closing_response("English"), {"value": "My name is testbot, how can I help you?"})
+
+    def test_freeze(self):
+        frozen = freeze({"values": [{"value": "a"}], "count": 1})
+        self.assertEqual(frozen, {"values": [{"value": "a"}], "count": 1})
+        with pytest.raises(TypeError):
+            frozen.update(count=2)
+        self.assertEqual(dict(frozen, count=2)["count"], 2)
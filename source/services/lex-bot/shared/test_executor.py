@@ -0,0 +1,83 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import threading
+from time import sleep, perf_counter
+from unittest import TestCase
+import pytest
+from shared.executor import Task, run_tasks, validate_tasks, summarize_timings
+
+
+class ExecutorTest(TestCase):
+    def test_run_tasks_passes_dependency_results(self):
+        tasks = [
+            Task("intent", lambda _: "intent-id"),
+            Task("slotType", lambda _: "slot-type-id"),
+            Task("slot", lambda done: f"{done['intent']}/{done['slotType']}", depends_on=["intent", "slotType"]),
+        ]
+        results = run_tasks(tasks)
+        self.assertEqual(results["slot"], "intent-id/slot-type-id")
+
+    def test_run_tasks_respects_dependency_order(self):
+        finished = []
+        lock = threading.Lock()
+
+        def record(name, delay=0.0):
+            def func(_):
+                sleep(delay)
+                with lock:
+                    finished.append(name)
+            return func
+
+        tasks = [
+            Task("intent", record("intent", 0.05)),
+            Task("slotA", record("slotA"), depends_on=["intent"]),
+            Task("slotB", record("slotB"), depends_on=["intent"]),
+            Task("update", record("update"), depends_on=["slotA", "slotB"]),
+        ]
+        run_tasks(tasks)
+        self.assertEqual(finished[0], "intent")
+        self.assertEqual(finished[-1], "update")
+
+    def test_run_tasks_runs_independent_tasks_concurrently(self):
+        tasks = [Task(str(i), lambda _: sleep(0.1)) for i in range(4)]
+        start = perf_counter()
+        run_tasks(tasks, max_workers=4)
+        self.assertLess(perf_counter() - start, 0.3)
+
+    def test_run_tasks_raises_and_skips_dependents(self):
+        dependent_ran = []
+
+        def fail(_):
+            raise RuntimeError("create failed")
+
+        tasks = [
+            Task("intent", fail),
+            Task("slot", lambda _: dependent_ran.append(True), depends_on=["intent"]),
+        ]
+        with pytest.raises(RuntimeError):
+            run_tasks(tasks)
+        self.assertEqual(dependent_ran, [])
+
+    def test_validate_tasks(self):
+        with pytest.raises(ValueError):
+            validate_tasks([Task("a", None), Task("a", None)])
+        with pytest.raises(ValueError):
+            validate_tasks([Task("a", None, depends_on=["missing"])])
+        with pytest.raises(ValueError):
+            validate_tasks([Task("a", None, depends_on=["b"]), Task("b", None, depends_on=["a"])])
+
+    def test_summarize_timings(self):
+        summary = summarize_timings("intents", {"a": 1.0, "b": 2.0, "c": 1.0}, 2.0)
+        self.assertEqual(summary["serialSeconds"], 4.0)
+        self.assertEqual(summary["savedSeconds"], 2.0)
+        self.assertEqual(summary["speedup"], 2.0)
@@ -0,0 +1,220 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+from types import SimpleNamespace
+from unittest import TestCase
+from mock import patch
+import boto3
+import botocore
+from botocore.config import Config
+import pytest
+
+mock_env_variables = {
+    "botName": "testbot",
+    "lexLambdaARN": "arn:aws:lambda:us-east-1:123456789012:function:lex",
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+LOCALE = {"botVersion": "DRAFT", "localeId": "en_US"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def stand_in_client(**kwargs):
+    from shared.lex_stand_in import LexStandIn
+    clock = Clock()
+    lex = LexStandIn(clock=clock, wait=lambda seconds: None, **kwargs)
+    client = boto3.client("lexv2-models", region_name="us-east-1", config=Config(retries={"total_max_attempts": 1}))
+    lex.attach(client)
+    return lex, client, clock
+
+
+def create_bot(client):
+    return client.create_bot(
+        botName="testbot", roleArn="arn:aws:iam::123456789012:role/lex", dataPrivacy={"childDirected": False},
+        idleSessionTTLInSeconds=300,
+    )["botId"]
+
+
+class LexStandInTest(TestCase):
+    def test_state_transitions(self):
+        lex, client, clock = stand_in_client(transitions={"bot": 1, "locale": 1, "build": 10})
+        bot_id = create_bot(client)
+        self.assertEqual(client.describe_bot(botId=bot_id)["botStatus"], "Creating")
+        clock.now = 1
+        self.assertEqual(client.describe_bot(botId=bot_id)["botStatus"], "Available")
+        client.create_bot_locale(botId=bot_id, nluIntentConfidenceThreshold=0.4, **LOCALE)
+        clock.now = 2
+        locale = client.describe_bot_locale(botId=bot_id, **LOCALE)
+        self.assertEqual((locale["botLocaleStatus"], locale["intentsCount"]), ("NotBuilt", 1))
+        client.build_bot_locale(botId=bot_id, **LOCALE)
+        with pytest.raises(botocore.exceptions.ClientError, match="PreconditionFailedException"):
+            client.create_intent(botId=bot_id, intentName="Help", **LOCALE)
+        clock.now = 12
+        self.assertEqual(client.describe_bot_locale(botId=bot_id, **LOCALE)["botLocaleStatus"], "Built")
+        client.create_intent(botId=bot_id, intentName="Help", **LOCALE)
+        self.assertEqual(client.describe_bot_locale(botId=bot_id, **LOCALE)["botLocaleStatus"], "NotBuilt")
+        self.assertEqual(
+            [summary["intentName"] for summary in client.list_intents(botId=bot_id, **LOCALE)["intentSummaries"]],
+            ["FallbackIntent", "Help"],
+        )
+        self.assertEqual(lex.calls[0][0], "CreateBot")
+
+    def test_errors(self):
+        _, client, _ = stand_in_client()
+        with pytest.raises(client.exceptions.ResourceNotFoundException):
+            client.describe_bot(botId="MISSINGBOT")
+        bot_id = create_bot(client)
+        with pytest.raises(client.exceptions.ConflictException):
+            create_bot(client)
+        client.create_bot_locale(botId=bot_id, nluIntentConfidenceThreshold=0.4, **LOCALE)
+        slot_type_id = client.create_slot_type(
+            botId=bot_id, slotTypeName="PizzaSize", valueSelectionSetting={"resolutionStrategy": "OriginalValue"},
+            **LOCALE,
+        )["slotTypeId"]
+        intent_id = client.create_intent(botId=bot_id, intentName="PizzaOrder", **LOCALE)["intentId"]
+        client.create_slot(
+            botId=bot_id, intentId=intent_id, slotName="size", slotTypeId=slot_type_id,
+            valueElicitationSetting={"slotConstraint": "Required"}, **LOCALE,
+        )
+        with pytest.raises(client.exceptions.PreconditionFailedException):
+            client.delete_slot_type(botId=bot_id, slotTypeId=slot_type_id, **LOCALE)
+        with pytest.raises(client.exceptions.ValidationException):
+            client.create_bot_version(
+                botId=bot_id, botVersionLocaleSpecification={"en_US": {"sourceBotVersion": "DRAFT"}}
+            )
+
+    def test_throttling_and_pagination(self):
+        lex, client, clock = stand_in_client(rates={"ListBots": 2})
+        for _ in range(12):
+            client.create_bot(
+                botName=f"bot{len(lex.bots)}", roleArn="arn:aws:iam::123456789012:role/lex",
+                dataPrivacy={"childDirected": False}, idleSessionTTLInSeconds=300,
+            )
+        first = client.list_bots()
+        self.assertEqual((len(first["botSummaries"]), first["nextToken"]), (10, "10"))
+        self.assertEqual(len(client.list_bots(nextToken=first["nextToken"])["botSummaries"]), 2)
+        with pytest.raises(botocore.exceptions.ClientError, match="ThrottlingException"):
+            client.list_bots()
+        clock.now = 1
+        filtered = client.list_bots(filters=[{"name": "BotName", "values": ["bot11"], "operator": "EQ"}])
+        self.assertEqual([summary["botName"] for summary in filtered["botSummaries"]], ["bot11"])
+        self.assertEqual(lex.throttled, ["ListBots"])
+
+    @patch.dict(os.environ, mock_env_variables)
+    def test_import(self):
+        from shared.bot_definition import BotDefinition
+        from shared.bot_import import render_archive
+        from order_pizza.intent import populate
+        lex, client, clock = stand_in_client(transitions={"import": 5})
+        definition = BotDefinition(
+            {
+                "botName": "testbot", "roleArn": "arn:aws:iam::123456789012:role/lex",
+                "dataPrivacy": {"childDirected": False}, "idleSessionTTLInSeconds": 300,
+            },
+            {},
+        )
+        definition.add_locale("en_US", description="English", nluIntentConfidenceThreshold=0.4)
+        populate(definition, "en_US", "English")
+        specification = {"botImportSpecification": dict(definition.bot_settings, botTags={"createdby": "test"})}
+        import_params = {"resourceSpecification": specification, "mergeStrategy": "Overwrite"}
+        upload = client.create_upload_url()
+        with pytest.raises(botocore.exceptions.ClientError, match="Nothing was uploaded"):
+            client.start_import(importId=upload["importId"], **import_params)
+        lex.upload(upload["uploadUrl"], render_archive(definition))
+        client.start_import(importId=upload["importId"], **import_params)
+        self.assertEqual(client.describe_import(importId=upload["importId"])["importStatus"], "InProgress")
+        clock.now = 5
+        bot_id = client.describe_import(importId=upload["importId"])["importedResourceId"]
+
+        params = {"botId": bot_id, "botVersion": "DRAFT", "localeId": "en_US"}
+        self.assertEqual(client.describe_bot_locale(**params)["botLocaleStatus"], "NotBuilt")
+        desired = {intent["intentName"]: intent for intent in definition.intents("en_US")}
+        intents = {
+            summary["intentName"]: summary["intentId"] for summary in client.list_intents(**params)["intentSummaries"]
+        }
+        self.assertEqual(set(intents), {"FallbackIntent"} | set(desired))
+        pizza_order = client.describe_intent(intentId=intents["PizzaOrder"], **params)
+        slots = client.list_slots(intentId=intents["PizzaOrder"], **params)["slotSummaries"]
+        slot_names = {slot["slotId"]: slot["slotName"] for slot in slots}
+        self.assertEqual(
+            [slot_names[priority["slotId"]] for priority in pizza_order["slotPriorities"]],
+            [slot["slotName"] for slot in desired["PizzaOrder"]["slots"]],
+        )
+        slot_types = {summary["slotTypeId"] for summary in client.list_slot_types(**params)["slotTypeSummaries"]}
+        for slot in slots:
+            self.assertTrue(slot["slotTypeId"] in slot_types or slot["slotTypeId"].startswith("AMAZON."))
+        self.assertEqual(lex.tags[bot_id], {"createdby": "test"})
+        # importing again replaces the DRAFT locales of the bot of the same name
+        upload = client.create_upload_url()
+        lex.upload(upload["uploadUrl"], render_archive(definition))
+        client.start_import(importId=upload["importId"], **import_params)
+        self.assertEqual(list(lex.bots), [bot_id])
+
+    @patch.dict(os.environ, mock_env_variables)
+    def test_use_stand_in(self):
+        from shared.client import get_client, use_stand_in
+        from shared.lex_stand_in import LexStandIn
+        lex = LexStandIn()
+        try:
+            use_stand_in("lexv2-models", lex)
+            client = get_client("lexv2-models")
+            self.assertEqual(client.list_bots()["botSummaries"], [])
+            use_stand_in("lexv2-models", None)
+            with patch("botocore.client.BaseClient._make_api_call", return_value={"botSummaries": []}) as call:
+                client.list_bots()
+                call.assert_called_once()
+            self.assertEqual([operation for operation, _ in lex.calls], ["ListBots"])
+        finally:
+            use_stand_in("lexv2-models", None)
+
+    @patch.dict(os.environ, mock_env_variables)
+    @patch("shared.rate_limiter.TokenBucket.acquire", return_value=0)
+    def test_provision_bot(self, _):
+        import lambda_function
+        from shared.checkpoint import LocalCheckpointStore, run_phases
+        from shared.client import use_stand_in
+        from shared.lex_stand_in import LexStandIn
+        from shared.resource_index import reset_index
+        from shared.waiter import start_invocation
+        lex = LexStandIn()
+        context = SimpleNamespace(invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:lex")
+        use_stand_in("lexv2-models", lex)
+        try:
+            states = []
+            for run in range(2):
+                start_invocation(None)
+                reset_index()
+                lex.calls.clear()
+                states.append({})
+                phases = lambda_function.provisioning_phases(
+                    "testbot", "arn:aws:iam::123456789012:role/lex", "No", ["English"], context
+                )
+                run_phases(phases, states[-1], LocalCheckpointStore(), f"test{run}")
+        finally:
+            use_stand_in("lexv2-models", None)
+        bot = lex.bots[states[0]["botId"]]
+        self.assertEqual(lex.status(bot["locales"]["en_US"]), "Built")
+        self.assertEqual(list(bot["versions"]), ["1"])
+        self.assertEqual(bot["aliases"][states[0]["liveBotAliasId"]]["settings"]["botVersion"], "1")
+        self.assertEqual(len(bot["locales"]["en_US"]["intents"]), 7)
+        # nothing changed, so the second run only reads
+        self.assertEqual(
+            [operation for operation, _ in lex.calls if not operation.startswith(("Describe", "List"))], []
+        )
+        self.assertEqual(states[1]["botVersion"], "1")
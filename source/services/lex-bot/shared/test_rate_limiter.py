@@ -0,0 +1,114 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+from unittest import TestCase, mock
+from mock import patch
+import boto3
+from botocore.awsrequest import AWSResponse
+from shared import rate_limiter
+from shared.rate_limiter import TokenBucket, RateLimiter, attach, report_throttles
+from shared.testing import FakeClock
+
+BUDGETS = (("CreateSlot", 2.0, 2), ("Describe*", 10.0, 10), ("*", 1.0, 1))
+
+
+def throttled():
+    return {"Error": {"Code": "ThrottlingException"}, "ResponseMetadata": {"HTTPStatusCode": 429}}
+
+
+class RateLimiterTest(TestCase):
+    def setUp(self):
+        rate_limiter._limiters.clear()
+
+    def test_token_bucket_waits_once_the_burst_is_used(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2.0, 2, clock, clock.wait)
+        self.assertEqual([bucket.acquire() for _ in range(4)], [0, 0, 0.5, 0.5])
+        self.assertEqual(clock.now, 1.0)
+        clock.now += 10
+        self.assertEqual(bucket.acquire(), 0)
+
+    def test_token_bucket_adapts_its_rate(self):
+        bucket = TokenBucket(4.0, 4)
+        bucket.throttled()
+        bucket.throttled()
+        self.assertEqual(bucket.rate, 1.0)
+        for _ in range(30):
+            bucket.succeeded()
+        self.assertEqual(bucket.rate, 4.0)
+        for _ in range(10):
+            bucket.throttled()
+        self.assertEqual(bucket.rate, rate_limiter.MIN_RATE)
+
+    def test_operations_get_their_own_budget(self):
+        limiter = RateLimiter(BUDGETS)
+        self.assertEqual(limiter.bucket("CreateSlot").max_rate, 2.0)
+        self.assertEqual(limiter.bucket("DescribeBotLocale").max_rate, 10.0)
+        self.assertEqual(limiter.bucket("CreateIntent").max_rate, 1.0)
+        self.assertIsNot(limiter.bucket("DescribeBot"), limiter.bucket("DescribeBotLocale"))
+
+    def test_limiter_counts_throttles_per_operation(self):
+        clock = FakeClock()
+        limiter = RateLimiter(BUDGETS, clock, clock.wait)
+        for _ in range(3):
+            limiter.before_send("before-send.lex-models-v2.CreateSlot", request=None)
+        limiter.needs_retry("needs-retry.lex-models-v2.CreateSlot", response=(None, throttled()))
+        limiter.needs_retry("needs-retry.lex-models-v2.DescribeBot", response=(None, {"botId": "ABCDEFGHIJ"}))
+        limiter.needs_retry("needs-retry.lex-models-v2.DescribeBot", response=None, caught_exception=OSError())
+        summary = limiter.summary()
+        self.assertEqual(summary["CreateSlot"], {"throttles": 1, "rate": 1.0, "waitSeconds": 0.5})
+        self.assertEqual(summary["DescribeBot"], {"throttles": 0, "rate": 10.0, "waitSeconds": 0})
+
+    def test_operations_share_the_total_budget(self):
+        clock = FakeClock()
+        limiter = RateLimiter(BUDGETS, clock, clock.wait, total=(10.0, 10))
+        operations = ["DescribeBot", "DescribeBotLocale", "DescribeIntent"]
+        for _ in range(4):
+            for operation in operations:
+                limiter.before_send(f"before-send.lex-models-v2.{operation}", request=None)
+        # each operation stays within its own burst, together they exceed the total one
+        self.assertAlmostEqual(clock.now, 0.2)
+        limiter.needs_retry("needs-retry.lex-models-v2.DescribeBot", response=(None, throttled()))
+        self.assertEqual(limiter.total.rate, 5.0)
+
+    def test_attach_only_rate_limits_services_with_budgets(self):
+        client = mock.Mock()
+        self.assertIsNone(attach(client, "ssm"))
+        client.meta.events.register.assert_not_called()
+
+    @patch("botocore.endpoint.Endpoint._send")
+    @patch("shared.metrics.print")
+    def test_attached_client_requests_pass_through_the_limiter(self, mock_print, mock_send):
+        def response(status, body, **headers):
+            return AWSResponse("https://lex", status, headers, mock.Mock(stream=lambda: [body.encode()]))
+
+        mock_send.side_effect = [
+            response(429, '{"message": "Rate exceeded"}', **{"x-amzn-ErrorType": "ThrottlingException"}),
+            response(200, '{"botId": "ABCDEFGHIJ", "botStatus": "Available"}'),
+        ]
+        client = boto3.client(
+            "lexv2-models",
+            region_name="us-east-1",
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+        )
+        limiter = attach(client, "lexv2-models")
+        with patch("botocore.endpoint.time.sleep"), patch.object(rate_limiter.TokenBucket, "acquire") as acquire:
+            acquire.return_value = 0
+            self.assertEqual(client.describe_bot(botId="ABCDEFGHIJ")["botStatus"], "Available")
+        # the operation and the total bucket, for both attempts
+        self.assertEqual(acquire.call_count, 4)
+        self.assertEqual(limiter.summary()["DescribeBot"]["throttles"], 1)
+
+        report_throttles()
+        self.assertIn('"Throttles": 1', mock_print.call_args[0][0])
+        self.assertEqual(limiter.summary()["DescribeBot"]["throttles"], 0)
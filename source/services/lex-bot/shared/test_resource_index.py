@@ -0,0 +1,94 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+from unittest import TestCase
+from mock import patch
+import botocore
+import pytest
+
+mock_env_variables = {
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+}
+PARAMS = {"botId": "botid", "botVersion": "DRAFT", "localeId": "en_US"}
+
+
+def conflict(operation):
+    return botocore.exceptions.ClientError({"Error": {"Code": "ConflictException"}}, operation)
+
+
+@patch.dict(os.environ, mock_env_variables)
+@patch("shared.resource_index.client")
+class ResourceIndexTest(TestCase):
+    def setUp(self):
+        from shared.resource_index import reset_index
+        reset_index()
+
+    def test_list_resources_once(self, mock_client):
+        from shared.resource_index import list_resources, find_resource
+        mock_client.list_intents.side_effect = [
+            {"intentSummaries": [{"intentId": "i1", "intentName": "Help"}], "nextToken": "page2"},
+            {"intentSummaries": [{"intentId": "i2", "intentName": "Name"}]},
+        ]
+        self.assertEqual(list(list_resources("intents", **PARAMS)), ["Help", "Name"])
+        self.assertEqual(find_resource("intents", "Name", **PARAMS)["intentId"], "i2")
+        self.assertIsNone(find_resource("intents", "Other", **PARAMS))
+        self.assertEqual(mock_client.list_intents.call_count, 2)
+        mock_client.list_intents.assert_called_with(nextToken="page2", **PARAMS)
+
+    def test_create_or_reuse_reuses_listed_resource(self, mock_client):
+        from shared.resource_index import list_resources, create_or_reuse
+        mock_client.list_intents.return_value = {"intentSummaries": [{"intentId": "i1", "intentName": "Help"}]}
+        list_resources("intents", **PARAMS)
+        self.assertEqual(create_or_reuse("create_intent", dict(PARAMS, intentName="Help"))["intentId"], "i1")
+        mock_client.create_intent.assert_not_called()
+
+    def test_create_or_reuse_adds_created_resource(self, mock_client):
+        from shared.resource_index import list_resources, create_or_reuse, forget_resource, find_resource
+        mock_client.list_slot_types.return_value = {"slotTypeSummaries": []}
+        mock_client.create_slot_type.return_value = {"slotTypeId": "st1", "slotTypeName": "PizzaSize"}
+        list_resources("slotTypes", **PARAMS)
+        create_or_reuse("create_slot_type", dict(PARAMS, slotTypeName="PizzaSize"))
+        self.assertEqual(create_or_reuse("create_slot_type", dict(PARAMS, slotTypeName="PizzaSize"))["slotTypeId"], "st1")
+        self.assertEqual(mock_client.create_slot_type.call_count, 1)
+
+        forget_resource("delete_slot_type", dict(PARAMS, slotTypeId="st1"))
+        self.assertIsNone(find_resource("slotTypes", "PizzaSize", **PARAMS))
+        self.assertEqual(mock_client.list_slot_types.call_count, 1)
+
+    def test_create_or_reuse_after_conflict(self, mock_client):
+        from shared.resource_index import create_or_reuse
+        mock_client.create_slot.side_effect = conflict("CreateSlot")
+        mock_client.list_slots.return_value = {"slotSummaries": [{"slotId": "s1", "slotName": "size"}]}
+        params = dict(PARAMS, intentId="i1", slotName="size", slotTypeId="st1")
+        self.assertEqual(create_or_reuse("create_slot", params)["slotId"], "s1")
+        mock_client.list_slots.assert_called_once_with(intentId="i1", **PARAMS)
+
+    def test_create_or_reuse_conflict_with_unknown_resource(self, mock_client):
+        from shared.resource_index import create_or_reuse
+        mock_client.create_intent.side_effect = conflict("CreateIntent")
+        mock_client.list_intents.return_value = {"intentSummaries": []}
+        with pytest.raises(botocore.exceptions.ClientError):
+            create_or_reuse("create_intent", dict(PARAMS, intentName="Help"))
+
+    def test_bots_are_listed_by_name(self, mock_client):
+        from shared.resource_index import create_or_reuse, find_resource, listing_params
+        mock_client.list_bots.return_value = {"botSummaries": []}
+        self.assertIsNone(find_resource("bots", "testbot", **listing_params("bots", {"botName": "testbot"})))
+        mock_client.create_bot.return_value = {"botId": "testbotid"}
+        create_or_reuse("create_bot", {"botName": "testbot"})
+        self.assertEqual(
+            find_resource("bots", "testbot", **listing_params("bots", {"botName": "testbot"}))["botId"], "testbotid"
+        )
+        mock_client.list_bots.assert_called_once_with(
+            filters=[{"name": "BotName", "values": ["testbot"], "operator": "EQ"}]
+        )
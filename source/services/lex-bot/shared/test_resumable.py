@@ -0,0 +1,199 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import os
+import json
+from time import sleep
+from unittest import TestCase, mock
+from mock import patch
+
+mock_env_variables = {
+    "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
+    "AWS_REGION": "us-east-1",
+}
+
+EVENT = {
+    "RequestType": "Create",
+    "StackId": "arn:aws:cloudformation:us-east-1:123456789012:stack/test/guid",
+    "RequestId": "request1",
+    "LogicalResourceId": "LexBot",
+    "ResponseURL": "https://example.com/response",
+}
+
+
+def lambda_context():
+    return mock.Mock(
+        invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:test",
+        aws_request_id="invocation1",
+        get_remaining_time_in_millis=lambda: 60000,
+    )
+
+
+@patch.dict(os.environ, mock_env_variables)
+class ResumableResourceTest(TestCase):
+    def resource(self, func):
+        from shared.resumable import ResumableResource
+        helper = ResumableResource(log_level="INFO")
+        helper.create(func)
+        helper._send = mock.Mock()
+        return helper
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_success(self, mock_get_client):
+        helper = self.resource(lambda event, context: "testbotid")
+        helper(dict(EVENT), lambda_context())
+        helper._send.assert_called_once_with()
+        self.assertEqual((helper.Status, helper.PhysicalResourceId), ("SUCCESS", "testbotid"))
+        mock_get_client.assert_not_called()
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_continue_in_new_invocation(self, mock_get_client):
+        from shared.checkpoint import ContinueInNewInvocation
+
+        def create(event, context):
+            raise ContinueInNewInvocation("build")
+
+        mock_get_client.return_value.invoke.return_value = {"StatusCode": 202}
+        helper = self.resource(create)
+        helper(dict(EVENT, ContinuationCount=2), lambda_context())
+        helper._send.assert_not_called()
+        invoke = mock_get_client.return_value.invoke.call_args.kwargs
+        self.assertEqual(invoke["FunctionName"], "arn:aws:lambda:us-east-1:123456789012:function:test")
+        self.assertEqual(invoke["InvocationType"], "Event")
+        self.assertEqual(json.loads(invoke["Payload"]), dict(EVENT, ContinuationCount=3))
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_too_many_continuations(self, mock_get_client):
+        from shared.checkpoint import ContinueInNewInvocation
+        from shared.resumable import max_continuations
+
+        def create(event, context):
+            raise ContinueInNewInvocation("build")
+
+        helper = self.resource(create)
+        helper(dict(EVENT, ContinuationCount=max_continuations(60)), lambda_context())
+        mock_get_client.assert_not_called()
+        helper._send.assert_called_once_with()
+        reason = f"Request not completed after {max_continuations(60)} continuations"
+        self.assertEqual((helper.Status, helper.Reason), ("FAILED", reason))
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_continue_without_timeout(self, mock_get_client):
+        from shared.checkpoint import ContinueInNewInvocation
+
+        def create(event, context):
+            raise ContinueInNewInvocation("build")
+
+        mock_get_client.return_value.invoke.return_value = {"StatusCode": 202}
+        helper = self.resource(create)
+        # crhelper versions that run under SAM local without a timeout do not call _set_timeout
+        with patch("shared.resumable.ResumableResource._set_timeout"):
+            helper(dict(EVENT), lambda_context())
+        helper._send.assert_not_called()
+        mock_get_client.return_value.invoke.assert_called_once()
+
+    def test_max_continuations(self):
+        from shared.resumable import max_continuations
+        # a 15 minute function is invoked at most 3 times within the hour CloudFormation waits
+        self.assertEqual(max_continuations(900), 2)
+        self.assertEqual(max_continuations(180), 18)
+        self.assertEqual(max_continuations(3600), 0)
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_failed_invoke(self, mock_get_client):
+        from shared.checkpoint import ContinueInNewInvocation
+
+        def create(event, context):
+            raise ContinueInNewInvocation("build")
+
+        mock_get_client.return_value.invoke.side_effect = RuntimeError("Rate exceeded")
+        helper = self.resource(create)
+        helper(dict(EVENT), lambda_context())
+        helper._send.assert_called_once_with()
+        self.assertEqual(helper.Status, "FAILED")
+        self.assertIn("Rate exceeded", helper.Reason)
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_failure(self, mock_get_client):
+        def create(event, context):
+            raise RuntimeError("Failed to create Lex bot.")
+
+        helper = self.resource(create)
+        helper(dict(EVENT), lambda_context())
+        helper._send.assert_called_once_with()
+        self.assertEqual((helper.Status, helper.Reason), ("FAILED", "Failed to create Lex bot."))
+        mock_get_client.assert_not_called()
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_continue_with_token(self, mock_get_client):
+        from shared.resumable import get_continuation_token
+
+        def create(event, context):
+            start = get_continuation_token(event) or 0
+            for index in range(start, 10):
+                helper.continue_if_out_of_time(index, seconds=30)
+
+        mock_get_client.return_value.invoke.return_value = {"StatusCode": 202}
+        helper = self.resource(create)
+        context = lambda_context()
+        # 10 seconds go by between reads of the remaining time, the first two arm the timers
+        context.get_remaining_time_in_millis = mock.Mock(side_effect=range(60000, 0, -10000))
+        helper(dict(EVENT, ContinuationToken=4), context)
+        helper._send.assert_not_called()
+        payload = json.loads(mock_get_client.return_value.invoke.call_args.kwargs["Payload"])
+        self.assertEqual(payload, dict(EVENT, ContinuationCount=1, ContinuationToken=5))
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_timeout_flags_the_handler(self, mock_get_client):
+        from shared.resumable import HANDOVER_SECONDS
+
+        def create(event, context):
+            for index in range(100):
+                helper.continue_if_out_of_time({"upload": index})
+                sleep(0.01)
+            return "completed"
+
+        mock_get_client.return_value.invoke.return_value = {"StatusCode": 202}
+        helper = self.resource(create)
+        context = lambda_context()
+        # the handover timer fires 50 ms into the invocation
+        context.get_remaining_time_in_millis = lambda: HANDOVER_SECONDS * 1000 + 50
+        helper(dict(EVENT), context)
+        helper._send.assert_not_called()
+        mock_get_client.return_value.invoke.assert_called_once()
+        payload = json.loads(mock_get_client.return_value.invoke.call_args.kwargs["Payload"])
+        self.assertGreater(payload["ContinuationToken"]["upload"], 0)
+
+    @patch("shared.resumable.get_lambda_client")
+    def test_completed_handler_responds_after_timeout(self, mock_get_client):
+        from shared.resumable import HANDOVER_SECONDS
+
+        def create(event, context):
+            sleep(0.2)
+            return "testbotid"
+
+        helper = self.resource(create)
+        context = lambda_context()
+        context.get_remaining_time_in_millis = lambda: HANDOVER_SECONDS * 1000 + 50
+        helper(dict(EVENT), context)
+        self.assertTrue(helper.out_of_time())
+        helper._send.assert_called_once_with()
+        self.assertEqual((helper.Status, helper.PhysicalResourceId), ("SUCCESS", "testbotid"))
+        mock_get_client.assert_not_called()
+
+    def test_webclient_links_the_module(self):
+        # webclient-setup is packaged on its own and links to this module instead of keeping a copy of it
+        services = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        link = os.path.join(services, "webclient-setup", "resumable.py")
+        self.assertTrue(os.path.islink(link))
+        module = os.path.join(services, "lex-bot", "shared", "resumable.py")
+        self.assertEqual(os.path.realpath(link), os.path.realpath(module))
@@ -0,0 +1,161 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import json
+from unittest import TestCase
+from mock import patch
+import boto3
+from botocore.stub import Stubber
+from shared import tracing
+from shared.tracing import (
+    start_trace, record, phase, critical_path, summarize_trace, report_trace, attach, call_budget
+)
+
+
+def spans(*timings):
+    return [{"kind": "call", "name": name, "start": start, "end": end} for name, start, end in timings]
+
+
+class TracingTest(TestCase):
+    def setUp(self):
+        start_trace()
+
+    def test_critical_path(self):
+        timeline = spans(
+            ("CreateSlotType", 0.0, 1.0),
+            ("CreateIntent", 0.0, 2.0),
+            ("CreateSlot", 2.0, 3.0),
+            ("CreateSlot", 2.1, 2.5),
+            ("UpdateIntent", 3.0, 4.0),
+        )
+        path = critical_path(timeline)
+        self.assertEqual([span["name"] for span in path], ["CreateIntent", "CreateSlot", "UpdateIntent"])
+        self.assertEqual(critical_path([]), [])
+        self.assertEqual(len(critical_path(spans(("ListBots", 1.0, 1.0), ("ListBots", 1.0, 1.0)))), 1)
+
+    def test_summarize_trace(self):
+        origin = tracing._origin
+        with phase("intents"):
+            record("call", "CreateIntent", origin, origin + 2, "en_US", "Help")
+            record("call", "CreateIntent", origin, origin + 1, "es_US", "Help")
+        record("wait", "locale", origin + 2, origin + 5, "en_US")
+        record("call", "DescribeBotLocale", origin + 2, origin + 2.1, "en_US")
+        summary = summarize_trace()
+        self.assertEqual(list(summary["phases"]), ["intents"])
+        self.assertEqual(summary["operations"]["call:CreateIntent"], {"count": 2, "seconds": 3.0})
+        self.assertEqual(summary["operations"]["wait:locale"], {"count": 1, "seconds": 3.0})
+        self.assertEqual(summary["criticalPath"]["seconds"], 5.0)
+        self.assertEqual([span["name"] for span in summary["criticalPath"]["longest"]], ["CreateIntent", "locale"])
+        self.assertEqual(
+            summary["slowest"][0],
+            {
+                "kind": "call",
+                "name": "CreateIntent",
+                "phase": "intents",
+                "localeId": "en_US",
+                "intent": "Help",
+                "startMs": 0,
+                "durationMs": 2000,
+            },
+        )
+        self.assertNotIn("phase", summary["slowest"][-1])
+
+    def test_call_budget(self):
+        origin = tracing._origin
+        record("call", "ListBots", origin, origin)
+        record("call", "CreateSlot", origin, origin, "en_US", "PizzaOrder")
+        record("call", "CreateSlot", origin, origin, "en_US", "PizzaOrder")
+        record("call", "ListIntents", origin, origin, "en_US")
+        record("wait", "locale", origin, origin, "en_US")
+        self.assertEqual(
+            call_budget(),
+            {
+                "locales": {
+                    "bot": {"operations": {"ListBots": 1}, "total": 1},
+                    "en_US": {
+                        "intents": {"PizzaOrder": {"operations": {"CreateSlot": 2}, "total": 2}},
+                        "operations": {"CreateSlot": 2, "ListIntents": 1},
+                        "total": 3,
+                    },
+                },
+                "operations": {"CreateSlot": 2, "ListBots": 1, "ListIntents": 1},
+                "total": 4,
+            },
+        )
+        self.assertEqual(summarize_trace()["callBudget"]["total"], 4)
+
+    def test_concurrent_phases(self):
+        from threading import Barrier
+        from shared.executor import Task, run_tasks
+        origin = tracing._origin
+        barrier = Barrier(2)
+
+        def provision(name):
+            with phase(name):
+                # both phases are open when the calls are recorded
+                barrier.wait(timeout=5)
+                run_tasks([Task("intents", lambda _: record("call", f"CreateIntent{name}", origin, origin + 1))])
+                barrier.wait(timeout=5)
+                record("call", f"BuildBotLocale{name}", origin + 1, origin + 2)
+
+        run_tasks([Task(name, lambda _, name=name: provision(name)) for name in ("PizzaBot", "BankBot")], max_workers=2)
+        record("call", "ListBots", origin + 2, origin + 3)
+        phases = {span["name"]: span["phase"] for span in tracing._spans if span["kind"] == "call"}
+        self.assertEqual(
+            phases,
+            {
+                "CreateIntentPizzaBot": "PizzaBot",
+                "BuildBotLocalePizzaBot": "PizzaBot",
+                "CreateIntentBankBot": "BankBot",
+                "BuildBotLocaleBankBot": "BankBot",
+                "ListBots": None,
+            },
+        )
+
+    def test_attach_records_client_calls(self):
+        client = boto3.client(
+            "lexv2-models", region_name="us-east-1", aws_access_key_id="key", aws_secret_access_key="secret"
+        )
+        attach(client)
+        params = {"botId": "ABCDEFGHIJ", "botVersion": "DRAFT", "localeId": "en_US"}
+        with Stubber(client) as stubber:
+            stubber.add_response("create_intent", {"intentId": "INTENTID01", "intentName": "Help"})
+            stubber.add_response("update_intent", {"intentId": "INTENTID01"})
+            stubber.add_client_error("describe_intent", "ResourceNotFoundException")
+            with phase("intents"):
+                client.create_intent(intentName="Help", **params)
+                client.update_intent(intentId="INTENTID01", intentName="Help", **params)
+                with self.assertRaises(client.exceptions.ResourceNotFoundException):
+                    client.describe_intent(intentId="INTENTID01", **params)
+        recorded = [(span["name"], span.get("intent"), span["localeId"]) for span in tracing._spans[:3]]
+        self.assertEqual(
+            recorded,
+            [("CreateIntent", "Help", "en_US"), ("UpdateIntent", "Help", "en_US"), ("DescribeIntent", "Help", "en_US")],
+        )
+
+    @patch("shared.metrics.print")
+    @patch("shared.tracing.print")
+    def test_report_trace(self, mock_print, mock_metrics_print):
+        origin = tracing._origin
+        with phase("build"):
+            record("call", "BuildBotLocale", origin, origin + 0.5, "en_US")
+        record("wait", "locale", origin + 0.5, origin + 1.5, "en_US")
+        report_trace()
+        line = json.loads(mock_print.call_args[0][0])
+        self.assertEqual(line["provisioningTrace"]["criticalPath"]["spans"], 2)
+        metrics = [json.loads(call[0][0]) for call in mock_metrics_print.call_args_list]
+        self.assertEqual(
+            [next(name for name in ("PhaseTime", "ApiTime", "ApiCalls", "CriticalPathTime") if name in metric)
+             for metric in metrics],
+            ["PhaseTime", "ApiTime", "ApiCalls", "CriticalPathTime"],
+        )
+        self.assertEqual(metrics[2]["Operation"], "BuildBotLocale")
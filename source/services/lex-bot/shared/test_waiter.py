@@ -0,0 +1,129 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import threading
+from unittest import TestCase, mock
+from mock import patch
+import pytest
+from shared import waiter
+from shared.testing import FakeClock
+
+
+class FakeContext:
+    def __init__(self, remaining_millis):
+        self.remaining_millis = remaining_millis
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_millis
+
+
+@patch("shared.waiter.put_metric")
+class WaiterTest(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        waiter.start_invocation(None, self.clock, self.clock.wait)
+
+    def test_wait_for_status_polls_until_done(self, mock_put_metric):
+        client = mock.Mock()
+        client.describe_bot.side_effect = [
+            {"botStatus": "Creating"},
+            {"botStatus": "Creating"},
+            {"botStatus": "Available"},
+        ]
+        response = waiter.wait_for_status(
+            client, "describe_bot", {"botId": "testid1234"}, "botStatus", ("Creating",), resource="bot"
+        )
+        self.assertEqual(response, {"botStatus": "Available"})
+        self.assertEqual(client.describe_bot.call_count, 3)
+        self.assertEqual(len(self.clock.waits), 2)
+        mock_put_metric.assert_called_once_with("WaitTime", round(self.clock.now, 3), Resource="bot")
+        self.assertIn("bot", waiter.wait_summary())
+
+    def test_next_delay_follows_backoff_curve_with_jitter(self, _):
+        first, factor, maximum = waiter.BACKOFF_CURVES[("locale", "Building")]
+        for attempt in range(10):
+            delay = waiter.next_delay("locale", "Building", attempt)
+            expected = min(first * factor ** attempt, maximum)
+            self.assertGreaterEqual(delay, expected / 2)
+            self.assertLessEqual(delay, expected)
+        self.assertLessEqual(waiter.next_delay("unknown", "Pending", 50), waiter.DEFAULT_BACKOFF_CURVE[2])
+
+    def test_wait_for_status_follows_backoff_curve(self, _):
+        first, factor, maximum = waiter.BACKOFF_CURVES[("locale", "Building")]
+        client = mock.Mock()
+        client.describe_bot_locale.side_effect = [{"botLocaleStatus": "Building"}] * 8 + [{"botLocaleStatus": "Built"}]
+        waiter.wait_for_status(
+            client, "describe_bot_locale", {"botId": "id"}, "botLocaleStatus", ("Building",), resource="locale"
+        )
+        self.assertEqual(len(self.clock.waits), 8)
+        for attempt, delay in enumerate(self.clock.waits):
+            expected = min(first * factor ** attempt, maximum)
+            self.assertGreaterEqual(delay, expected / 2)
+            self.assertLessEqual(delay, expected)
+        self.assertEqual(waiter.wait_summary(), {"locale": round(sum(self.clock.waits), 3)})
+
+    def test_wait_for_status_stops_at_deadline(self, _):
+        client = mock.Mock()
+        client.describe_bot_locale.return_value = {"botLocaleStatus": "Building"}
+        waiter.start_invocation(
+            FakeContext(remaining_millis=waiter.DEADLINE_MARGIN_SECONDS * 1000), self.clock, self.clock.wait
+        )
+        with pytest.raises(waiter.WaiterTimeout):
+            waiter.wait_for_status(
+                client, "describe_bot_locale", {"botId": "id"}, "botLocaleStatus", ("Building",), resource="locale"
+            )
+        self.assertEqual(self.clock.waits, [])
+        # the waits stop before the one that would pass the deadline
+        waiter.start_invocation(
+            FakeContext(remaining_millis=(waiter.DEADLINE_MARGIN_SECONDS + 30) * 1000), self.clock, self.clock.wait
+        )
+        with pytest.raises(waiter.WaiterTimeout):
+            waiter.wait_for_status(
+                client, "describe_bot_locale", {"botId": "id"}, "botLocaleStatus", ("Building",), resource="locale"
+            )
+        self.assertLessEqual(sum(self.clock.waits), 30)
+        self.assertGreater(sum(self.clock.waits), 30 - waiter.BACKOFF_CURVES[("locale", "Building")][2])
+
+    def test_start_invocation_without_remaining_time(self, _):
+        waiter.start_invocation({})
+        self.assertIsNone(waiter.remaining_seconds())
+        waiter.start_invocation(FakeContext(remaining_millis=60000))
+        self.assertGreater(waiter.remaining_seconds(), 50)
+
+    def test_describe_is_shared_between_waiters(self, _):
+        client = mock.Mock()
+        release = threading.Event()
+
+        def slow_describe(**_):
+            release.wait(1)
+            return {"botStatus": "Available"}
+
+        client.describe_bot.side_effect = slow_describe
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(waiter.describe(client, "describe_bot", {"botId": "id"})))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(client.describe_bot.call_count, 1)
+        self.assertEqual(len(results), 3)
+
+    def test_describe_does_not_reuse_results_already_seen(self, _):
+        client = mock.Mock()
+        client.describe_bot.side_effect = [{"botStatus": "Creating"}, {"botStatus": "Available"}]
+        _, fetched_at = waiter.describe(client, "describe_bot", {"botId": "id"})
+        response, _ = waiter.describe(client, "describe_bot", {"botId": "id"}, newer_than=fetched_at)
+        self.assertEqual(response, {"botStatus": "Available"})
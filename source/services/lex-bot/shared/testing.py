@@ -0,0 +1,77 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+"""
+Helpers of the tests that provision intents against a patched botocore client. Modules creating clients are
+imported when used, once the tests have patched the environment.
+"""
+BOT_ID = "testid1234"
+# a locale without any resource, to compile the creation of a whole locale as a diff
+EMPTY_LOCALE = {"slotTypes": {}, "intents": {}}
+# create operation to the id it returns and the parameter naming the created resource
+CREATED_IDS = {
+    "CreateIntent": ("intentId", "intentName"),
+    "CreateSlotType": ("slotTypeId", "slotTypeName"),
+    "CreateSlot": ("slotId", "slotName"),
+}
+
+
+class FakeClock:
+    """
+    Clock to inject in place of monotonic, with a wait to inject in place of sleep that advances it instead
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.waits = []
+
+    def __call__(self):
+        return self.now
+
+    def wait(self, seconds):
+        self.waits.append(seconds)
+        self.now += seconds
+
+
+def distinct_ids(operation_name, api_params):
+    """
+    Side effect of a patched BaseClient._make_api_call, giving each created resource the id <name>Id
+    """
+    if operation_name in CREATED_IDS:
+        id_key, name_key = CREATED_IDS[operation_name]
+        return {id_key: f"{api_params[name_key]}Id"}
+    return {}
+
+
+def compile_locale(definition, locale_id, bot_id):
+    """
+    Compile the creation of all slot types, intents and slots of a new locale
+    """
+    from shared.bot_diff import diff_locale
+    from shared.bot_plan import compile_changes
+    changes = diff_locale(definition.intents(locale_id), EMPTY_LOCALE)
+    return compile_changes(definition, locale_id, bot_id, EMPTY_LOCALE, changes)
+
+
+def provision(populate, bot_language="English", locale_id="en_US"):
+    """
+    Create the resources an intent module populates a new locale with
+    :param populate: The populate function of the intent module
+    :return: The bot definition
+    """
+    from shared.bot_definition import BotDefinition
+    from shared.bot_plan import execute_plan
+    definition = BotDefinition({}, {})
+    definition.add_locale(locale_id)
+    populate(definition, locale_id, bot_language)
+    execute_plan(compile_locale(definition, locale_id, BOT_ID))
+    return definition
@@ -0,0 +1,230 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic, time
+from shared.metrics import put_metric
+
+SLOWEST_SPANS = 5
+CRITICAL_PATH_MAX_ENTRIES = 20
+# group of the calls made for the bot as a whole, rather than for one of its locales
+BOT_CALLS = "bot"
+
+_lock = threading.Lock()
+_spans = []
+_intent_names = {}
+_origin = monotonic()
+_started_at = time()
+# phase of the thread, the bots of a fleet run their phases at the same time. run_tasks passes it to its workers.
+_phase = ContextVar("phase", default=None)
+
+
+def start_trace():
+    """
+    Forget the spans of a previous invocation and start the timeline of this one
+    """
+    global _origin, _started_at
+    with _lock:
+        _spans.clear()
+        _intent_names.clear()
+        _origin = monotonic()
+        _started_at = time()
+    _phase.set(None)
+
+
+def record(kind, name, start, end, locale_id=None, intent=None):
+    """
+    Add a span to the timeline
+    :param kind: call for API calls, wait for waiters and phase for provisioning phases
+    :param name: The operation, resource or phase name
+    :param start: Monotonic start timestamp
+    :param end: Monotonic end timestamp
+    """
+    span = {"kind": kind, "name": name, "phase": _phase.get(), "start": start, "end": end}
+    if locale_id:
+        span["localeId"] = locale_id
+    if intent:
+        span["intent"] = intent
+    with _lock:
+        _spans.append(span)
+
+
+@contextmanager
+def span(kind, name, locale_id=None, intent=None):
+    start = monotonic()
+    try:
+        yield
+    finally:
+        record(kind, name, start, monotonic(), locale_id, intent)
+
+
+@contextmanager
+def phase(name):
+    """
+    Record a provisioning phase. API calls and waiters made until it ends, in this thread or the tasks it runs,
+    are attributed to it.
+    """
+    token = _phase.set(name)
+    try:
+        with span("phase", name):
+            yield
+    finally:
+        _phase.reset(token)
+
+
+def before_parameter_build(params, context, **kwargs):
+    context["trace"] = {
+        "start": monotonic(),
+        "localeId": params.get("localeId"),
+        "intentId": params.get("intentId"),
+        "intentName": params.get("intentName"),
+    }
+
+
+def after_call(event_name, context, parsed=None, **kwargs):
+    """
+    Handler of the after-call event, and of the after-call-error event emitted when a call gets no response
+    """
+    trace = context.pop("trace", None)
+    if trace is None:
+        return
+    if parsed and parsed.get("intentId") and parsed.get("intentName"):
+        with _lock:
+            _intent_names[parsed["intentId"]] = parsed["intentName"]
+    intent = trace["intentName"] or _intent_names.get(trace["intentId"])
+    record("call", event_name.rsplit(".", 1)[-1], trace["start"], monotonic(), trace["localeId"], intent)
+
+
+def attach(client):
+    """
+    Record a span for every call of a boto3 client
+    """
+    service_id = client.meta.service_model.service_id.hyphenize()
+    client.meta.events.register(f"before-parameter-build.{service_id}", before_parameter_build)
+    client.meta.events.register(f"after-call.{service_id}", after_call)
+    client.meta.events.register(f"after-call-error.{service_id}", after_call)
+
+
+def describe_span(span, origin):
+    described = {key: value for key, value in span.items() if key not in ("start", "end") and value is not None}
+    described["startMs"] = round((span["start"] - origin) * 1000)
+    described["durationMs"] = round((span["end"] - span["start"]) * 1000)
+    return described
+
+
+def critical_path(spans):
+    """
+    Walk back from the last span to end, each time to the span ending last before the current one started.
+    A waiter ends after the describe calls it makes, so the path goes through the waiter rather than its calls.
+    :return: List of spans in timeline order
+    """
+    path = []
+    boundary = None
+    while True:
+        # spans starting at the boundary, of no duration, would be picked again
+        candidates = [
+            span for span in spans if boundary is None or (span["end"] <= boundary and span["start"] < boundary)
+        ]
+        if not candidates:
+            return list(reversed(path))
+        latest = max(candidates, key=lambda span: (span["end"], -span["start"]))
+        path.append(latest)
+        boundary = latest["start"]
+
+
+def longest(spans, count):
+    """
+    :return: The count longest spans, in timeline order
+    """
+    return sorted(sorted(spans, key=lambda span: span["start"] - span["end"])[:count], key=lambda span: span["start"])
+
+
+def count_call(counts, operation):
+    counts["total"] = counts.get("total", 0) + 1
+    operations = counts.setdefault("operations", {})
+    operations[operation] = operations.get(operation, 0) + 1
+
+
+def sort_counts(counts):
+    return {key: sort_counts(value) if isinstance(value, dict) else value for key, value in sorted(counts.items())}
+
+
+def call_budget():
+    """
+    Count the API calls of the timeline per operation, per locale and per intent of each locale
+    :return: Dict with the total, the counts per operation and the "locales" breakdown, keys sorted
+    """
+    with _lock:
+        calls = [span for span in _spans if span["kind"] == "call"]
+    budget = {"total": 0, "operations": {}, "locales": {}}
+    for span in calls:
+        count_call(budget, span["name"])
+        locale = budget["locales"].setdefault(span.get("localeId", BOT_CALLS), {})
+        count_call(locale, span["name"])
+        if span.get("intent"):
+            count_call(locale.setdefault("intents", {}).setdefault(span["intent"], {}), span["name"])
+    return sort_counts(budget)
+
+
+def summarize_trace():
+    """
+    :return: Compact summary of the timeline: totals per phase and per operation, the critical path and the
+    slowest calls and waiters
+    """
+    with _lock:
+        spans = list(_spans)
+        origin = _origin
+    phases = [span for span in spans if span["kind"] == "phase"]
+    work = [span for span in spans if span["kind"] != "phase"]
+    operations = {}
+    for span in work:
+        totals = operations.setdefault(f"{span['kind']}:{span['name']}", {"count": 0, "seconds": 0.0})
+        totals["count"] += 1
+        totals["seconds"] += span["end"] - span["start"]
+    path = critical_path(work)
+    return {
+        "startedAt": round(_started_at, 3),
+        "wallClockSeconds": round(max((span["end"] for span in spans), default=origin) - origin, 3),
+        "phases": {span["name"]: round(span["end"] - span["start"], 3) for span in phases},
+        "operations": {
+            name: {"count": totals["count"], "seconds": round(totals["seconds"], 3)}
+            for name, totals in sorted(operations.items(), key=lambda item: -item[1]["seconds"])
+        },
+        "criticalPath": {
+            "seconds": round(sum(span["end"] - span["start"] for span in path), 3),
+            "spans": len(path),
+            "longest": [describe_span(span, origin) for span in longest(path, CRITICAL_PATH_MAX_ENTRIES)],
+        },
+        "slowest": [describe_span(span, origin) for span in longest(work, SLOWEST_SPANS)],
+        "callBudget": call_budget(),
+    }
+
+
+def report_trace():
+    """
+    Print the timeline summary as a JSON log line and emit the phase and operation totals as metrics
+    """
+    summary = summarize_trace()
+    print(json.dumps({"provisioningTrace": summary}))  # NOSONAR structured log line, like the EMF documents
+    for name, seconds in summary["phases"].items():
+        put_metric("PhaseTime", seconds, Phase=name)
+    for name, totals in summary["operations"].items():
+        kind, operation = name.split(":", 1)
+        if kind == "call":
+            # waiters already emit their WaitTime
+            put_metric("ApiTime", totals["seconds"], Operation=operation)
+            put_metric("ApiCalls", totals["count"], unit="Count", Operation=operation)
+    put_metric("CriticalPathTime", summary["criticalPath"]["seconds"])
+    return summary
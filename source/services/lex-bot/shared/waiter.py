@@ -0,0 +1,164 @@
+######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                #
+#                                                                                                                    #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance    #
+#  with the License. A copy of the License is located at                                                             #
+#                                                                                                                    #
+#      http://www.apache.org/licenses/LICENSE-2.0                                                                    #
+#                                                                                                                    #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    #
+#  and limitations under the License.                                                                                #
+######################################################################################################################
+import random
+import threading
+from time import monotonic, sleep
+from shared.logger import get_logger
+from shared.metrics import put_metric
+from shared.tracing import record
+
+logger = get_logger(__name__)
+
+# (first delay, growth factor, maximum delay) in seconds, per resource and transitional state.
+# Bots and locales are usually created within seconds, builds and imports take tens of seconds.
+BACKOFF_CURVES = {
+    ("bot", "Creating"): (0.5, 1.5, 2.0),
+    ("bot", "Deleting"): (1.0, 1.5, 5.0),
+    ("locale", "Creating"): (0.5, 1.5, 2.0),
+    ("locale", "Building"): (2.0, 1.5, 8.0),
+    ("locale", "Deleting"): (1.0, 1.5, 5.0),
+    ("import", "InProgress"): (2.0, 1.5, 8.0),
+    ("version", "Versioning"): (1.0, 1.5, 5.0),
+    ("alias", "Creating"): (0.5, 1.5, 2.0),
+}
+DEFAULT_BACKOFF_CURVE = (1.0, 2.0, 5.0)
+# time kept in reserve to report back to CloudFormation once the deadline is reached
+DEADLINE_MARGIN_SECONDS = 5
+# describe results younger than this are shared between waiters polling the same resource
+SHARED_RESULT_MAX_AGE_SECONDS = 0.5
+
+_deadline = None
+# the clock and wait of this invocation, see start_invocation
+_clock = monotonic
+_wait = sleep
+_describe_cache = {}
+_describe_locks = {}
+_cache_lock = threading.Lock()
+_wait_seconds = {}
+
+
+class WaiterTimeout(RuntimeError):
+    pass
+
+
+def start_invocation(context, clock=monotonic, wait=sleep):
+    """
+    Reset the waiter state and derive the deadline of this invocation from the Lambda context
+    :param context: The Lambda context. The deadline is disabled if it does not expose the remaining time
+    :param clock: Function returning the current time in seconds, the waiters and the deadline follow it
+    :param wait: Function sleeping between two describes for the given seconds
+    """
+    global _deadline, _clock, _wait
+    _clock, _wait = clock, wait
+    with _cache_lock:
+        _describe_cache.clear()
+        _describe_locks.clear()
+        _wait_seconds.clear()
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining_time is None:
+        _deadline = None
+    else:
+        _deadline = clock() + get_remaining_time() / 1000 - DEADLINE_MARGIN_SECONDS
+
+
+def remaining_seconds():
+    """
+    :return: Seconds left until the deadline, or None when there is no deadline
+    """
+    return None if _deadline is None else _deadline - _clock()
+
+
+def next_delay(resource, state, attempt):
+    """
+    Delay before the next describe, following the backoff curve of the resource state with equal jitter
+    :param resource: The resource type, for example bot or locale
+    :param state: The transitional state the resource is in
+    :param attempt: Number of describes already issued for this state
+    :return: The delay in seconds
+    """
+    first, factor, maximum = BACKOFF_CURVES.get((resource, state), DEFAULT_BACKOFF_CURVE)
+    delay = min(first * factor ** attempt, maximum)
+    return random.uniform(delay / 2, delay)  # NOSONAR jitter does not need a cryptographic generator
+
+
+def describe(client, operation, params, newer_than=None):
+    """
+    Issue a describe call, reusing the result of a concurrent waiter for the same resource when it is recent enough
+    :param client: The boto3 client
+    :param operation: The client method name, for example describe_bot
+    :param params: Dict of the call parameters
+    :param newer_than: Only reuse results fetched after this timestamp of the clock
+    :return: Tuple of (response, timestamp of the response)
+    """
+    key = (operation, tuple(sorted(params.items())))
+    with _cache_lock:
+        lock = _describe_locks.setdefault(key, threading.Lock())
+    with lock:
+        cached = _describe_cache.get(key)
+        now = _clock()
+        if (
+            cached is not None
+            and now - cached[1] < SHARED_RESULT_MAX_AGE_SECONDS
+            and (newer_than is None or cached[1] > newer_than)
+        ):
+            return cached
+        response = getattr(client, operation)(**params)
+        _describe_cache[key] = (response, _clock())
+        return _describe_cache[key]
+
+
+def wait_for_status(client, operation, params, status_key, waiting_states, resource):
+    """
+    Poll a describe operation until the resource leaves its transitional states
+    :param client: The boto3 client
+    :param operation: The describe method name, for example describe_bot_locale
+    :param params: Dict of the describe parameters
+    :param status_key: Key of the status in the describe response, or a function returning the status of a response
+    :param waiting_states: Statuses that mean the resource is still transitioning
+    :param resource: The resource type, used to pick the backoff curve and as metric dimension
+    :return: The first describe response with a status outside waiting_states
+    :raises WaiterTimeout: if the deadline of the invocation would be exceeded
+    """
+    get_status = status_key if callable(status_key) else lambda response: response[status_key]
+    start = _clock()
+    attempt = 0
+    state = None
+    try:
+        response, fetched_at = describe(client, operation, params)
+        while get_status(response) in waiting_states:
+            if get_status(response) != state:
+                state = get_status(response)
+                attempt = 0
+            delay = next_delay(resource, state, attempt)
+            remaining = remaining_seconds()
+            if remaining is not None and remaining < delay:
+                raise WaiterTimeout(f"Timed out waiting for {resource} to leave {state} state")
+            _wait(delay)
+            attempt += 1
+            response, fetched_at = describe(client, operation, params, newer_than=fetched_at)
+        return response
+    finally:
+        end = _clock()
+        waited = end - start
+        record("wait", resource, start, end, params.get("localeId"))
+        with _cache_lock:
+            _wait_seconds[resource] = _wait_seconds.get(resource, 0) + waited
+        put_metric("WaitTime", round(waited, 3), Resource=resource)
+
+
+def wait_summary():
+    """
+    :return: Dict of resource type to the total seconds spent waiting on it in this invocation
+    """
+    with _cache_lock:
+        return {resource: round(seconds, 3) for resource, seconds in _wait_seconds.items()}
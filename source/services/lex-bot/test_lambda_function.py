@@ -11,6 +11,9 @@
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
 import os
+import sys
+import json
+import subprocess
 from datetime import datetime
 from unittest import TestCase, mock
 from mock import patch
@@ -25,8 +28,89 @@ mock_env_variables = {
 }
 
 
+def local_checkpoint_store():
+    from shared.checkpoint import LocalCheckpointStore
+    return LocalCheckpointStore()
+
+
+def waiter_timeout(*_):
+    from shared.waiter import WaiterTimeout
+    raise WaiterTimeout("Timed out waiting for locale to leave Building state")
+
+
+def released(definition, locale_ids):
+    def release(state):
+        state.update(botVersion="1", liveBotAliasId="testlivealiasid")
+    return [("release", release)]
+
+
+def lex_responses(responses):
+    def make_api_call(operation, params):
+        response = responses[operation]
+        return response(params) if callable(response) else response
+    return make_api_call
+
+
+def fleet_phases(calls, seconds=0.0, failing=(), timing_out=()):
+    """
+    Replace the phases of each bot with one phase recording the bot, sleeping and then failing, timing out
+    once or completing
+    """
+    from time import sleep
+
+    def phases(bot_name, bot_role_arn, child_directed, bot_languages, context, mode):
+        def provision(state):
+            calls.append((bot_name, bot_role_arn, child_directed, bot_languages))
+            sleep(seconds)
+            if bot_name in failing:
+                raise RuntimeError(f"Failed to create {bot_name}")
+            if bot_name in timing_out and calls.count(calls[-1]) == 1:
+                waiter_timeout()
+            state.update(botId=f"{bot_name}id", botAliasId="testaliasid", liveBotAliasId="liveid", botVersion="1")
+        return [("provision", provision)]
+    return phases
+
+
+EVENT = {"LogicalResourceId": "LexBot", "RequestId": "request1"}
+RELEASE_DATA = {"BotId": "testbotid", "BotAliasId": "testlivealiasid", "BotVersion": "1", "TestBotAliasId": "testaliasid"}
+# seconds `import lambda_function` takes in a fresh interpreter after importing boto3, the clients it creates
+# included, may be at most this many times the seconds importing boto3 alone takes.
+# Set LEX_BOT_IMPORT_TIME_RATIO to change the budget on a machine where the ratio differs
+IMPORT_TIME_RATIO = float(os.environ.get("LEX_BOT_IMPORT_TIME_RATIO", "4"))
+# prints the seconds importing boto3 and then lambda_function take, then the modules `import lambda_function`
+# loaded among the ones it should only load on use
+IMPORT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import boto3
+print(time.perf_counter() - start)
+start = time.perf_counter()
+import lambda_function
+print(time.perf_counter() - start)
+from shared.content_catalog import CONTENT_MODULES
+# the shared content lives in shared.helpers, which lambda_function uses directly
+content_modules = [name for namespace, name in CONTENT_MODULES.items() if namespace != "shared"]
+lazy_modules = list(lambda_function.INTENT_MODULES) + content_modules
+print(",".join(name for name in lazy_modules if name in sys.modules))
+"""
+CONTEXT = mock.Mock(invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:test")
+
+
 @patch.dict(os.environ, mock_env_variables)
 class LambdaTest(TestCase):
+    def setUp(self):
+        # the class patch of the environment does not cover setUp, which may be the first to import the clients
+        with patch.dict(os.environ, mock_env_variables):
+            from shared.waiter import start_invocation
+            from shared.resource_index import reset_index
+            from shared.testing import FakeClock
+            from lambda_function import helper
+        # waiters advance the clock instead of sleeping
+        self.clock = FakeClock()
+        start_invocation(None, self.clock, self.clock.wait)
+        reset_index()
+        helper.Data.clear()
+
     @patch(
         "botocore.client.BaseClient._make_api_call", side_effect=[{"botStatus": "Creating"}, {"botStatus": "Failed"}]
     )
@@ -46,20 +130,42 @@ class LambdaTest(TestCase):
 
     @patch(
         "botocore.client.BaseClient._make_api_call",
-        side_effect=[{"botLocaleStatus": "Building"}, {"botLocaleStatus": "Failed"}],
+        side_effect=[
+            {"botLocaleSummaries": [
+                {"localeId": "en_US", "botLocaleStatus": "Building"},
+                {"localeId": "es_US", "botLocaleStatus": "Building"},
+            ]},
+            {"botLocaleSummaries": [
+                {"localeId": "en_US", "botLocaleStatus": "Built"},
+                {"localeId": "es_US", "botLocaleStatus": "Building"},
+                {"localeId": "fr_FR", "botLocaleStatus": "Failed"},
+            ]},
+            {"botLocaleSummaries": [
+                {"localeId": "en_US", "botLocaleStatus": "Built"},
+                {"localeId": "es_US", "botLocaleStatus": "Failed"},
+            ]},
+        ],
     )
-    def test_wait_for_build(self, mock_client):
-        from lambda_function import wait_for_build
-        with pytest.raises(RuntimeError):
-            wait_for_build(bot_id="testid1234", locale_id="testid1234")
+    def test_wait_for_builds(self, mock_client):
+        from lambda_function import wait_for_builds
+        with pytest.raises(RuntimeError, match="es_US"):
+            wait_for_builds(bot_id="testid1234", locale_ids=["en_US", "es_US"])
+        # a single waiter lists all locales on each poll
+        self.assertEqual(mock_client.call_count, 3)
+        self.assertEqual(len(self.clock.waits), 2)
+        mock_client.assert_called_with("ListBotLocales", {"botId": "testid1234", "botVersion": "DRAFT"})
 
     @patch(
         "botocore.client.BaseClient._make_api_call", side_effect=[{"botStatus": "Deleting"}, {"botStatus": "Failed"}]
     )
     def test_wait_for_bot_delete(self, mock_client):
         from lambda_function import wait_for_bot_delete
+        from shared.waiter import BACKOFF_CURVES
         with pytest.raises(RuntimeError):
             wait_for_bot_delete(bot_id="testid1234")
+        first = BACKOFF_CURVES[("bot", "Deleting")][0]
+        self.assertEqual(len(self.clock.waits), 1)
+        self.assertTrue(first / 2 <= self.clock.waits[0] <= first)
 
     @patch("botocore.client.BaseClient._make_api_call", return_value="test locale response")
     def test_create_lex_bot_locale(self, mock_client):
@@ -95,20 +201,30 @@ class LambdaTest(TestCase):
         self.assertEqual(response, "test response")
 
     @patch(
-        "botocore.client.BaseClient._make_api_call", return_value={"botAliasSummaries": [{"botAliasId": "testid1234"}]}
+        "botocore.client.BaseClient._make_api_call",
+        return_value={
+            "botAliasSummaries": [
+                {"botAliasId": "testlive12", "botAliasName": "LiveBotAlias"},
+                {"botAliasId": "testid1234", "botAliasName": "TestBotAlias"},
+            ]
+        },
     )
     def test_get_bot_alias_id(self, mock_client):
         from lambda_function import get_bot_alias_id
         response = get_bot_alias_id(bot_id="testid1234")
         mock_client.assert_called_with("ListBotAliases", {"botId": "testid1234"})
         self.assertEqual(response, "testid1234")
+        self.assertEqual(get_bot_alias_id("testid1234", "LiveBotAlias"), "testlive12")
 
     @patch(
-        "botocore.client.BaseClient._make_api_call", return_value={"botSummaries": [{"botId": "testid1234"}]}
+        "botocore.client.BaseClient._make_api_call",
+        return_value={"botSummaries": [{"botId": "testid1234", "botName": "testbot"}]},
     )
     def test_get_bot_id(self, mock_client):
         from lambda_function import get_bot_id
         response = get_bot_id()
+        self.assertEqual(get_bot_id("testbot"), "testid1234")
+        mock_client.assert_called_once()
         mock_client.assert_called_with("ListBots", {
             "filters":[{
                 "name": "BotName",
@@ -118,79 +234,295 @@ class LambdaTest(TestCase):
         })
         self.assertEqual(response, "testid1234")
 
+    def test_build_bot_definition(self):
+        from lambda_function import build_bot_definition
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        self.assertEqual(definition.bot_settings["botName"], "testbot")
+        self.assertEqual(definition.locale_settings("en_US")["nluIntentConfidenceThreshold"], 0.4)
+        self.assertEqual(
+            [intent["intentName"] for intent in definition.intents("en_US")],
+            ["LeaveFeedback", "MakeAppointment", "PizzaOrder", "WeatherForecast", "Help", "Name"],
+        )
+        self.assertIn("en_US", definition.alias_settings["botAliasLocaleSettings"])
+
+    @patch.dict(os.environ, {"additionalBotLanguages": "Spanish, French,English"})
+    def test_get_bot_languages(self):
+        from lambda_function import get_bot_languages
+        self.assertEqual(get_bot_languages(), ["English", "Spanish", "French"])
+        os.environ["additionalBotLanguages"] = ""
+        self.assertEqual(get_bot_languages(), ["English"])
+
+    def test_build_bot_definition_multiple_languages(self):
+        from lambda_function import build_bot_definition
+        definition = build_bot_definition("testbot", "testARN", "no", ["English", "Spanish", "French"])
+        self.assertEqual(list(definition.locales), ["en_US", "es_US", "fr_FR"])
+        self.assertEqual(list(definition.alias_settings["botAliasLocaleSettings"]), ["en_US", "es_US", "fr_FR"])
+        self.assertNotEqual(definition.intents("en_US"), definition.intents("es_US"))
+
+    @patch("lambda_function.execute_plan")
+    @patch("lambda_function.read_locale", return_value={"slotTypes": {}, "intents": {}})
+    def test_update_bot_locale_new_locale(self, mock_read_locale, mock_execute_plan):
+        from lambda_function import build_bot_definition, update_bot_locale
+        from shared.bot_plan import count_calls
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        changes = update_bot_locale(definition, bot_id="testbotid", locale_id="en_US")
+        mock_read_locale.assert_called_with("testbotid", "en_US")
+        plan = mock_execute_plan.call_args.args[0]
+        self.assertEqual(len(changes), len(plan))
+        self.assertEqual(
+            count_calls(plan), {"create_slot_type": 4, "create_intent": 6, "create_slot": 11, "update_intent": 4}
+        )
+        self.assertTrue(all(step.params["botId"] == "testbotid" for step in plan))
+
+    @patch("botocore.client.BaseClient._make_api_call", return_value={"botLocaleStatus": "NotBuilt"})
+    def test_start_build(self, mock_client):
+        from lambda_function import start_build
+        start_build(bot_id="testbotid", locale_id="testlocaleid")
+        mock_client.assert_called_with(
+            "BuildBotLocale", {"botId": "testbotid", "botVersion": "DRAFT", "localeId": "testlocaleid"}
+        )
+
+    @patch("botocore.client.BaseClient._make_api_call", return_value={"botLocaleStatus": "Building"})
+    def test_start_build_already_building(self, mock_client):
+        from lambda_function import start_build
+        start_build(bot_id="testbotid", locale_id="testlocaleid")
+        mock_client.assert_called_once_with(
+            "DescribeBotLocale", {"botId": "testbotid", "botVersion": "DRAFT", "localeId": "testlocaleid"}
+        )
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store")
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=True)
+    @patch("lambda_function.update_bot_locale", return_value=[("create", "intent", "Help")])
     @patch("lambda_function.wait_for_locale")
-    @patch("lambda_function.create_lex_bot_locale", return_value={"localeId": "testid1234"})
-    @patch("lambda_function.get_bot_alias_id", return_value="testid1234")
+    @patch("lambda_function.create_lex_bot_locale")
+    @patch("lambda_function.get_bot_locales", side_effect=[{}, {"en_US": "NotBuilt"}])
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
     @patch("lambda_function.wait_for_bot")
-    @patch("lambda_function.create_lex_bot", return_value={"botId": "testid1234"})
-    def test_configure_lex_bot(
+    @patch("lambda_function.create_lex_bot", return_value={"botId": "testbotid"})
+    @patch("lambda_function.get_bot_id", return_value=None)
+    def test_create_resource(
         self,
+        mock_get_bot_id,
         mock_create_lex_bot,
         mock_wait_for_bot,
         mock_get_bot_alias_id,
+        mock_get_bot_locales,
         mock_create_lex_bot_locale,
         mock_wait_for_locale,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_build,
+        mock_checkpoint_store,
     ):
-        from lambda_function import configure_lex_bot
-        bot_id, bot_alias_id, locale_id = configure_lex_bot(
-            bot_name="testname", bot_role_arn="testARN", child_directed="no", bot_language="English"
-        )
-        mock_create_lex_bot.assert_called_with("testname", "testARN", "no")
-        mock_wait_for_bot.assert_called_with("testid1234")
-        mock_get_bot_alias_id.assert_called_with("testid1234")
-        mock_create_lex_bot_locale.assert_called_with("English", "testid1234")
-        mock_wait_for_locale.assert_called_with("testid1234", "testid1234")
-
-        self.assertEqual(bot_id, "testid1234")
-        self.assertEqual(bot_alias_id, "testid1234")
-        self.assertEqual(locale_id, "testid1234")
-
-    @patch("lambda_function.create_name_intent")
-    @patch("lambda_function.create_help_intent")
-    @patch("lambda_function.create_weather_intent")
-    @patch("lambda_function.create_order_pizza_intent")
-    @patch("lambda_function.create_appointment_intent")
-    @patch("lambda_function.create_feedback_intent")
-    def test_create_bot_intents(
+        from lambda_function import create_resource, helper
+        mock_checkpoint_store.load.return_value = None
+        response = create_resource(EVENT, {})
+        self.assertEqual(response, "testbotid")
+        mock_create_lex_bot.assert_called_with("testbot", "testARN", "no")
+        mock_wait_for_bot.assert_called_with("testbotid")
+        mock_create_lex_bot_locale.assert_called_with("English", "testbotid")
+        mock_wait_for_locale.assert_called_with("testbotid", "en_US")
+        mock_update_bot_locale.assert_called_with(mock.ANY, "testbotid", "en_US")
+        mock_update_lex_bot_alias.assert_called_with(mock.ANY, "testbotid", "testaliasid")
+        mock_start_build.assert_called_with("testbotid", "en_US")
+        mock_complete_build.assert_called_with(mock.ANY, "testbotid", ["en_US"], {})
+        mock_checkpoint_store.load.assert_called_with("LexBot/request1")
+        mock_checkpoint_store.delete.assert_called_once_with("LexBot/request1")
+        self.assertEqual(mock_checkpoint_store.save.call_count, 8)
+        self.assertEqual(helper.Data, RELEASE_DATA)
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch.dict(os.environ, {"additionalBotLanguages": "Spanish"})
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=True)
+    @patch("lambda_function.update_bot_locale", side_effect=lambda definition, bot_id, locale_id: [])
+    @patch("lambda_function.wait_for_locale")
+    @patch("lambda_function.create_lex_bot_locale")
+    @patch("lambda_function.get_bot_locales", return_value={})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.wait_for_bot")
+    @patch("lambda_function.create_lex_bot", return_value={"botId": "testbotid"})
+    @patch("lambda_function.get_bot_id", return_value=None)
+    def test_create_resource_multiple_languages(
         self,
-        mock_create_feedback_intent,
-        mock_create_appointment_intent,
-        mock_create_order_pizza_intent,
-        mock_create_weather_intent,
-        mock_create_help_intent,
-        mock_create_name_intent,
+        mock_get_bot_id,
+        mock_create_lex_bot,
+        mock_wait_for_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_create_lex_bot_locale,
+        mock_wait_for_locale,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_builds,
+        checkpoint_store,
     ):
-        from lambda_function import create_bot_intents
-        create_bot_intents(bot_id="testbotid", bot_alias_id="testaliasid", locale_id="testlocaleid")
-        mock_create_feedback_intent.assert_called_with("testbotid", "testlocaleid", "testaliasid")
-        mock_create_appointment_intent.assert_called_with("testbotid", "testlocaleid")
-        mock_create_order_pizza_intent.assert_called_with("testbotid", "testlocaleid")
-        mock_create_weather_intent.assert_called_with("testbotid", "testlocaleid")
-        mock_create_help_intent.assert_called_with("testbotid", "testlocaleid")
-        mock_create_name_intent.assert_called_with("testbotid", "testlocaleid")
-
-    @patch("lambda_function.wait_for_build")
-    @patch("botocore.client.BaseClient._make_api_call", return_value="test locale response")
-    def test_build_lex_bot(self, mock_client, mock_wait_for_build):
-        from lambda_function import build_lex_bot
-        build_lex_bot(bot_id="testbotid", locale_id="testlocaleid")
-        mock_client.assert_called_with(
-            "BuildBotLocale", {"botId": "testbotid", "botVersion": "DRAFT", "localeId": "testlocaleid"}
+        from lambda_function import create_resource
+        create_resource(EVENT, {})
+        mock_create_lex_bot_locale.assert_has_calls(
+            [mock.call("English", "testbotid"), mock.call("Spanish", "testbotid")], any_order=True
         )
-        mock_wait_for_build.assert_called_with("testbotid", "testlocaleid")
+        mock_wait_for_locale.assert_has_calls(
+            [mock.call("testbotid", "en_US"), mock.call("testbotid", "es_US")], any_order=True
+        )
+        mock_update_bot_locale.assert_has_calls(
+            [mock.call(mock.ANY, "testbotid", "en_US"), mock.call(mock.ANY, "testbotid", "es_US")], any_order=True
+        )
+        self.assertEqual(mock_update_lex_bot_alias.call_count, 1)
+        # both new locales are built, and a single waiter tracks both builds
+        mock_start_build.assert_has_calls(
+            [mock.call("testbotid", "en_US"), mock.call("testbotid", "es_US")], any_order=True
+        )
+        mock_complete_builds.assert_called_once_with(mock.ANY, "testbotid", ["en_US", "es_US"], {})
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch.dict(os.environ, {"provisioningMode": "import"})
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=True)
+    @patch("lambda_function.update_bot_locale")
+    @patch("lambda_function.get_bot_locales", return_value={"en_US": "NotBuilt"})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.create_lex_bot")
+    @patch("lambda_function.wait_for_import", return_value="testbotid")
+    @patch("lambda_function.start_bot_import", return_value="testimportid")
+    def test_create_resource_import_mode(
+        self,
+        mock_start_bot_import,
+        mock_wait_for_import,
+        mock_create_lex_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_builds,
+        checkpoint_store,
+    ):
+        from lambda_function import create_resource, BOT_TAGS
+        self.assertEqual(create_resource(EVENT, {}), "testbotid")
+        mock_start_bot_import.assert_called_once_with(mock.ANY, BOT_TAGS)
+        mock_wait_for_import.assert_called_once_with("testimportid")
+        mock_create_lex_bot.assert_not_called()
+        mock_update_bot_locale.assert_not_called()
+        mock_update_lex_bot_alias.assert_called_with(mock.ANY, "testbotid", "testaliasid")
+        # imported locales are not built yet
+        mock_start_build.assert_called_once_with("testbotid", "en_US")
+        mock_complete_builds.assert_called_once_with(mock.ANY, "testbotid", ["en_US"], {})
 
-    @patch("lambda_function.build_lex_bot")
-    @patch("lambda_function.create_bot_intents")
-    @patch("lambda_function.configure_lex_bot", return_value=("testbotid", "testaliasid", "testlocaleid"))
-    def test_create_resource(self, mock_configure_lex_bot, mock_create_bot_intents, mock_build_lex_bot):
+    @patch("lambda_function.release_phases", new=released)
+    @patch.dict(os.environ, {"provisioningMode": "import"})
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=True)
+    @patch("lambda_function.update_bot_locale", return_value=[("create", "intent", "Help")])
+    @patch("lambda_function.wait_for_locale")
+    @patch("lambda_function.create_lex_bot_locale")
+    @patch("lambda_function.get_bot_locales", return_value={})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.wait_for_bot")
+    @patch("lambda_function.create_lex_bot", return_value={"botId": "testbotid"})
+    @patch("lambda_function.get_bot_id", return_value=None)
+    @patch("lambda_function.wait_for_import", side_effect=RuntimeError("Failed to import Lex bot"))
+    @patch("lambda_function.start_bot_import", return_value="testimportid")
+    def test_create_resource_import_mode_falls_back(
+        self,
+        mock_start_bot_import,
+        mock_wait_for_import,
+        mock_get_bot_id,
+        mock_create_lex_bot,
+        mock_wait_for_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_create_lex_bot_locale,
+        mock_wait_for_locale,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_builds,
+        checkpoint_store,
+    ):
         from lambda_function import create_resource
-        event = {}
-        context = {}
-        response = create_resource(event, context)
-        mock_configure_lex_bot.assert_called_with("testbot", "testARN", "no", "English")
-        mock_create_bot_intents.assert_called_with("testbotid", "testaliasid", "testlocaleid")
-        mock_build_lex_bot.assert_called_with("testbotid", "testlocaleid")
-        self.assertEqual(response, "testbotid")
+        self.assertEqual(create_resource(EVENT, {}), "testbotid")
+        mock_create_lex_bot.assert_called_with("testbot", "testARN", "no")
+        mock_create_lex_bot_locale.assert_called_with("English", "testbotid")
+        mock_update_bot_locale.assert_called_with(mock.ANY, "testbotid", "en_US")
+        mock_start_build.assert_called_once_with("testbotid", "en_US")
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch.dict(os.environ, {"provisioningMode": "import"})
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.wait_for_import", side_effect=waiter_timeout)
+    @patch("lambda_function.start_bot_import", return_value="testimportid")
+    def test_create_resource_import_mode_checkpoints_import_id(
+        self, mock_start_bot_import, mock_wait_for_import, checkpoint_store
+    ):
+        from lambda_function import create_resource
+        from shared.checkpoint import ContinueInNewInvocation
+        with pytest.raises(ContinueInNewInvocation):
+            create_resource(EVENT, {})
+        self.assertEqual(checkpoint_store.load("LexBot/request1")["importId"], "testimportid")
+        with pytest.raises(ContinueInNewInvocation):
+            create_resource(EVENT, {})
+        mock_start_bot_import.assert_called_once()
+
+    def test_import_time_budget(self):
+        env = dict(os.environ, AWS_DEFAULT_REGION=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"))
+        runs = [
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split("\n")
+            for _ in range(3)
+        ]
+        # intent and content modules are only imported by requests building the bot definition
+        self.assertEqual(runs[0][2], "")
+        boto3_seconds = min(float(run[0]) for run in runs)
+        import_seconds = min(float(run[1]) for run in runs)
+        self.assertLess(
+            import_seconds,
+            boto3_seconds * IMPORT_TIME_RATIO,
+            f"import lambda_function took {import_seconds:.3f}s, {import_seconds / boto3_seconds:.1f} times the "
+            f"{boto3_seconds:.3f}s of import boto3, over the budget of {IMPORT_TIME_RATIO} times",
+        )
+
+    def test_intent_modules(self):
+        from lambda_function import intent_modules, INTENT_MODULES
+        modules = intent_modules()
+        self.assertEqual([module.__name__ for module in modules], list(INTENT_MODULES))
+        self.assertTrue(all(callable(module.populate) for module in modules))
+
+    @patch("shared.rate_limiter.TokenBucket.acquire", return_value=0)
+    def test_benchmark_import_mode_makes_fewer_calls(self, _):
+        from benchmark_bot_import import run_benchmark
+        api_calls, _ = run_benchmark("api", ["English", "Spanish"], latency=0)
+        import_calls, _ = run_benchmark("import", ["English", "Spanish"], latency=0)
+        self.assertEqual(import_calls["StartImport"], 1)
+        self.assertEqual(import_calls["CreateIntent"] + import_calls["CreateSlot"], 0)
+        self.assertEqual(api_calls["StartImport"], 0)
+        # both modes make the same calls to release the built bot
+        self.assertEqual(import_calls["CreateBotVersion"], api_calls["CreateBotVersion"])
+        self.assertLess(sum(import_calls.values()) * 3, sum(api_calls.values()))
+
+    def test_call_budget_matches_baseline(self):
+        from call_budget_report import build_report, compare, BASELINE_PATH
+        with open(BASELINE_PATH, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        # run python call_budget_report.py to update the baseline along with a change making more or fewer calls
+        self.assertEqual(compare(baseline, build_report()), [], "API calls differ from call_budget_baseline.json")
 
     @patch("lambda_function.get_bot_id", return_value="testbotid")
     @patch("botocore.client.BaseClient._make_api_call")
@@ -203,16 +535,546 @@ class LambdaTest(TestCase):
         mock_client.assert_called_with("DeleteBot", {'botId': 'testbotid', 'skipResourceInUseCheck': True})
 
 
-    @patch("lambda_function.delete_resource")
-    @patch("lambda_function.wait_for_bot_delete")
-    @patch("lambda_function.get_bot_id", return_value="testbotid1234")
-    @patch("lambda_function.create_resource")
-    def test_update_resource(self, mock_create, mock_get_bot_id, mock_wait, mock_delete):
+    def test_delete_waits_briefly_for_logs(self):
+        from lambda_function import helper, DELETE_LOG_FLUSH_SECONDS
+        mock_sleep = mock.Mock()
+        helper._context = mock.Mock(get_remaining_time_in_millis=lambda: 900000)
+        helper._wait_for_cwlogs(sleep=mock_sleep)
+        mock_sleep.assert_called_once_with(DELETE_LOG_FLUSH_SECONDS)
+
+    @patch("lambda_function.get_bot_id", return_value=None)
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_delete_resource_missing_bot(self, mock_client, mock_get_bot_id):
+        from lambda_function import delete_resource
+        delete_resource({"ResourceProperties": {"botName": "oldbot"}}, {})
+        mock_get_bot_id.assert_called_with("oldbot")
+        mock_client.assert_not_called()
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_get_bot_id_of_bot_being_deleted(self, mock_client):
+        import botocore
+        from lambda_function import get_bot_id
+
+        def describe_bot(params):
+            raise botocore.exceptions.ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "DescribeBot")
+
+        mock_client.side_effect = lex_responses({
+            "ListBots": {"botSummaries": [{"botId": "oldbotid", "botName": "testbot", "botStatus": "Deleting"}]},
+            "DescribeBot": describe_bot,
+        })
+        self.assertIsNone(get_bot_id("testbot"))
+        self.assertEqual([call[0][0] for call in mock_client.call_args_list], ["ListBots"])
+        # the name is free once the bot is gone
+        self.assertIsNone(get_bot_id("testbot", replacing=True))
+        self.assertEqual([call[0][0] for call in mock_client.call_args_list], ["ListBots", "DescribeBot"])
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=False)
+    @patch("lambda_function.update_bot_locale", return_value=[])
+    @patch("lambda_function.get_bot_locales", return_value={"en_US": "Built"})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.update_lex_bot", return_value=False)
+    @patch("lambda_function.get_bot_id", return_value="testbotid")
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_update_resource_without_changes(
+        self,
+        mock_client,
+        mock_get_bot_id,
+        mock_update_lex_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        checkpoint_store,
+    ):
+        from lambda_function import update_resource, helper
+        response = update_resource(EVENT, {})
+        self.assertEqual(response, "testbotid")
+        mock_update_lex_bot.assert_called_with("testbotid", "testbot", "testARN", "no")
+        mock_update_bot_locale.assert_called_with(mock.ANY, "testbotid", "en_US")
+        mock_update_lex_bot_alias.assert_called_with(mock.ANY, "testbotid", "testaliasid")
+        mock_start_build.assert_not_called()
+        mock_client.assert_not_called()
+        self.assertEqual(checkpoint_store.checkpoints, {})
+        self.assertEqual(helper.Data, RELEASE_DATA)
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=False)
+    @patch("lambda_function.update_bot_locale", return_value=[])
+    @patch("lambda_function.wait_for_locale")
+    @patch("lambda_function.create_lex_bot_locale")
+    @patch("lambda_function.wait_for_bot_locale_delete")
+    @patch("lambda_function.get_bot_locales", return_value={"en_US": "Deleting"})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.update_lex_bot", return_value=False)
+    @patch("lambda_function.get_bot_id", return_value="testbotid")
+    def test_update_resource_recreates_deleted_locale(
+        self,
+        mock_get_bot_id,
+        mock_update_lex_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_wait_for_bot_locale_delete,
+        mock_create_lex_bot_locale,
+        mock_wait_for_locale,
+        *_,
+    ):
         from lambda_function import update_resource
-        event = {}
-        context = {}
-        update_resource(event, context)
-        mock_delete.assert_called_with(event, context)
-        mock_get_bot_id.assert_called()
-        mock_wait.assert_called_with("testbotid1234")
-        mock_create.assert_called_with(event, context)
\ No newline at end of file
+        calls = []
+        mock_wait_for_bot_locale_delete.side_effect = lambda *args: calls.append(("wait_for_delete",) + args)
+        mock_create_lex_bot_locale.side_effect = lambda *args: calls.append(("create",) + args) or {}
+        self.assertEqual(update_resource(EVENT, {}), "testbotid")
+        # the locale removed by an earlier update is only created again once its delete completed
+        self.assertEqual(
+            calls,
+            [("wait_for_delete", "testbotid", "en_US"), ("create", "English", "testbotid")],
+        )
+        mock_wait_for_locale.assert_called_once_with("testbotid", "en_US")
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=False)
+    @patch("lambda_function.update_bot_locale", return_value=[("update", "intent", "Help")])
+    @patch("lambda_function.get_bot_locales", return_value={"en_US": "Built"})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.update_lex_bot", return_value=False)
+    @patch("lambda_function.get_bot_id", return_value="testbotid")
+    def test_update_resource_with_changes(
+        self,
+        mock_get_bot_id,
+        mock_update_lex_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_build,
+        checkpoint_store,
+    ):
+        from lambda_function import update_resource
+        update_resource(EVENT, {})
+        mock_start_build.assert_called_once_with("testbotid", "en_US")
+        mock_complete_build.assert_called_once_with(mock.ANY, "testbotid", ["en_US"], {})
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=False)
+    @patch("lambda_function.update_bot_locale", return_value=[])
+    @patch("lambda_function.wait_for_locale")
+    @patch("lambda_function.create_lex_bot_locale")
+    @patch(
+        "lambda_function.get_bot_locales",
+        side_effect=[{"fr_FR": "Built"}, {"fr_FR": "Built", "en_US": "NotBuilt"}],
+    )
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.update_lex_bot", return_value=False)
+    @patch("lambda_function.get_bot_id", return_value="testbotid")
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_update_resource_new_language(
+        self,
+        mock_client,
+        mock_get_bot_id,
+        mock_update_lex_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_create_lex_bot_locale,
+        mock_wait_for_locale,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_build,
+        checkpoint_store,
+    ):
+        from lambda_function import update_resource
+        update_resource(EVENT, {})
+        mock_create_lex_bot_locale.assert_called_with("English", "testbotid")
+        mock_wait_for_locale.assert_called_with("testbotid", "en_US")
+        mock_update_bot_locale.assert_called_with(mock.ANY, "testbotid", "en_US")
+        # the new locale is built even though its intents were created without changes left to apply
+        mock_start_build.assert_called_once_with("testbotid", "en_US")
+        mock_client.assert_called_with(
+            "DeleteBotLocale", {"botId": "testbotid", "botVersion": "DRAFT", "localeId": "fr_FR"}
+        )
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds")
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=False)
+    @patch("lambda_function.update_bot_locale")
+    @patch("lambda_function.get_bot_locales", return_value={"en_US": "Building"})
+    @patch("lambda_function.get_bot_id")
+    def test_create_resource_resumes_from_checkpoint(
+        self,
+        mock_get_bot_id,
+        mock_get_bot_locales,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_build,
+        checkpoint_store,
+    ):
+        from lambda_function import create_resource
+        checkpoint_store.save("LexBot/request1", {
+            "completedPhases": ["bot", "locale", "intents"],
+            "botId": "testbotid",
+            "botAliasId": "testaliasid",
+            "localeIds": ["en_US"],
+            "changedLocaleIds": ["en_US"],
+        })
+        self.assertEqual(create_resource(EVENT, {}), "testbotid")
+        mock_get_bot_id.assert_not_called()
+        mock_update_bot_locale.assert_not_called()
+        mock_update_lex_bot_alias.assert_called_with(mock.ANY, "testbotid", "testaliasid")
+        mock_start_build.assert_called_once_with("testbotid", "en_US")
+        mock_complete_build.assert_called_once()
+        self.assertEqual(checkpoint_store.checkpoints, {})
+
+    @patch("lambda_function.release_phases", new=released)
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("lambda_function.complete_builds", side_effect=waiter_timeout)
+    @patch("lambda_function.start_build")
+    @patch("lambda_function.update_lex_bot_alias", return_value=False)
+    @patch("lambda_function.update_bot_locale", return_value=[("update", "intent", "Help")])
+    @patch("lambda_function.get_bot_locales", return_value={"en_US": "Built"})
+    @patch("lambda_function.get_bot_alias_id", return_value="testaliasid")
+    @patch("lambda_function.update_lex_bot", return_value=False)
+    @patch("lambda_function.get_bot_id", return_value="testbotid")
+    def test_update_resource_checkpoints_on_timeout(
+        self,
+        mock_get_bot_id,
+        mock_update_lex_bot,
+        mock_get_bot_alias_id,
+        mock_get_bot_locales,
+        mock_update_bot_locale,
+        mock_update_lex_bot_alias,
+        mock_start_build,
+        mock_complete_build,
+        checkpoint_store,
+    ):
+        from lambda_function import update_resource
+        from shared.checkpoint import ContinueInNewInvocation
+        with pytest.raises(ContinueInNewInvocation):
+            update_resource(EVENT, {})
+        state = checkpoint_store.load("LexBot/request1")
+        self.assertEqual(state["completedPhases"], ["bot", "locale", "intents", "alias", "build"])
+        self.assertEqual(state["buildingLocaleIds"], ["en_US"])
+
+    def test_get_bot_arn(self):
+        from lambda_function import get_bot_arn
+        self.assertEqual(get_bot_arn("testbotid", CONTEXT), "arn:aws:lex:us-east-1:123456789012:bot/testbotid")
+        self.assertIsNone(get_bot_arn("testbotid", {}))
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_needs_build_fingerprint_unchanged(self, mock_client):
+        from lambda_function import build_bot_definition, needs_build
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        mock_client.return_value = {"tags": {"fingerprint:en_US": definition.fingerprint("en_US")}}
+        self.assertFalse(needs_build(definition, "testbotid", "en_US", CONTEXT, changed=False))
+        mock_client.assert_called_once_with(
+            "ListTagsForResource", {"resourceARN": "arn:aws:lex:us-east-1:123456789012:bot/testbotid"}
+        )
+
+    @patch("botocore.client.BaseClient._make_api_call", return_value={"tags": {"fingerprint:en_US": "previous"}})
+    def test_needs_build_fingerprint_changed(self, mock_client):
+        from lambda_function import build_bot_definition, needs_build
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        self.assertTrue(needs_build(definition, "testbotid", "en_US", CONTEXT, changed=False))
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_needs_build_with_changes(self, mock_client):
+        from lambda_function import build_bot_definition, needs_build
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        # the previous fingerprint does not matter when the locale changed
+        self.assertTrue(needs_build(definition, "testbotid", "en_US", CONTEXT, changed=True))
+        mock_client.assert_not_called()
+
+    @patch("lambda_function.wait_for_builds")
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_complete_builds(self, mock_client, mock_wait_for_builds):
+        from lambda_function import build_bot_definition, complete_builds
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        complete_builds(definition, "testbotid", ["en_US"], CONTEXT)
+        mock_wait_for_builds.assert_called_once_with("testbotid", ["en_US"])
+        mock_client.assert_called_with(
+            "TagResource",
+            {
+                "resourceARN": "arn:aws:lex:us-east-1:123456789012:bot/testbotid",
+                "tags": {"fingerprint:en_US": definition.fingerprint("en_US")},
+            },
+        )
+
+    @patch("lambda_function.wait_for_bot")
+    @patch(
+        "botocore.client.BaseClient._make_api_call",
+        return_value={
+            "botName": "testbot",
+            "description": "Created by Serverless Bot Framework",
+            "roleArn": "testARN",
+            "dataPrivacy": {"childDirected": False},
+            "idleSessionTTLInSeconds": 300,
+            "botStatus": "Available",
+        },
+    )
+    def test_update_lex_bot(self, mock_client, mock_wait_for_bot):
+        from lambda_function import update_lex_bot
+        self.assertFalse(update_lex_bot("testbotid", "testbot", "testARN", "no"))
+        mock_client.assert_called_once_with("DescribeBot", {"botId": "testbotid"})
+        self.assertTrue(update_lex_bot("testbotid", "testbot", "testARN", "Yes"))
+        mock_client.assert_called_with(
+            "UpdateBot",
+            {
+                "botId": "testbotid",
+                "botName": "testbot",
+                "description": "Created by Serverless Bot Framework",
+                "roleArn": "testARN",
+                "dataPrivacy": {"childDirected": True},
+                "idleSessionTTLInSeconds": 300,
+            },
+        )
+        mock_wait_for_bot.assert_called_with("testbotid")
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_release_phases_create_version(self, mock_client):
+        from lambda_function import build_bot_definition, release_phases, release_fingerprint
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        mock_client.side_effect = lex_responses({
+            "ListBotAliases": {"botAliasSummaries": [
+                {"botAliasId": "testaliasid", "botAliasName": "TestBotAlias", "botVersion": "DRAFT"},
+                {"botAliasId": "testlivealiasid", "botAliasName": "LiveBotAlias", "botVersion": "1"},
+            ]},
+            "DescribeBotVersion": lambda params: {
+                "botStatus": "Available", "description": "Serverless Bot Framework release older"
+            },
+            "CreateBotVersion": {"botVersion": "2", "botStatus": "Versioning"},
+            "DescribeBotAlias": {"botAliasStatus": "Available", "botVersion": "1"},
+            "UpdateBotAlias": {"botAliasStatus": "Available"},
+            "ListBotVersions": {"botVersionSummaries": [{"botVersion": "2"}, {"botVersion": "1"}]},
+        })
+        state = {"botId": "testbotid"}
+        for _, run in release_phases(definition, ["en_US"]):
+            run(state)
+        self.assertEqual(state, {"botId": "testbotid", "botVersion": "2", "liveBotAliasId": "testlivealiasid"})
+        mock_client.assert_any_call(
+            "CreateBotVersion",
+            {
+                "botId": "testbotid",
+                "description": "Serverless Bot Framework release " + release_fingerprint(definition, ["en_US"]),
+                "botVersionLocaleSpecification": {"en_US": {"sourceBotVersion": "DRAFT"}},
+            },
+        )
+        update = next(call for call in mock_client.call_args_list if call[0][0] == "UpdateBotAlias")
+        self.assertEqual(update[0][1]["botAliasName"], "LiveBotAlias")
+        self.assertEqual(update[0][1]["botVersion"], "2")
+        self.assertIn("en_US", update[0][1]["botAliasLocaleSettings"])
+        operations = [call[0][0] for call in mock_client.call_args_list]
+        self.assertNotIn("DeleteBotVersion", operations)
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_release_phases_skip_released_definition(self, mock_client):
+        from lambda_function import build_bot_definition, release_phases, release_fingerprint
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        mock_client.side_effect = lex_responses({
+            "ListBotAliases": {"botAliasSummaries": [
+                {"botAliasId": "testlivealiasid", "botAliasName": "LiveBotAlias", "botVersion": "1"},
+            ]},
+            "DescribeBotVersion": {
+                "botStatus": "Available",
+                "description": "Serverless Bot Framework release " + release_fingerprint(definition, ["en_US"]),
+            },
+            "DescribeBotAlias": {
+                "botAliasStatus": "Available",
+                "botVersion": "1",
+                "botAliasLocaleSettings": definition.alias_settings["botAliasLocaleSettings"],
+            },
+            "ListBotVersions": {"botVersionSummaries": [{"botVersion": "1"}]},
+        })
+        state = {"botId": "testbotid"}
+        for _, run in release_phases(definition, ["en_US"]):
+            run(state)
+        self.assertEqual(state["botVersion"], "1")
+        operations = {call[0][0] for call in mock_client.call_args_list}
+        self.assertFalse(operations & {"CreateBotVersion", "CreateBotAlias", "UpdateBotAlias", "DeleteBotVersion"})
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_release_bot_version_creates_live_alias(self, mock_client):
+        from lambda_function import build_bot_definition, release_bot_version
+        definition = build_bot_definition("testbot", "testARN", "no", ["English"])
+        mock_client.side_effect = lex_responses({
+            "ListBotAliases": {"botAliasSummaries": [{"botAliasId": "testaliasid", "botAliasName": "TestBotAlias"}]},
+            "CreateBotAlias": {"botAliasId": "testlivealiasid", "botAliasStatus": "Creating"},
+            "DescribeBotAlias": {"botAliasStatus": "Available"},
+        })
+        self.assertEqual(release_bot_version(definition, "testbotid", "1"), "testlivealiasid")
+        create = mock_client.call_args_list[1][0]
+        self.assertEqual(create[0], "CreateBotAlias")
+        self.assertEqual((create[1]["botAliasName"], create[1]["botVersion"]), ("LiveBotAlias", "1"))
+
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_delete_old_versions(self, mock_client):
+        from lambda_function import delete_old_versions, get_version_retention
+        mock_client.side_effect = lex_responses({
+            "ListBotVersions": lambda params: {
+                "botVersionSummaries": [{"botVersion": "2"}, {"botVersion": "DRAFT"}], "nextToken": "page2"
+            } if "nextToken" not in params else {
+                "botVersionSummaries": [{"botVersion": "10"}, {"botVersion": "9"}, {"botVersion": "1"}]
+            },
+            "ListBotAliases": {"botAliasSummaries": [
+                {"botAliasId": "testaliasid", "botVersion": "DRAFT"},
+                {"botAliasId": "pinnedaliasid", "botVersion": "1"},
+            ]},
+            "DeleteBotVersion": {},
+        })
+        self.assertEqual(delete_old_versions("testbotid", 2), ["2"])
+        mock_client.assert_called_with("DeleteBotVersion", {"botId": "testbotid", "botVersion": "2"})
+        self.assertEqual(get_version_retention(), 3)
+        with patch.dict(os.environ, {"botVersionRetention": "5"}):
+            self.assertEqual(get_version_retention(), 5)
+
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_create_resource_invalid_definition(self, mock_client, checkpoint_store):
+        from lambda_function import create_resource
+        from shared.bot_validation import DefinitionError
+        with patch.dict(os.environ, {"additionalBotLanguages": "Klingon"}):
+            with pytest.raises(DefinitionError, match="Language Klingon is not supported"):
+                create_resource(EVENT, {})
+        with patch("order_pizza.intent.order_utterances", return_value=[{"utterance": "help"}]):
+            with pytest.raises(DefinitionError, match="utterance 'help' is shared by intents PizzaOrder, Help"):
+                create_resource(EVENT, {})
+        with patch("order_pizza.intent.order_utterances", side_effect=KeyError("English")):
+            with pytest.raises(DefinitionError, match="order_pizza.intent has no English content"):
+                create_resource(EVENT, {})
+        mock_client.assert_not_called()
+
+    def test_get_bot_specs(self):
+        from lambda_function import get_bot_specs
+        self.assertIsNone(get_bot_specs({"botName": "testbot"}))
+        specs = get_bot_specs({"botSpecs": '[{"botName": "brand1"}, {"botName": "brand2", "botLanguage": "French", '
+                                           '"additionalBotLanguages": "German", "childDirected": "Yes"}]'})
+        self.assertEqual(
+            specs,
+            [
+                {"botName": "brand1", "botLanguages": ["English"], "childDirected": "no", "botRole": "testARN"},
+                {"botName": "brand2", "botLanguages": ["French", "German"], "childDirected": "Yes", "botRole": "testARN"},
+            ],
+        )
+        with pytest.raises(ValueError, match="not unique"):
+            get_bot_specs({"botSpecs": [{"botName": "brand1"}, {"botName": "brand1"}]})
+        with pytest.raises(ValueError, match="do not fit in a CloudFormation response"):
+            get_bot_specs({"botSpecs": [{"botName": f"{'brand' * 18}{index}"} for index in range(20)]})
+
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    def test_create_resource_fleet(self, checkpoint_store):
+        from time import perf_counter
+        from lambda_function import create_resource, helper
+        calls = []
+        bot_seconds = 0.1
+        names = [f"brand{index}" for index in range(20)]
+        event = dict(EVENT, ResourceProperties={"botSpecs": [{"botName": name} for name in names]})
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases(calls, bot_seconds)):
+            start = perf_counter()
+            self.assertEqual(create_resource(event, {}), "LexBotFleet")
+            elapsed = perf_counter() - start
+        self.assertEqual(sorted(call[0] for call in calls), sorted(names))
+        self.assertLess(elapsed, len(names) * bot_seconds / 3)
+        self.assertEqual(len(helper.Data), 2 * len(names))
+        self.assertEqual(helper.Data["brand3.BotId"], "brand3id")
+        self.assertEqual(helper.Data["brand3.BotAliasId"], "liveid")
+        self.assertEqual(checkpoint_store.checkpoints, {})
+
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    def test_create_resource_fleet_continues(self, checkpoint_store):
+        from lambda_function import create_resource, helper
+        from shared.checkpoint import ContinueInNewInvocation
+        calls = []
+        event = dict(EVENT, ResourceProperties={"botSpecs": [{"botName": "brand1"}, {"botName": "brand2"}]})
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases(calls, timing_out=["brand2"])):
+            with pytest.raises(ContinueInNewInvocation):
+                create_resource(event, {})
+            self.assertEqual(checkpoint_store.load("LexBot/request1/brand1")["status"], "Completed")
+            self.assertEqual(checkpoint_store.load("LexBot/request1/brand2")["completedPhases"], [])
+            create_resource(event, {})
+        # the completed bot is not provisioned again
+        self.assertEqual([call[0] for call in calls].count("brand1"), 1)
+        self.assertEqual((helper.Data["brand1.BotId"], helper.Data["brand2.BotId"]), ("brand1id", "brand2id"))
+        self.assertEqual(checkpoint_store.checkpoints, {})
+
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    def test_create_resource_fleet_failure(self, checkpoint_store):
+        from lambda_function import create_resource
+        calls = []
+        event = dict(EVENT, ResourceProperties={"botSpecs": [{"botName": "brand1"}, {"botName": "brand2"}]})
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases(calls, failing=["brand1"])):
+            with pytest.raises(RuntimeError, match="brand1.*Failed to create brand1"):
+                create_resource(event, {})
+        # the other bots of the fleet are still provisioned
+        self.assertEqual(sorted(call[0] for call in calls), ["brand1", "brand2"])
+        self.assertEqual(checkpoint_store.checkpoints, {})
+
+    @patch("lambda_function.delete_bots")
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    def test_update_resource_fleet_removes_bots(self, checkpoint_store, mock_delete_bots):
+        from lambda_function import update_resource
+        event = dict(
+            EVENT,
+            PhysicalResourceId="LexBotFleet",
+            ResourceProperties={"botSpecs": [{"botName": "brand1"}]},
+            OldResourceProperties={"botSpecs": [{"botName": "brand1"}, {"botName": "brand2"}]},
+        )
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases([])):
+            self.assertEqual(update_resource(event, {}), "LexBotFleet")
+        mock_delete_bots.assert_called_once_with(["brand2"])
+
+    @patch("lambda_function.delete_bots")
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    def test_update_resource_single_bot_to_fleet(self, checkpoint_store, mock_delete_bots):
+        from lambda_function import update_resource, helper
+        event = dict(
+            EVENT,
+            PhysicalResourceId="testbotid",
+            ResourceProperties={"botSpecs": [{"botName": "testbot"}, {"botName": "brand2"}]},
+            OldResourceProperties={"botName": "testbot"},
+        )
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases([])):
+            # the physical id is kept, CloudFormation does not delete the single bot the fleet reuses
+            self.assertEqual(update_resource(event, {}), "testbotid")
+        mock_delete_bots.assert_not_called()
+        self.assertEqual(helper.Data["testbot.BotId"], "testbotid")
+        event["ResourceProperties"] = {"botSpecs": [{"botName": "brand2"}]}
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases([])):
+            self.assertEqual(update_resource(event, {}), "testbotid")
+        mock_delete_bots.assert_called_once_with(["testbot"])
+
+    @patch("lambda_function.delete_bots")
+    @patch("lambda_function.checkpoint_store", new_callable=local_checkpoint_store)
+    def test_update_resource_fleet_to_single_bot(self, checkpoint_store, mock_delete_bots):
+        from lambda_function import update_resource, helper
+        event = dict(
+            EVENT,
+            PhysicalResourceId="LexBotFleet",
+            ResourceProperties={"botName": "testbot"},
+            OldResourceProperties={"botSpecs": [{"botName": "testbot"}, {"botName": "brand2"}]},
+        )
+        with patch("lambda_function.provisioning_phases", side_effect=fleet_phases([])):
+            # the physical id is kept, CloudFormation does not delete the fleet bot the single bot reuses
+            self.assertEqual(update_resource(event, {}), "LexBotFleet")
+        mock_delete_bots.assert_called_once_with(["brand2"])
+        self.assertEqual(helper.Data["BotId"], "testbotid")
+
+    @patch("lambda_function.get_bot_id", side_effect=lambda name: f"{name}id" if name != "brand2" else None)
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_delete_resource_fleet(self, mock_client, mock_get_bot_id):
+        from lambda_function import delete_resource
+        delete_resource({"ResourceProperties": {"botSpecs": [{"botName": "brand1"}, {"botName": "brand2"}]}}, {})
+        mock_client.assert_called_once_with("DeleteBot", {"botId": "brand1id", "skipResourceInUseCheck": True})
@@ -14,6 +14,7 @@ import os
 from unittest import TestCase, mock
 from mock import patch
 import botocore
+from shared.testing import distinct_ids
 
 mock_env_variables = {
     "botLanguage": "English",
@@ -23,11 +24,12 @@ mock_env_variables = {
 
 @patch.dict(os.environ, mock_env_variables)
 class WeatherIntentTest(TestCase):
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_intent(self, mock_client):
-        from weather_forecast.intent import create_intent
-        create_intent(bot_language="English", locale_id="en_US", bot_id="testid1234")
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from weather_forecast.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateIntent",
             {
                 "intentName": "WeatherForecast",
@@ -37,23 +39,17 @@ class WeatherIntentTest(TestCase):
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_create_city_slot(self, mock_client):
-        from weather_forecast.intent import create_city_slot
-        create_city_slot(
-            slot_type_id="testid1234",
-            message_id="city",
-            bot_language="English",
-            bot_id="testid1234",
-            locale_id="en_US",
-            intent_id="testid1234",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from weather_forecast.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "CreateSlot",
             {
                 "slotName": "City",
                 "description": "City information.",
-                "slotTypeId": "testid1234",
+                "slotTypeId": "AMAZON.City",
                 "valueElicitationSetting": {
                     "slotConstraint": "Required",
                     "promptSpecification": {
@@ -66,24 +62,19 @@ class WeatherIntentTest(TestCase):
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
                 "localeId": "en_US",
-                "intentId": "testid1234",
+                "intentId": "WeatherForecastId",
             },
         )
 
-    @patch("botocore.client.BaseClient._make_api_call")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
     def test_update_weather_intent(self, mock_client):
-        from weather_forecast.intent import update_weather_intent
-        update_weather_intent(
-            bot_language="English",
-            intent_id="testid1234",
-            city_slot_id="testid1234",
-            bot_id="testid1234",
-            locale_id="en_US",
-        )
-        mock_client.assert_called_with(
+        from shared.testing import provision
+        from weather_forecast.intent import populate
+        provision(populate)
+        mock_client.assert_any_call(
             "UpdateIntent",
             {
-                "intentId": "testid1234",
+                "intentId": "WeatherForecastId",
                 "intentName": "WeatherForecast",
                 "description": "WeatherForecast intent created by serverless bot.",
                 "sampleUtterances": [
@@ -93,26 +84,17 @@ class WeatherIntentTest(TestCase):
                 ],
                 "dialogCodeHook": {"enabled": False},
                 "fulfillmentCodeHook": {"enabled": True},
-                "slotPriorities": [{"priority": 1, "slotId": "testid1234"}],
+                "slotPriorities": [{"priority": 1, "slotId": "CityId"}],
                 "botId": "testid1234",
                 "botVersion": "DRAFT",
                 "localeId": "en_US",
             },
         )
 
-    @patch.dict(os.environ, mock_env_variables)
-    @patch("weather_forecast.intent.update_weather_intent")
-    @patch("weather_forecast.intent.create_city_slot", return_value="testid1234")
-    @patch("weather_forecast.intent.create_intent", return_value="testid1234")
-    def test_create_weather_intent(
-        self,
-        mock_create_intent,
-        mock_create_city_slot,
-        mock_update_weather_intent,
-    ):
-        from weather_forecast.intent import create_weather_intent
-        create_weather_intent(bot_id="testid1234", locale_id="en_US")
-
-        mock_create_intent.assert_called_with("English", "testid1234", "en_US")
-        mock_create_city_slot.assert_called_with("AMAZON.City", "city", "English", "testid1234", "en_US", "testid1234")
-        mock_update_weather_intent.assert_called_with("English", "testid1234", "testid1234", "testid1234", "en_US")
+    @patch("botocore.client.BaseClient._make_api_call", side_effect=distinct_ids)
+    def test_create_weather_intent(self, mock_client):
+        from shared.testing import provision
+        from weather_forecast.intent import populate
+        provision(populate)
+        operations = [call.args[0] for call in mock_client.call_args_list]
+        self.assertEqual(operations, ["CreateIntent", "CreateSlot", "UpdateIntent"])
@@ -20,17 +20,20 @@ import boto3
 from botocore.config import Config
 from io import BytesIO
 from zipfile import ZipFile
-from crhelper import CfnResource
 from urllib.request import urlopen
+from resumable import ResumableResource, get_continuation_token
 
 
 logger = logging.getLogger(__name__)
-helper = CfnResource(json_logging=True, log_level="INFO")
+helper = ResumableResource(json_logging=True, log_level="INFO")
 
 CLIENT_CONFIG = Config(retries = {"mode": "standard"}, **json.loads(os.environ["AWS_SDK_USER_AGENT"]))
 
 s3_client = boto3.client("s3", config=CLIENT_CONFIG)
 
+# a file is only uploaded when at least this many seconds are left in the invocation
+UPLOAD_MIN_SECONDS = 5
+
 
 
 
@@ -95,28 +98,39 @@ def replace_config_anchors(content, resource_properties):
 
 @helper.create
 def create_resource(event, _):
+    """
+    Upload the files of the web client package to the bucket, in the order of the package. An invocation running
+    out of time hands the upload over to a new one, with the index of the next file as continuation token.
+    """
     resource_properties = event["ResourceProperties"]
+    start = (get_continuation_token(event) or {}).get("upload", 0)
     logger.info("Process Webclient Sample Package")
     logger.info(resource_properties)
     webclient_pack = urlopen(resource_properties["SampleWebclientPackage"])
     zipfile = ZipFile(BytesIO(webclient_pack.read()))
 
-    for file_name in zipfile.namelist():
-        content = zipfile.open(file_name).read()
+    file_names = zipfile.namelist()
+    for index in range(start, len(file_names)):
+        helper.continue_if_out_of_time({"upload": index}, UPLOAD_MIN_SECONDS)
+        upload_file(zipfile, file_names[index], resource_properties)
+
 
-        if file_name.split(".")[-1] in ["js", "json", "html"]:
-            content = replace_config_anchors(content.decode("utf-8"), resource_properties)
+def upload_file(zipfile, file_name, resource_properties):
+    content = zipfile.open(file_name).read()
 
-        conten_type = mimetypes.guess_type(file_name)[0]
-        if conten_type != None:
-            s3_client.put_object(
-                Body=content,
-                Bucket=resource_properties["SampleWebClientBucket"],
-                Key=file_name,
-                ContentType=conten_type,
-            )
-        else:
-            s3_client.put_object(Body=content, Bucket=resource_properties["SampleWebClientBucket"], Key=file_name)
+    if file_name.split(".")[-1] in ["js", "json", "html"]:
+        content = replace_config_anchors(content.decode("utf-8"), resource_properties)
+
+    conten_type = mimetypes.guess_type(file_name)[0]
+    if conten_type != None:
+        s3_client.put_object(
+            Body=content,
+            Bucket=resource_properties["SampleWebClientBucket"],
+            Key=file_name,
+            ContentType=conten_type,
+        )
+    else:
+        s3_client.put_object(Body=content, Bucket=resource_properties["SampleWebClientBucket"], Key=file_name)
 
 
 def delete_resource(event, _):
@@ -131,7 +145,9 @@ def delete_resource(event, _):
 
 @helper.update
 def update_resource(event, _):
-    delete_resource(event, _)
+    # the bucket was already emptied if the upload is being resumed
+    if get_continuation_token(event) is None:
+        delete_resource(event, _)
     create_resource(event, _)
 
 @helper.delete
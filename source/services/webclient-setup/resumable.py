@@ -0,0 +1 @@
+../lex-bot/shared/resumable.py
\ No newline at end of file
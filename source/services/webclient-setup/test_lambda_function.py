@@ -11,6 +11,8 @@
 #  and limitations under the License.                                                                                #
 ######################################################################################################################
 import os
+from io import BytesIO
+from zipfile import ZipFile
 from datetime import datetime
 from unittest import TestCase, mock
 from mock import patch
@@ -23,6 +25,25 @@ mock_env_variables = {
     "botLanguage": "English",
     "AWS_SDK_USER_AGENT": '{ "user_agent_extra": "AwsSolution/1234/1.6.0" }',
 }
+RESOURCE_PROPERTIES = {
+    "SampleWebclientPackage": "https://example.com/webclient.zip",
+    "SampleWebClientBucket": "testbucket",
+    "AwsRegion": "us-east-1",
+    "BotName": "testbot",
+    "ApiUri": "https://example.com/api",
+    "BotLanguage": "English",
+    "BotGender": "Female",
+}
+
+
+def webclient_package():
+    package = BytesIO()
+    with ZipFile(package, "w") as zipfile:
+        zipfile.writestr("index.html", "<title>%%BOT_NAME%%</title>")
+        zipfile.writestr("app.js", "const region = '%%AWS_REGION%%';")
+        zipfile.writestr("logo.png", b"png")
+    package.seek(0)
+    return package
 
 
 @patch.dict(os.environ, mock_env_variables)
@@ -105,4 +126,35 @@ class LambdaTest(TestCase):
         mock_create.assert_not_called()
         mock_delete.assert_not_called()
 
+    @patch("lambda_function.urlopen")
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_create_resource_resumes_upload(self, mock_client, mock_urlopen):
+        from lambda_function import create_resource
+        mock_urlopen.return_value = webclient_package()
+        create_resource({"ResourceProperties": RESOURCE_PROPERTIES, "ContinuationToken": {"upload": 1}}, {})
+        self.assertEqual([call.args[1]["Key"] for call in mock_client.call_args_list], ["app.js", "logo.png"])
+        self.assertEqual(mock_client.call_args_list[0].args[1]["Body"], "const region = 'us-east-1';")
+
+    @patch("lambda_function.urlopen")
+    @patch("botocore.client.BaseClient._make_api_call")
+    def test_create_resource_out_of_time(self, mock_client, mock_urlopen):
+        import lambda_function
+        from resumable import ContinueInNewInvocation
+        mock_urlopen.return_value = webclient_package()
+        lambda_function.helper._context = mock.Mock(get_remaining_time_in_millis=lambda: 9000)
+        try:
+            with pytest.raises(ContinueInNewInvocation) as error:
+                lambda_function.create_resource({"ResourceProperties": RESOURCE_PROPERTIES}, {})
+        finally:
+            lambda_function.helper._context = None
+        self.assertEqual(error.value.token, {"upload": 0})
+        mock_client.assert_not_called()
 
+    @patch("lambda_function.delete_resource")
+    @patch("lambda_function.create_resource")
+    def test_update_resource_resumed(self, mock_create, mock_delete):
+        from lambda_function import update_resource
+        event = {"ContinuationToken": {"upload": 3}}
+        update_resource(event, {})
+        mock_delete.assert_not_called()
+        mock_create.assert_called_with(event, {})